@@ -94,27 +94,55 @@ def main():
         channels=channels,
         channel_mapping=channel_mapping,
         capture_channels=capture_channels,
+        dtype=audio_cfg.get("capture_dtype", "float32"),
+        lock_memory=audio_cfg.get("lock_memory", True),
     )
 
-    recorded_blocks = []
-    stream.start()
+    # Staging buffer for one (samples, channels) block; reused every
+    # iteration so steady-state memory is O(block_size), not O(duration).
+    stage = np.empty((block_size, channels), dtype=np.float32)
+    total_samples = 0
 
-    print("\n=== Recording Started ===")
-    if args.duration is None:
-        print("Press Ctrl+C to stop.")
-    else:
-        print(f"Recording for {args.duration} seconds...")
-    print(f"Saving to: {out_path}\n")
-
-    start_time = time.time()
+    # ---------------------------------------------------------------------
+    # 3) Stream blocks to WAV as they arrive
+    # ---------------------------------------------------------------------
+    # Open the output before capture starts: a bad path or full disk then
+    # fails with the stream released instead of left running
+    try:
+        sf_file = sf.SoundFile(
+            str(out_path),
+            "w",
+            samplerate=fs,
+            channels=channels,
+            subtype="FLOAT",
+        )
+    except Exception:
+        stream.close()
+        raise
 
     try:
+        stream.start()
+
+        print("\n=== Recording Started ===")
+        if args.duration is None:
+            print("Press Ctrl+C to stop.")
+        else:
+            print(f"Recording for {args.duration} seconds...")
+        print(f"Saving to: {out_path}\n")
+
+        start_time = time.time()
+
         while True:
             block = stream.read_block(timeout=1.0)
             if block is None:
                 continue
 
-            recorded_blocks.append(block)
+            n = block.shape[1]
+            if n > stage.shape[0]:
+                stage = np.empty((n, channels), dtype=np.float32)
+            np.copyto(stage[:n], block.T)  # blocks are float32 already
+            sf_file.write(stage[:n])
+            total_samples += n
 
             # Duration mode
             if args.duration is not None:
@@ -127,20 +155,14 @@ def main():
 
     finally:
         stream.close()
+        sf_file.close()
 
-    # ---------------------------------------------------------------------
-    # 3) Save to WAV
-    # ---------------------------------------------------------------------
-    if len(recorded_blocks) == 0:
+    if total_samples == 0:
         print("No audio captured!")
+        out_path.unlink(missing_ok=True)
         return
 
-    # Concatenate into one big array
-    audio = np.concatenate(recorded_blocks, axis=1)   # (channels, samples)
-    audio = audio.T.astype("float32")                # → (samples, channels)
-
-    sf.write(str(out_path), audio, fs)
-    print(f"\nSaved: {audio.shape[0]} samples, {audio.shape[1]} channels")
+    print(f"\nSaved: {total_samples} samples, {channels} channels")
     print(f"Output file: {out_path}")
     print("Done.")
 
@@ -23,19 +23,27 @@ from pathlib import Path
 import sys
 
 import numpy as np
-import yaml
 
-from src.my_doa.utils.config_loader import load_pipeline_config
+from src.my_doa.utils.config_loader import load_pipeline_config, load_yaml
 from src.my_doa.pipeline.doa_pipeline import DOAPipeline
 from src.my_doa.audio.audio_io import AudioStream, list_input_devices
 from src.my_doa.utils.math_utils import wrap_angle_deg_0_360
 from src.my_doa.utils.doa_logger import DOALogger
-from src.my_doa.dsp.filters import design_highpass, design_bandpass, apply_filter
+from src.my_doa.dsp.filters import design_highpass, design_bandpass, make_block_filter
 from src.my_doa.utils.timing import FpsMeter
 from src.my_doa.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Precompiled console formatters (hot per-frame print path)
+_FRAME_FMT = "[Frame {:6d}]".format
+_TRACK_FMT = "  ID {:02d}: θ={:7.2f}°".format
+
+# Console refresh rates
+CONSOLE_HZ = 10.0
+FPS_PRINT_INTERVAL_SEC = 1.0
+FPS_SAMPLE_FRAMES = 32  # read the clock once per this many frames
+
 
 # ---------------------------------------------------------------------
 # Load optional filtering configuration
@@ -48,8 +56,7 @@ def _load_filters(path: str | Path = "config/filters.yaml"):
         return None
 
     try:
-        with open(path, "r") as f:
-            cfg = yaml.safe_load(f)
+        cfg = load_yaml(path)
     except Exception as e:
         logger.warning("Failed to load filters.yaml", extra={"error": str(e)})
         return None
@@ -128,6 +135,9 @@ def main():
             channels=channels,
             channel_mapping=channel_mapping,
             capture_channels=capture_channels,
+            dtype=audio_cfg.get("capture_dtype", "float32"),
+            lock_memory=audio_cfg.get("lock_memory", True),
+            max_backlog=audio_cfg.get("max_backlog_blocks"),
         )
     except Exception as e:
         print(f"\nERROR: Failed to open audio device '{device}'.\n")
@@ -138,7 +148,15 @@ def main():
     # 4) DOA logger
     log_path = Path("data/logs") / f"doa_log_{int(time.time())}.jsonl"
     doa_logger = DOALogger(log_path)
-    fps_meter = FpsMeter()
+    fps_meter = FpsMeter(sample_every=FPS_SAMPLE_FRAMES)
+    # Pre-filter bound once: carries its own state and output buffer
+    filter_block = make_block_filter(sos, channels, block_size)
+
+    # Only render the console line every `print_every` STFT frames
+    frames_per_sec = fs / pipe_cfg.stft.hop_size
+    print_every = max(1, int(frames_per_sec // CONSOLE_HZ))
+    last_fps_print = time.monotonic()
+    write = sys.stdout.write
 
     stream.start()
     print("\n>>> Press Ctrl+C to stop.\n")
@@ -151,8 +169,7 @@ def main():
                 continue
 
             # Optional filtering
-            if sos is not None:
-                block = apply_filter(sos, block, mode="zero_phase")
+            block = filter_block(block)
 
             results = pipeline.process_block(block)
 
@@ -168,20 +185,27 @@ def main():
                     timestamp_sec=time.time(),
                 )
 
-                # Console visualization
-                if tracks:
-                    tracks_sorted = sorted(tracks, key=lambda t: t.id)
-                    # Convert to 0-360 range for display (mics are at 45°, 135°, 225°, 315°)
-                    angles = "  ".join(f"ID {t.id:02d}: θ={wrap_angle_deg_0_360(t.theta_deg):7.2f}°"
-                                       for t in tracks_sorted)
-                    print(f"[Frame {frame_idx:6d}]  {angles}")
-                else:
-                    print(f"[Frame {frame_idx:6d}]  no tracks")
-
-                # FPS meter
-                fps = fps_meter.tick()
-                if fps > 0:
-                    print(f"  Pipeline FPS: {fps:5.1f}", end="\r")
+                # Console visualization (throttled)
+                if frame_idx % print_every == 0:
+                    if tracks:
+                        # Tracks arrive sorted by id from the tracker
+                        # Convert to 0-360 range for display (mics are at 45°, 135°, 225°, 315°)
+                        thetas = np.fromiter((t.theta_deg for t in tracks),
+                                             dtype=np.float64, count=len(tracks))
+                        thetas = wrap_angle_deg_0_360(thetas).tolist()
+                        angles = "".join(_TRACK_FMT(t.id, th)
+                                         for t, th in zip(tracks, thetas))
+                        write(_FRAME_FMT(frame_idx) + angles + "\n")
+                    else:
+                        write(_FRAME_FMT(frame_idx) + "  no tracks\n")
+
+            # FPS meter: one tick per block, clock sampled every N frames
+            if results:
+                fps = fps_meter.tick(len(results))
+                now = time.monotonic()
+                if fps > 0 and now - last_fps_print >= FPS_PRINT_INTERVAL_SEC:
+                    write(f"  Pipeline FPS: {fps:5.1f}\r")
+                    last_fps_print = now
 
     except KeyboardInterrupt:
         print("\nStopping...")
@@ -192,6 +216,10 @@ def main():
 
     finally:
         stream.close()
+        if stream.overruns:
+            print(f"\nCapture ring overruns (blocks dropped): {stream.overruns}")
+        if stream.dropped:
+            print(f"Backlog drops (oldest blocks skipped): {stream.dropped}")
         doa_logger.close()
         print(f"\nLog saved to: {log_path}")
 
@@ -22,19 +22,25 @@ from pathlib import Path
 import time
 
 import numpy as np
-import yaml
 
-from src.my_doa.utils.config_loader import load_pipeline_config
+from src.my_doa.utils.config_loader import load_pipeline_config, load_yaml
 from src.my_doa.pipeline.doa_pipeline import DOAPipeline
 from src.my_doa.audio.wav_reader import load_multichannel_wav, block_generator
 from src.my_doa.utils.timing import FpsMeter
 from src.my_doa.utils.logger import get_logger
-from src.my_doa.dsp.filters import design_highpass, design_bandpass, apply_filter
+from src.my_doa.dsp.filters import design_highpass, design_bandpass, make_block_filter
 from src.my_doa.utils.math_utils import wrap_angle_deg_0_360
 
 
 logger = get_logger(__name__)
 
+# Precompiled console formatters (hot per-frame print path)
+_FRAME_FMT = "[Frame {:5d}]".format
+_TRACK_FMT = "  ID {:2d}: θ={:7.2f}°".format
+
+FPS_PRINT_INTERVAL_SEC = 1.0
+FPS_SAMPLE_FRAMES = 32  # read the clock once per this many frames
+
 
 # ---------------------------------------------------------------------
 # Load optional filtering configuration
@@ -47,8 +53,7 @@ def _load_filters(path: str | Path = "config/filters.yaml"):
         return None
 
     try:
-        with open(path, "r") as f:
-            cfg = yaml.safe_load(f)
+        cfg = load_yaml(path)
     except Exception as e:
         logger.warning("Failed to load filters.yaml", extra={"error": str(e)})
         return None
@@ -146,13 +151,17 @@ def main():
     print(f"Block size: {block_size}")
     print("\n--- Running offline DOA ---\n")
 
-    fps_meter = FpsMeter()
+    fps_meter = FpsMeter(sample_every=FPS_SAMPLE_FRAMES)
     total_frames = 0
+    # Pre-filter bound once: carries its own state and output buffer;
+    # block_generator already yields views
+    filter_block = make_block_filter(sos, audio.shape[0], block_size)
+    last_fps_print = time.monotonic()
+    write = sys.stdout.write
 
     for block in block_generator(audio, block_size):
         # Optional pre-filter
-        if sos is not None:
-            block = apply_filter(sos, block, mode="zero_phase")
+        block = filter_block(block)
 
         results = pipeline.process_block(block)
 
@@ -161,21 +170,25 @@ def main():
             tracks = res["tracks"]
 
             if not tracks:
-                print(f"[Frame {frame_idx:5d}] No tracks")
+                write(_FRAME_FMT(frame_idx) + " No tracks\n")
             else:
-                tracks_sorted = sorted(tracks, key=lambda t: t.id)
-                line = f"[Frame {frame_idx:5d}]"
+                # Tracks arrive sorted by id from the tracker
                 # Convert to 0-360 range for display (mics are at 45°, 135°, 225°, 315°)
-                for tr in tracks_sorted:
-                    theta_0_360 = wrap_angle_deg_0_360(tr.theta_deg)
-                    line += f"  ID {tr.id:2d}: θ={theta_0_360:7.2f}°"
-                print(line)
-
-            fps = fps_meter.tick()
-            if fps > 0:
-                print(f"  Pipeline FPS: {fps:5.1f}", end="\r")
-
-            total_frames += 1
+                thetas = np.fromiter((tr.theta_deg for tr in tracks),
+                                     dtype=np.float64, count=len(tracks))
+                thetas = wrap_angle_deg_0_360(thetas).tolist()
+                write(_FRAME_FMT(frame_idx)
+                      + "".join(_TRACK_FMT(tr.id, th) for tr, th in zip(tracks, thetas))
+                      + "\n")
+
+        # FPS meter: one tick per block, clock sampled every N frames
+        if results:
+            total_frames += len(results)
+            fps = fps_meter.tick(len(results))
+            now = time.monotonic()
+            if fps > 0 and now - last_fps_print >= FPS_PRINT_INTERVAL_SEC:
+                write(f"  Pipeline FPS: {fps:5.1f}\r")
+                last_fps_print = now
 
     print(f"\n\nFinished. Total STFT frames processed: {total_frames}")
 
@@ -25,28 +25,132 @@ import argparse
 import sys
 import time
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, Optional
 
 import numpy as np
 import yaml
 
-from src.my_doa.utils.config_loader import load_pipeline_config
+from src.my_doa.utils.config_loader import load_pipeline_config, load_yaml
 from src.my_doa.pipeline.doa_pipeline import DOAPipeline
 from src.my_doa.audio.audio_io import AudioStream, list_input_devices
 from src.my_doa.utils.doa_logger import DOALogger
-from src.my_doa.dsp.filters import design_highpass, design_bandpass, apply_filter
+from src.my_doa.dsp.filters import (
+    design_highpass,
+    design_bandpass,
+    apply_filter,
+    make_block_filter,
+)
 from src.my_doa.utils.timing import FpsMeter, Stopwatch
 from src.my_doa.utils.logger import get_logger
 from src.my_doa.utils.math_utils import wrap_angle_deg_0_360
+from src.my_doa.doa.tracker import compute_confidences
 
 logger = get_logger(__name__)
 
+# libyaml-backed dumper when available (summary values are plain Python types)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# STFT frames staged per DOALogger hand-off to its writer thread
+LOG_BATCH_FRAMES = 32
+# Log file buffers: large writes, flushed at most once per interval (and on close)
+LOG_BUFFER_BYTES = 1 << 20
+LOG_FLUSH_INTERVAL_SEC = 1.0
+
+# Verbose console output: precompiled formatters, written in batches
+_VERBOSE_FRAME_FMT = "[{:6d}] {}\n".format
+_VERBOSE_TRACK_FMT = "ID{}:θ={:6.1f}°(conf={:.2f})".format
+VERBOSE_FLUSH_LINES = 16
+
+STATUS_INTERVAL_SEC = 5.0
+FPS_SAMPLE_FRAMES = 32  # read the clock once per this many frames
+NS_TO_MS = 1e-6  # processing times are integer nanoseconds (perf_counter_ns)
+
 
 # ============================================================================
 # Diagnostic Statistics Collector
 # ============================================================================
 
+# Track ids are mapped into a fixed slot table (id % TRACK_SLOTS). Ids grow
+# monotonically, so a long-lived track can share a slot with a much newer
+# one; DiagnosticStats detects that and switches to a per-id dict.
+TRACK_SLOTS = 256
+
+
+class _GrowableF64:
+    """
+    Append-only float64 array with geometric (2x) growth.
+
+    Keeps running sum/min/max so summary statistics are O(1).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.buf = np.empty(capacity, dtype=np.float64)
+        self.n = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def append(self, x: float) -> None:
+        if self.n == self.buf.shape[0]:
+            self.buf = np.resize(self.buf, 2 * self.n)
+        x = float(x)
+        self.buf[self.n] = x
+        self.n += 1
+        self.sum += x
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def mean(self) -> float:
+        return self.sum / self.n if self.n else 0.0
+
+    def values(self) -> np.ndarray:
+        """View of the appended values (no copy)."""
+        return self.buf[: self.n]
+
+    def __len__(self) -> int:
+        return self.n
+
+
+class _RunningStats:
+    """
+    O(1) running min/max/mean/stddev (Welford), no per-sample storage.
+
+    Used for processing times, which are summarized per status window
+    and for the whole run instead of being kept frame by frame.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def append(self, x: float) -> None:
+        self.n += 1
+        delta = x - self._mean
+        self._mean += delta / self.n
+        self._m2 += delta * (x - self._mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def mean(self) -> float:
+        return self._mean if self.n else 0.0
+
+    def std(self) -> float:
+        return (self._m2 / (self.n - 1)) ** 0.5 if self.n > 1 else 0.0
+
+    def __len__(self) -> int:
+        return self.n
+
+
 class DiagnosticStats:
     """Collects diagnostic statistics during test run."""
     
@@ -57,23 +161,25 @@ class DiagnosticStats:
         self.frame_count = 0
         self.total_tracks_created = 0
         self.total_tracks_removed = 0
-        self.track_ages: List[int] = []
-        self.track_confidences: List[float] = []
-        self.doa_errors: List[float] = []  # If ground truth available
+        self.track_ages = _GrowableF64()
+        self.track_confidences = _GrowableF64()
+        self.doa_errors = _GrowableF64()  # If ground truth available
         self.frames_with_detections = 0
         self.frames_with_tracks = 0
         self.frames_silent = 0
         self.max_tracks_simultaneous = 0
-        self.srp_power_stats: List[float] = []
-        self.processing_times: List[float] = []
-        self.track_lifetimes: Dict[int, int] = {}  # track_id -> lifetime
-        self.active_track_ids: set = set()
-        self.track_creation_times: Dict[int, float] = {}
+        self.srp_power_stats = _GrowableF64()
+        self.processing_times = _RunningStats()
+        self._lifetime = np.zeros(TRACK_SLOTS, dtype=np.int32)
+        self._active = np.zeros(TRACK_SLOTS, dtype=bool)
+        self._seen = np.zeros(TRACK_SLOTS, dtype=bool)
+        self._owner = np.full(TRACK_SLOTS, -1, dtype=np.int64)  # track id per slot
+        self._lifetime_by_id: Optional[Dict[int, int]] = None  # set after a collision
         
-    def update_frame(self, result: Dict, processing_time: float):
+    def update_frame(self, result: Dict, processing_time_ns: int):
         """Update statistics from a frame result."""
         self.frame_count += 1
-        self.processing_times.append(processing_time)
+        self.processing_times.append(processing_time_ns)
         
         candidates = result.get("doa_candidates", [])
         tracks = result.get("tracks", [])
@@ -91,40 +197,68 @@ class DiagnosticStats:
             self.max_tracks_simultaneous = max(self.max_tracks_simultaneous, len(tracks))
         
         # Track details
-        current_track_ids = set()
-        for track in tracks:
-            track_id = track.id
-            current_track_ids.add(track_id)
-            
-            # Track lifetime tracking
-            if track_id not in self.active_track_ids:
-                # New track
-                self.total_tracks_created += 1
-                self.track_creation_times[track_id] = time.time()
-                self.track_lifetimes[track_id] = 0
-            else:
-                # Existing track
-                self.track_lifetimes[track_id] += 1
+        track_ids = []
+        for track, conf in zip(tracks, compute_confidences(tracks)):
+            track_ids.append(track.id)
             
             # Collect statistics
             self.track_ages.append(track.age)
-            conf = track.compute_confidence()
             self.track_confidences.append(conf)
         
-        # Tracks that disappeared
-        for track_id in self.active_track_ids - current_track_ids:
-            if track_id in self.track_lifetimes:
-                lifetime = self.track_lifetimes[track_id]
-                if lifetime > 0:
-                    self.total_tracks_removed += 1
-        
-        self.active_track_ids = current_track_ids
+        self._update_lifetimes(track_ids)
         
         # SRP power statistics
         if P_theta is not None:
-            max_power = float(np.max(P_theta))
-            mean_power = float(np.mean(P_theta))
-            self.srp_power_stats.append(max_power)
+            self.srp_power_stats.append(np.max(P_theta))
+    
+    def _update_lifetimes(self, track_ids: list) -> None:
+        """
+        Track lifetimes: new tracks start at 0, existing ones age, and
+        tracks that disappear after living at least one frame count as
+        removed.
+
+        Uses the slot table until two live ids map to the same slot, then
+        converts the active tracks to a per-id dict for the rest of the run.
+        """
+        if self._lifetime_by_id is None:
+            seen = self._seen
+            seen[:] = False
+            owner = self._owner
+            for track_id in track_ids:
+                slot = track_id % TRACK_SLOTS
+                if seen[slot] or (self._active[slot] and owner[slot] != track_id):
+                    # Slot collision: continue exactly, keyed by id
+                    self._lifetime_by_id = {
+                        int(owner[s]): int(self._lifetime[s])
+                        for s in np.flatnonzero(self._active)
+                    }
+                    break
+                seen[slot] = True
+                owner[slot] = track_id
+            else:
+                new = seen & ~self._active
+                self.total_tracks_created += int(np.count_nonzero(new))
+                self._lifetime += seen
+                self._lifetime[new] = 0
+                
+                # Tracks that disappeared
+                gone = self._active & ~seen
+                self.total_tracks_removed += int(np.count_nonzero(self._lifetime[gone] > 0))
+                
+                # Swap buffers: this frame's seen set becomes the active set
+                self._active, self._seen = seen, self._active
+                return
+        
+        lifetimes = self._lifetime_by_id
+        for track_id in track_ids:
+            if track_id in lifetimes:
+                lifetimes[track_id] += 1
+            else:
+                self.total_tracks_created += 1
+                lifetimes[track_id] = 0
+        for track_id in lifetimes.keys() - set(track_ids):
+            if lifetimes.pop(track_id) > 0:
+                self.total_tracks_removed += 1
     
     def get_summary(self) -> Dict:
         """Get summary statistics."""
@@ -141,15 +275,16 @@ class DiagnosticStats:
             "total_tracks_created": self.total_tracks_created,
             "total_tracks_removed": self.total_tracks_removed,
             "max_tracks_simultaneous": self.max_tracks_simultaneous,
-            "avg_track_age": np.mean(self.track_ages) if self.track_ages else 0.0,
-            "max_track_age": max(self.track_ages) if self.track_ages else 0,
-            "avg_confidence": np.mean(self.track_confidences) if self.track_confidences else 0.0,
-            "min_confidence": min(self.track_confidences) if self.track_confidences else 0.0,
-            "max_confidence": max(self.track_confidences) if self.track_confidences else 0.0,
-            "avg_srp_power": np.mean(self.srp_power_stats) if self.srp_power_stats else 0.0,
-            "max_srp_power": max(self.srp_power_stats) if self.srp_power_stats else 0.0,
-            "avg_processing_time_ms": np.mean(self.processing_times) * 1000 if self.processing_times else 0.0,
-            "max_processing_time_ms": max(self.processing_times) * 1000 if self.processing_times else 0.0,
+            "avg_track_age": self.track_ages.mean(),
+            "max_track_age": int(self.track_ages.max) if self.track_ages else 0,
+            "avg_confidence": self.track_confidences.mean(),
+            "min_confidence": self.track_confidences.min if self.track_confidences else 0.0,
+            "max_confidence": self.track_confidences.max if self.track_confidences else 0.0,
+            "avg_srp_power": self.srp_power_stats.mean(),
+            "max_srp_power": self.srp_power_stats.max if self.srp_power_stats else 0.0,
+            "avg_processing_time_ms": self.processing_times.mean() * NS_TO_MS,
+            "max_processing_time_ms": self.processing_times.max * NS_TO_MS if self.processing_times else 0.0,
+            "std_processing_time_ms": self.processing_times.std() * NS_TO_MS,
         }
 
 
@@ -157,10 +292,26 @@ class DiagnosticStats:
 # Diagnostic Logger
 # ============================================================================
 
+def _display_thetas(tracks) -> list:
+    """
+    Wrap all track angles to [0, 360) in one vectorized call.
+    
+    The tracker uses -180 to 180 internally; display uses 0-360.
+    """
+    thetas = np.fromiter((t.theta_deg for t in tracks), dtype=np.float64, count=len(tracks))
+    return wrap_angle_deg_0_360(thetas).tolist()
+
+
 class DiagnosticLogger:
     """Logs diagnostic information in a structured format."""
     
-    def __init__(self, output_dir: Path):
+    def __init__(
+        self,
+        output_dir: Path,
+        buffering: int = LOG_BUFFER_BYTES,
+        flush_interval_sec: float = LOG_FLUSH_INTERVAL_SEC,
+        raw_log: bool = False,
+    ):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -170,15 +321,24 @@ class DiagnosticLogger:
         self.frame_log = self.output_dir / f"frames_{timestamp}.txt"
         self.summary_log = self.output_dir / f"summary_{timestamp}.yaml"
         
-        self.f_frame = open(self.frame_log, "w")
-        self.f_diag = open(self.diagnostic_log, "w")
+        # Per-frame log only exists with raw logging (log_frame is not
+        # called otherwise)
+        self.f_frame = open(self.frame_log, "w", buffering=buffering) if raw_log else None
+        self.f_diag = open(self.diagnostic_log, "w", buffering=buffering)
+        self.flush_interval_sec = flush_interval_sec
+        self._next_diag_flush = 0.0
+        
+        # Frame lines are batched and written in bulk (see log_frame)
+        self._pending: list = []
+        self.flush_every = 256
         
         # Write headers
-        self.f_frame.write("# Frame-by-frame diagnostic log\n")
-        self.f_frame.write("# Format: frame_idx | n_candidates | n_tracks | track_details | srp_max | proc_time_ms\n")
-        self.f_frame.write("#\n")
+        if self.f_frame is not None:
+            self.f_frame.write("# Frame-by-frame diagnostic log\n")
+            self.f_frame.write("# Format: frame_idx | n_candidates | n_tracks | track_details | srp_max | proc_time_ms\n")
+            self.f_frame.write("#\n")
         
-    def log_frame(self, frame_idx: int, result: Dict, processing_time: float):
+    def log_frame(self, frame_idx: int, result: Dict, processing_time_ns: int):
         """Log detailed frame information."""
         candidates = result.get("doa_candidates", [])
         tracks = result.get("tracks", [])
@@ -186,9 +346,8 @@ class DiagnosticLogger:
         
         # Track details
         track_details = []
-        for track in sorted(tracks, key=lambda t: t.id):
-            # Convert to 0-360 range for display (tracker uses -180 to 180 internally)
-            theta_display = wrap_angle_deg_0_360(track.theta_deg)
+        # Tracks are already sorted by id
+        for track, theta_display in zip(tracks, _display_thetas(tracks)):
             track_details.append(
                 f"ID{track.id}:θ={theta_display:6.1f}° "
                 f"age={track.age:3d} hits={track.hits:3d} misses={track.misses:2d} "
@@ -196,7 +355,7 @@ class DiagnosticLogger:
             )
         
         srp_max = float(np.max(P_theta)) if P_theta is not None else 0.0
-        proc_ms = processing_time * 1000
+        proc_ms = processing_time_ns * NS_TO_MS
         
         line = (
             f"{frame_idx:6d} | "
@@ -207,14 +366,24 @@ class DiagnosticLogger:
             f"proc={proc_ms:5.2f}ms"
         )
         
-        self.f_frame.write(line + "\n")
-        self.f_frame.flush()
+        self._pending.append(line + "\n")
+        if len(self._pending) >= self.flush_every:
+            self._flush_frames()
+    
+    def _flush_frames(self):
+        """Write batched frame lines to the frame log."""
+        if self._pending:
+            self.f_frame.writelines(self._pending)
+            self._pending.clear()
     
     def log_diagnostic(self, message: str):
         """Log diagnostic message."""
         timestamp = time.strftime("%H:%M:%S")
         self.f_diag.write(f"[{timestamp}] {message}\n")
-        self.f_diag.flush()
+        now = time.monotonic()
+        if now >= self._next_diag_flush:
+            self.f_diag.flush()
+            self._next_diag_flush = now + self.flush_interval_sec
         print(f"[DIAG] {message}")
     
     def log_summary(self, stats: DiagnosticStats, config_info: Dict):
@@ -224,7 +393,7 @@ class DiagnosticLogger:
         summary["test_timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")
         
         with open(self.summary_log, "w") as f:
-            yaml.dump(summary, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(summary, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
         
         # Also print summary
         self.f_diag.write("\n" + "="*80 + "\n")
@@ -245,7 +414,9 @@ class DiagnosticLogger:
     
     def close(self):
         """Close log files."""
-        self.f_frame.close()
+        if self.f_frame is not None:
+            self._flush_frames()
+            self.f_frame.close()
         self.f_diag.close()
         print(f"\nDiagnostic logs saved to: {self.output_dir}")
 
@@ -261,8 +432,7 @@ def load_filters(path: str | Path = "config/filters.yaml"):
         return None
     
     try:
-        with open(path, "r") as f:
-            cfg = yaml.safe_load(f)
+        cfg = load_yaml(path)
     except Exception as e:
         logger.warning("Failed to load filters.yaml", extra={"error": str(e)})
         return None
@@ -273,6 +443,19 @@ def load_filters(path: str | Path = "config/filters.yaml"):
     return cfg
 
 
+def _filter_is_trivial(filt_cfg: Dict, fs: float) -> bool:
+    """True if the configured pre-filter would pass the whole band."""
+    nyquist = 0.5 * fs
+    if filt_cfg["type"] == "highpass":
+        return float(filt_cfg["highpass_cutoff_hz"]) <= 0.0
+    if filt_cfg["type"] == "bandpass":
+        return (
+            float(filt_cfg["bandpass_low_hz"]) <= 0.0
+            and float(filt_cfg["bandpass_high_hz"]) >= nyquist
+        )
+    return False
+
+
 def get_config_info(pipe_cfg, audio_cfg) -> Dict:
     """Extract configuration information for logging."""
     return {
@@ -318,6 +501,18 @@ def main():
         action="store_true",
         help="Print detailed per-frame information",
     )
+    parser.add_argument(
+        "--zero-phase",
+        action="store_true",
+        help="Pre-filter each block forward-backward (old behaviour) instead "
+             "of the causal filter with state carried across blocks",
+    )
+    parser.add_argument(
+        "--raw-log",
+        action="store_true",
+        help="Also write the per-frame diagnostic log (frames_*.txt); "
+             "by default only windowed timing summaries are reported",
+    )
     
     args = parser.parse_args()
     
@@ -361,7 +556,9 @@ def main():
     if filt_cfg is not None:
         try:
             fs = pipe_cfg.sample_rate
-            if filt_cfg["type"] == "highpass":
+            if _filter_is_trivial(filt_cfg, fs):
+                print("Pre-filter skipped: configured band passes everything")
+            elif filt_cfg["type"] == "highpass":
                 sos = design_highpass(
                     cutoff_hz=filt_cfg["highpass_cutoff_hz"],
                     fs=fs,
@@ -374,7 +571,9 @@ def main():
                     fs=fs,
                     order=filt_cfg.get("order", 4),
                 )
-            print(f"Pre-filter enabled: {filt_cfg['type']}")
+            if sos is not None:
+                mode = "zero-phase" if args.zero_phase else "causal, stateful"
+                print(f"Pre-filter enabled: {filt_cfg['type']} ({mode})")
         except Exception as e:
             print(f"WARNING: Failed to setup pre-filter: {e}")
             sos = None
@@ -397,6 +596,7 @@ def main():
             channels=channels,
             channel_mapping=channel_mapping,
             capture_channels=capture_channels,
+            max_backlog=audio_cfg.get("max_backlog_blocks"),
         )
         print(f"Audio device opened: {device}")
     except Exception as e:
@@ -405,12 +605,26 @@ def main():
         list_input_devices()
         sys.exit(1)
     
+    # Pre-filter per block: causal sosfilt with state carried across blocks
+    # (no per-block edge transients, half the work of forward-backward);
+    # --zero-phase restores the per-block filtfilt behaviour.
+    if args.zero_phase:
+        def filter_block(block):
+            return apply_filter(sos, block, mode="zero_phase")
+    else:
+        filter_block = make_block_filter(sos, channels, block_size)
+    
     # ------------------------------------------------------------------------
     # 5. Initialize Diagnostic Logging
     # ------------------------------------------------------------------------
-    diag_logger = DiagnosticLogger(args.output_dir)
+    diag_logger = DiagnosticLogger(
+        args.output_dir,
+        buffering=LOG_BUFFER_BYTES,
+        flush_interval_sec=LOG_FLUSH_INTERVAL_SEC,
+        raw_log=args.raw_log,
+    )
     stats = DiagnosticStats()
-    fps_meter = FpsMeter()
+    fps_meter = FpsMeter(sample_every=FPS_SAMPLE_FRAMES)
     stopwatch = Stopwatch()
     
     diag_logger.log_diagnostic("Test started")
@@ -421,7 +635,13 @@ def main():
     # 6. Setup DOA Logger (optional, for JSONL output)
     # ------------------------------------------------------------------------
     doa_log_path = Path(args.output_dir) / f"doa_log_{int(time.time())}.jsonl"
-    doa_logger = DOALogger(doa_log_path)
+    # Stage frames and hand them to the writer thread in batches
+    doa_logger = DOALogger(
+        doa_log_path,
+        batch_frames=LOG_BATCH_FRAMES,
+        buffering=LOG_BUFFER_BYTES,
+        flush_interval_sec=LOG_FLUSH_INTERVAL_SEC,
+    )
     
     # ------------------------------------------------------------------------
     # 7. Run Test
@@ -443,9 +663,30 @@ def main():
         print("Frame-by-frame output:")
         print("-"*80)
     
+    write = sys.stdout.write
+    verbose_lines: list = []
+    # Track-line cache: rebuilt only when ids, displayed angles or misses
+    # change (confidence drifts slowly and is refreshed with them)
+    last_track_key = None
+    last_track_str = "no tracks"
+    
+    def flush_verbose():
+        if verbose_lines:
+            write("".join(verbose_lines))
+            verbose_lines.clear()
+            sys.stdout.flush()
+    
+    # Per-frame timing derived from the STFT frame index (no clock reads):
+    # frame k starts k * hop samples after stream start, plus the audio
+    # the stream skipped (backlog drops and ring overruns) before it.
+    frame_period = pipe_cfg.stft.hop_size / float(fs)
+    block_period = block_size / float(fs)
+    status_every = max(1, int(round(STATUS_INTERVAL_SEC / frame_period)))
+    # Processing-time summary for the current status window
+    window_times = _RunningStats()
+    
     try:
         frame_count = 0
-        last_status_time = time.time()
         
         while True:
             # Check duration limit
@@ -457,62 +698,89 @@ def main():
             block = stream.read_block(timeout=1.0)
             if block is None:
                 continue
+            skipped_sec = (stream.dropped + stream.overruns) * block_period
             
             # Apply pre-filter if enabled
             if sos is not None:
-                block = apply_filter(sos, block, mode="zero_phase")
+                block = filter_block(block)
             
             # Process block
-            frame_start = time.perf_counter()
+            frame_start_ns = time.perf_counter_ns()
             results = pipeline.process_block(block)
-            frame_end = time.perf_counter()
+            frame_end_ns = time.perf_counter_ns()
+            # Approximate per-frame time (integer ns; converted to ms only
+            # when printed or summarized)
+            processing_time_ns = frame_end_ns - frame_start_ns
+            
+            # One FPS tick per block (the status line reads fps_meter.fps)
+            if results:
+                fps_meter.tick(len(results))
             
             # Process each STFT frame
             for res in results:
                 frame_idx = res["frame_index"]
-                processing_time = frame_end - frame_start  # Approximate per-frame time
                 
                 # Update statistics
-                stats.update_frame(res, processing_time)
+                stats.update_frame(res, processing_time_ns)
+                window_times.append(processing_time_ns)
                 
-                # Log frame details
-                diag_logger.log_frame(frame_idx, res, processing_time)
+                # Per-frame details only on request (windowed stats below)
+                if args.raw_log:
+                    diag_logger.log_frame(frame_idx, res, processing_time_ns)
                 
                 # Log to DOA logger
                 doa_logger.log_frame(
                     frame_index=frame_idx,
                     tracks=res["tracks"],
-                    timestamp_sec=time.time(),
+                    timestamp_sec=start_time + frame_idx * frame_period + skipped_sec,
                 )
                 
-                # Verbose console output
+                # Verbose console output (tracks arrive sorted by id;
+                # angles and confidences computed in one batch each). The
+                # line is re-formatted only when a displayed value changes.
                 if args.verbose:
                     tracks = res["tracks"]
-                    if tracks:
-                        track_str = " | ".join(
-                            f"ID{t.id}:θ={wrap_angle_deg_0_360(t.theta_deg):6.1f}°(conf={t.compute_confidence():.2f})"
-                            for t in sorted(tracks, key=lambda t: t.id)
-                        )
-                        print(f"[{frame_idx:6d}] {track_str}")
-                    else:
-                        print(f"[{frame_idx:6d}] no tracks")
+                    confs = compute_confidences(tracks).tolist()
+                    track_key = tuple(
+                        (t.id, round(t.theta_deg, 1), round(c, 2))
+                        for t, c in zip(tracks, confs)
+                    )
+                    if track_key != last_track_key:
+                        last_track_key = track_key
+                        if tracks:
+                            last_track_str = " | ".join(map(
+                                _VERBOSE_TRACK_FMT,
+                                [t.id for t in tracks],
+                                _display_thetas(tracks),
+                                confs,
+                            ))
+                        else:
+                            last_track_str = "no tracks"
+                    verbose_lines.append(_VERBOSE_FRAME_FMT(frame_idx, last_track_str))
+                    if len(verbose_lines) >= VERBOSE_FLUSH_LINES:
+                        flush_verbose()
                 
                 frame_count += 1
                 
-                # Periodic status update
-                if time.time() - last_status_time >= 5.0:
-                    fps = fps_meter.tick()
+                # Periodic status update (~every STATUS_INTERVAL_SEC of audio)
+                if frame_count % status_every == 0:
+                    flush_verbose()
+                    fps = fps_meter.fps
                     elapsed = stopwatch.elapsed()
                     print(
                         f"[Status] Frames: {frame_count:6d} | "
                         f"FPS: {fps:5.1f} | "
                         f"Elapsed: {elapsed:6.1f}s | "
+                        f"Dropped: {stream.dropped:4d} | "
                         f"Active tracks: {len(res.get('tracks', []))}"
                     )
-                    last_status_time = time.time()
-                
-                # Update FPS meter
-                fps_meter.tick()
+                    print(
+                        f"         Proc: {window_times.mean() * NS_TO_MS:6.2f} ± "
+                        f"{window_times.std() * NS_TO_MS:5.2f} ms "
+                        f"({window_times.min * NS_TO_MS:.2f}..{window_times.max * NS_TO_MS:.2f}) "
+                        f"n={len(window_times)}"
+                    )
+                    window_times.reset()
     
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
@@ -526,6 +794,7 @@ def main():
     
     finally:
         # Cleanup
+        flush_verbose()
         stopwatch.stop()
         stream.close()
         doa_logger.close()
@@ -538,6 +807,9 @@ def main():
         diag_logger.log_diagnostic(f"Total frames: {frame_count}")
         diag_logger.log_diagnostic(f"Total time: {elapsed_time:.2f}s")
         diag_logger.log_diagnostic(f"Average FPS: {final_fps:.2f}")
+        diag_logger.log_diagnostic(
+            f"Dropped blocks: {stream.dropped} (backlog) / {stream.overruns} (ring overruns)"
+        )
         
         # Log summary
         diag_logger.log_summary(stats, config_info)
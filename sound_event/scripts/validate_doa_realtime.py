@@ -43,6 +43,7 @@ We:
 from __future__ import annotations
 
 import argparse
+import os
 import time
 from pathlib import Path
 from typing import Optional, Sequence
@@ -59,6 +60,7 @@ except Exception:
     _HAS_MPL = False
 
 from src.my_doa.utils.config_loader import load_pipeline_config
+from src.my_doa.audio.audio_io import AudioStream
 from src.my_doa.pipeline.doa_pipeline import DOAPipeline
 from src.my_doa.utils.doa_logger import DOALogger
 from src.my_doa.utils.timing import FpsMeter
@@ -78,6 +80,52 @@ RESPEAKER_CAPTURE_CHANNELS = 6
 # CH1–4 → mic0..3 for the pipeline
 RESPEAKER_MIC_INDICES = [1, 2, 3, 4]
 
+# STFT frames staged per DOALogger hand-off to its writer thread
+LOG_BATCH_FRAMES = 32
+
+# Live SRP plot refresh rate; decoupled from the audio/DOA frame rate
+PLOT_HZ = 20.0
+
+# Niceness requested for the pinned DOA process (needs CAP_SYS_NICE/root)
+RT_NICE = -10
+
+
+# ---------------------------------------------------------------------
+# CPU pinning
+# ---------------------------------------------------------------------
+
+
+def pin_to_cpu(core: int) -> None:
+    """
+    Bind this process to one CPU core and raise its priority (best effort).
+
+    Must run before the audio stream starts: PortAudio creates its
+    callback thread on start(), and new threads inherit the affinity
+    mask, so capture and DOA share the chosen core without migrations.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        print("WARNING: CPU affinity not supported on this platform; not pinning.")
+        return
+
+    try:
+        os.sched_setaffinity(0, {core})
+    except (OSError, ValueError) as e:
+        print(f"WARNING: could not pin to CPU {core}: {e}")
+        return
+
+    try:
+        os.nice(RT_NICE)
+        nice_msg = f"nice {RT_NICE}"
+    except PermissionError:
+        nice_msg = "default priority (no permission to renice)"
+
+    mask = sorted(os.sched_getaffinity(0))
+    logger.info(
+        "Pinned DOA process",
+        extra={"cpu_mask": mask, "nice": os.nice(0)},
+    )
+    print(f"Pinned to CPU(s) {mask}, {nice_msg}")
+
 
 # ---------------------------------------------------------------------
 # Device + config checks
@@ -166,15 +214,15 @@ def run_channel_mapping_check(
     print("\n=== Channel Mapping Check (ReSpeaker RAW mics only: CH1–CH4) ===")
     print("For each step, tap near the expected physical microphone.\n")
 
-    stream = sd.InputStream(
+    # Always capture 6 channels; the callback lays each block out as a
+    # contiguous (6, block_size) float32 ring slot
+    stream = AudioStream(
         device=device,
-        samplerate=fs,
-        blocksize=block_size,
-        channels=6,               # Always capture 6 channels
-        dtype="float32",
+        sample_rate=fs,
+        block_size=block_size,
+        channels=6,
     )
 
-    stream.start()
     try:
         for idx, ch in enumerate(mic_channels):
             input(
@@ -182,23 +230,31 @@ def run_channel_mapping_check(
                 "Press Enter when ready..."
             )
 
-            t_start = time.time()
-            rms_accum = np.zeros(6, dtype=np.float64)
-            n_blocks = 0
-
-            while time.time() - t_start < duration_per_step:
-                data, _ = stream.read(block_size)  # (frames, 6)
-                block = data.T  # (6, samples)
+            ssq = np.zeros(6, dtype=np.float64)  # running sum of squares
+            n_samples = 0
 
-                rms = np.sqrt(np.mean(block**2, axis=1))
-                rms_accum += rms
-                n_blocks += 1
-
-            if n_blocks == 0:
+            # Capture only while measuring, so nothing queued during the
+            # prompt leaks into this step
+            stream.start()
+            t_start = time.time()
+            try:
+                while time.time() - t_start < duration_per_step:
+                    block = stream.read_block(timeout=0.5)  # (6, samples)
+                    if block is None:
+                        continue
+
+                    # Fused square + reduce over contiguous channel rows
+                    ssq += np.einsum("ct,ct->c", block, block, dtype=np.float64)
+                    n_samples += block.shape[1]
+            finally:
+                stream.stop()
+                stream.get_latest_block()  # discard blocks left in the ring
+
+            if n_samples == 0:
                 print("  WARNING: no blocks captured.")
                 continue
 
-            avg_rms = rms_accum / n_blocks
+            avg_rms = np.sqrt(ssq / n_samples)
 
             print(f"  Average RMS per channel: {np.round(avg_rms, 6)}")
 
@@ -215,7 +271,6 @@ def run_channel_mapping_check(
             else:
                 print(f"  [OK] CH{ch} correctly mapped.")
     finally:
-        stream.stop()
         stream.close()
 
     print("\nChannel mapping check complete.\n")
@@ -234,10 +289,11 @@ def run_realtime_validation(
     log_dir: Path,
     capture_channels: int,
     mic_indices: Sequence[int],
+    cpu_affinity: Optional[int] = None,
 ) -> None:
     """
     Main real-time validation loop:
-    - Captures blocks from sounddevice
+    - Captures blocks via AudioStream (PortAudio callback -> SPSC ring)
     - Selects raw mic channels for DOA
     - Runs DOAPipeline
     - Logs tracks to JSONL
@@ -256,26 +312,49 @@ def run_realtime_validation(
             f"but mic_indices length is {n_mics_pipeline}."
         )
 
-    # Open raw capture stream from ReSpeaker
-    stream = sd.InputStream(
+    # Mic channel selection, resolved once: contiguous indices (the
+    # ReSpeaker CH1-CH4 case) become a zero-copy slice, anything else a
+    # gather into a reused buffer.
+    mic_idx = [int(i) for i in mic_indices]
+    if mic_idx == list(range(mic_idx[0], mic_idx[0] + len(mic_idx))):
+        mic_sel = slice(mic_idx[0], mic_idx[-1] + 1)
+        mic_buf = None
+    else:
+        mic_sel = np.asarray(mic_idx, dtype=np.intp)
+        mic_buf = np.empty((len(mic_idx), block_size), dtype=np.float32)
+
+    # Open raw capture stream from ReSpeaker: all capture channels land
+    # in AudioStream's preallocated ring from the PortAudio callback, so
+    # capture cadence is independent of how long DOA/logging/plot take.
+    stream = AudioStream(
         device=device,
-        samplerate=fs,
-        blocksize=block_size,
+        sample_rate=fs,
+        block_size=block_size,
         channels=capture_channels,
-        dtype="float32",
+        dtype=audio_cfg.get("capture_dtype", "float32"),
+        lock_memory=audio_cfg.get("lock_memory", True),
+        max_backlog=audio_cfg.get("max_backlog_blocks"),
     )
 
     # DOA logger
     log_dir.mkdir(parents=True, exist_ok=True)
     log_path = log_dir / f"doa_validation_{int(time.time())}.jsonl"
-    doa_logger = DOALogger(log_path)
+    # Stage frames and hand them to the writer thread in batches
+    doa_logger = DOALogger(log_path, batch_frames=LOG_BATCH_FRAMES)
 
     fps_meter = FpsMeter()
 
+    # Latest SRP map (size-1 slot): written by the DOA loop, consumed by
+    # the animation callback at PLOT_HZ
+    latest_P: Optional[np.ndarray] = None
+    plot_interval = 1.0 / PLOT_HZ
+    next_plot_t = 0.0
+
     # Optional SRP plot setup
     fig = None
     line = None
     az_rad = None
+    anim = None  # strong reference; an unreferenced FuncAnimation stops
 
     if plot_srp:
         if not _HAS_MPL:
@@ -296,71 +375,85 @@ def run_realtime_validation(
             ax.set_title("Live SRP-PHAT Energy", fontsize=14)
             ax.set_ylim(0, 1.0)
 
-    print("\n=== Real-time DOA Validation ===")
-    print("Press Ctrl+C to stop.\n")
-
-    stream.start()
-    start_time = time.time()
-
-    try:
-        if plot_srp and fig is not None:
-            # Light-weight animation; actual data update happens in audio loop
             def _update_plot(_frame):
+                nonlocal latest_P
+                P = latest_P
+                if P is not None:
+                    latest_P = None
+                    if np.any(P):
+                        line.set_ydata(P / (np.max(P) + 1e-9))
+                    else:
+                        line.set_ydata(P)
                 return (line,)
 
-            _ = animation.FuncAnimation(
+            anim = animation.FuncAnimation(
                 fig,
                 _update_plot,
-                interval=50,
+                interval=int(1000 / PLOT_HZ),
                 blit=True,
+                cache_frame_data=False,
             )
+            fig.canvas.draw_idle()
+            plt.show(block=False)
 
+    print("\n=== Real-time DOA Validation ===")
+    print("Press Ctrl+C to stop.\n")
+
+    if cpu_affinity is not None:
+        pin_to_cpu(cpu_affinity)
+
+    stream.start()
+    start_time = time.time()
+    # Frame timestamps from the STFT frame index: frame k starts k * hop
+    # samples after stream start, plus the audio the stream skipped
+    # (backlog drops and ring overruns) before it (no clock read per frame)
+    frame_period = pipeline.config.stft.hop_size / float(fs)
+    block_period = block_size / float(fs)
+
+    try:
         while True:
             if duration is not None and (time.time() - start_time) >= duration:
                 print("\nReached requested validation duration.")
                 break
 
-            data, _ = stream.read(block_size)  # shape (frames, capture_channels)
-            block_all = data.T  # (capture_channels, samples)
-
-            if block_all.shape[0] != capture_channels:
-                # should never happen, but be defensive
-                logger.warning(
-                    "Unexpected channel count from device",
-                    extra={
-                        "expected": capture_channels,
-                        "got": block_all.shape[0],
-                    },
-                )
+            # (capture_channels, samples) view into the ring, valid until
+            # the next read; None if no block arrived within the timeout
+            block_all = stream.read_block(timeout=1.0)
+            if block_all is None:
                 continue
+            skipped_sec = (stream.dropped + stream.overruns) * block_period
 
             # ---------------------------------------------------------
             # ReSpeaker mapping: select raw mic channels CH1–CH4
             # ---------------------------------------------------------
-            block_mics = block_all[mic_indices, :]  # (n_mics_pipeline, samples)
+            if mic_buf is None:
+                block_mics = block_all[mic_sel]  # view, no copy
+            else:
+                block_mics = np.take(block_all, mic_sel, axis=0, out=mic_buf)
 
             results = pipeline.process_block(block_mics)
 
             for res in results:
                 frame_idx = res["frame_index"]
                 P_theta = res["P_theta"]
-                candidates = res.get("doa_candidates", [])
+                cand_powers = res["candidate_powers"]
                 tracks = res.get("tracks", [])
 
                 # Log tracks
                 doa_logger.log_frame(
                     frame_index=frame_idx,
                     tracks=tracks,
-                    timestamp_sec=time.time(),
+                    timestamp_sec=start_time + frame_idx * frame_period + skipped_sec,
                 )
 
                 # Print compact summary line
                 line_txt = f"[Frame {frame_idx:6d}] "
 
-                if len(candidates) > 0:
-                    best = max(candidates, key=lambda c: c.power)
+                if cand_powers.size:
+                    best = int(cand_powers.argmax())
                     line_txt += (
-                        f"Top cand: θ={best.azimuth_deg:7.2f}°, P={best.power:6.3f}  "
+                        f"Top cand: θ={res['candidate_azimuths_deg'][best]:7.2f}°, "
+                        f"P={cand_powers[best]:6.3f}  "
                     )
                 else:
                     line_txt += "No DOA candidates  "
@@ -380,22 +473,25 @@ def run_realtime_validation(
 
                 print(line_txt)
 
-                # Update SRP plot if enabled
-                if plot_srp and line is not None and az_rad is not None:
-                    if np.any(P_theta):
-                        P_norm = P_theta / (np.max(P_theta) + 1e-9)
-                    else:
-                        P_norm = P_theta
-                    line.set_ydata(P_norm)
+                # Keep only the newest SRP map for the plot (size-1 slot)
+                latest_P = P_theta
 
-            if plot_srp and fig is not None:
-                plt.pause(0.001)
+            # Let the GUI run the animation timer at PLOT_HZ; the callback
+            # pulls latest_P and blits only the line
+            if anim is not None:
+                now = time.monotonic()
+                if now >= next_plot_t:
+                    next_plot_t = now + plot_interval
+                    fig.canvas.flush_events()
 
     except KeyboardInterrupt:
         print("\nStopping real-time validation (Ctrl+C).")
     finally:
-        stream.stop()
         stream.close()
+        if stream.overruns:
+            print(f"\nCapture ring overruns (blocks dropped): {stream.overruns}")
+        if stream.dropped:
+            print(f"Backlog drops (oldest blocks skipped): {stream.dropped}")
         doa_logger.close()
         if plot_srp and fig is not None:
             plt.close(fig)
@@ -440,6 +536,13 @@ def parse_args() -> argparse.Namespace:
         default="data/logs",
         help="Directory to store DOA JSONL logs.",
     )
+    p.add_argument(
+        "--cpu-affinity",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Pin capture + DOA to CPU core N (Linux; e.g. an isolated Orin core).",
+    )
     p.add_argument(
         "--list-devices-only",
         action="store_true",
@@ -500,6 +603,7 @@ def main():
         log_dir=Path(args.log_dir),
         capture_channels=capture_channels,
         mic_indices=mic_indices,
+        cpu_affinity=args.cpu_affinity,
     )
 
 
@@ -9,8 +9,10 @@ This script:
     - Visualizes tracked sound sources on a polar plot with arrows from center
     - Shows only valid, stable tracks (filters out noise and false positives)
     - Displays track ID, azimuth, and confidence for each active track
-    - Updates in real-time using matplotlib animation
+    - Updates in real-time with a manual blit loop on a canvas timer
     - Optionally applies pre-filter (filters.yaml)
+    - Runs capture + DSP in a separate process (no GIL contention with
+      the matplotlib event loop); snapshots arrive over a queue
 
 Filtering:
     - Only shows tracks with confidence >= 30% (MIN_CONFIDENCE_TO_DISPLAY)
@@ -19,30 +21,31 @@ Filtering:
 
 Run:
     python scripts/visualize_doa.py
+    DOA_DEBUG=1 python scripts/visualize_doa.py   # periodic per-track console dump
 """
 
 from __future__ import annotations
 
+import logging
+import math
+import multiprocessing as mp
+import os
 import numpy as np
-import yaml
-import time
-import threading
 import queue
 from typing import Dict
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.text import Text
-from collections import deque
-from dataclasses import dataclass, field
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from scipy.cluster.hierarchy import DisjointSet
 
 from pathlib import Path
 
-from src.my_doa.utils.config_loader import load_pipeline_config
+from src.my_doa.utils.config_loader import load_pipeline_config, load_yaml
 from src.my_doa.pipeline.doa_pipeline import DOAPipeline
 from src.my_doa.audio.audio_io import AudioStream
 from src.my_doa.utils.logger import get_logger
 from src.my_doa.dsp.filters import design_highpass, design_bandpass, apply_filter
-from src.my_doa.utils.math_utils import wrap_angle_deg_0_360, circular_distance_deg
+from src.my_doa.utils.math_utils import wrap_angle_deg_0_360
 
 logger = get_logger(__name__)
 
@@ -58,8 +61,8 @@ def _load_filters(path: str | Path = "config/filters.yaml"):
         return None
 
     try:
-        with open(path, "r") as f:
-            cfg = yaml.safe_load(f)
+        # libyaml-backed loader, cached per file mtime
+        cfg = load_yaml(path)
     except Exception as e:
         logger.warning("Failed to load filters.yaml", extra={"error": str(e)})
         return None
@@ -78,34 +81,103 @@ def _load_filters(path: str | Path = "config/filters.yaml"):
 # Filtering thresholds for showing only valid tracks
 MIN_CONFIDENCE_TO_DISPLAY = 0.25  # Only show tracks with confidence >= 25% (balanced)
 MIN_AGE_TO_DISPLAY = 5  # Only show tracks that are at least 5 frames old (stable)
-MAX_TIME_SINCE_UPDATE_MS = 500  # Drop tracks not updated within 500ms
+STALE_SNAPSHOT_UI_FRAMES = 10  # Warn once after 10 UI frames (~500ms) without a new snapshot
 
 # UI timing
 UI_FPS = 20  # Fixed UI refresh rate (50ms per frame)
 UI_SMOOTHING_FRAMES = 3  # Number of frames for UI-level smoothing
 TRACK_HOLD_FRAMES = 3  # Keep disappearing tracks visible for 3 frames with fade
 
+# Periodic per-track console dumps (read once at startup)
+DEBUG = os.environ.get("DOA_DEBUG", "0") not in ("", "0")
+
+# Interactive backend used when available (see _use_fast_backend)
+PREFERRED_BACKEND = "QtAgg"
+
+# Persistent label pool size (labels are reused, never recreated)
+MAX_DISPLAY_TRACKS = 20
+
+# DSP process -> UI snapshot queue depth (UI only ever uses the newest)
+SNAPSHOT_QUEUE_SIZE = 4
+DSP_JOIN_TIMEOUT_SEC = 2.0
+
 # Track state for UI smoothing and hold
-@dataclass
 class UITrackState:
     """UI-level track state with smoothing and hold logic."""
-    track_id: int
-    theta_deg: float
-    confidence: float
-    age: int
-    last_update_frame: int
-    hold_frames: int = 0  # Frames to keep visible after disappearing
-    is_active: bool = True
     
-    # Smoothing history
-    theta_history: deque = field(default_factory=lambda: deque(maxlen=UI_SMOOTHING_FRAMES))
-    confidence_history: deque = field(default_factory=lambda: deque(maxlen=UI_SMOOTHING_FRAMES))
+    # Slots declared by hand: dataclass(slots=True) needs Python 3.10+
+    __slots__ = (
+        "track_id", "theta_deg", "confidence", "age", "last_update_frame",
+        "hold_frames", "is_active",
+        "history", "n_pushed",
+        "sum_sin", "sum_cos", "sum_conf", "smoothed_theta", "smoothed_conf",
+        "label_prefix",
+    )
+    
+    def __init__(
+        self,
+        track_id: int,
+        theta_deg: float,
+        confidence: float,
+        age: int,
+        last_update_frame: int,
+        hold_frames: int = 0,  # Frames to keep visible after disappearing
+        is_active: bool = True,
+    ):
+        self.track_id = track_id
+        self.theta_deg = theta_deg
+        self.confidence = confidence
+        self.age = age
+        self.last_update_frame = last_update_frame
+        self.hold_frames = hold_frames
+        self.is_active = is_active
+        
+        # Smoothing history: fixed ring of (sin, cos, confidence) rows; empty
+        # slots stay zero so they contribute nothing to the running sums
+        self.history = np.zeros((UI_SMOOTHING_FRAMES, 3))
+        self.n_pushed = 0
+        
+        # Running sums over the history and the smoothed values derived from
+        # them; maintained by push(), read as plain fields by the UI
+        self.sum_sin = 0.0
+        self.sum_cos = 0.0
+        self.sum_conf = 0.0
+        self.smoothed_theta = 0.0
+        self.smoothed_conf = 0.0
+        
+        # Stable part of the display label ("ID3: "), formatted once
+        self.label_prefix = f"ID{self.track_id}: "
+        self.push(theta_deg, confidence)
     
-    def __post_init__(self):
-        if len(self.theta_history) == 0:
-            self.theta_history.append(self.theta_deg)
-        if len(self.confidence_history) == 0:
-            self.confidence_history.append(self.confidence)
+    def push(self, theta_deg: float, confidence: float) -> None:
+        """
+        Add one observation and refresh the smoothed values incrementally.
+
+        Angle: circular mean of the history (atan2 of the running sin/cos
+        sums). Confidence: EMA, 0.6 * new + 0.4 * mean of the previous values.
+        """
+        r = math.radians(theta_deg)
+        sin_r = math.sin(r)
+        cos_r = math.cos(r)
+        row = self.history[self.n_pushed % UI_SMOOTHING_FRAMES]
+        old_sin, old_cos, old_conf = row.tolist()
+        row[0] = sin_r
+        row[1] = cos_r
+        row[2] = confidence
+        self.n_pushed += 1
+        
+        self.sum_sin += sin_r - old_sin
+        self.sum_cos += cos_r - old_cos
+        self.smoothed_theta = math.degrees(math.atan2(self.sum_sin, self.sum_cos)) % 360.0
+        
+        self.sum_conf += confidence - old_conf
+        n = min(self.n_pushed, UI_SMOOTHING_FRAMES)
+        if n > 1:
+            prev_mean = (self.sum_conf - confidence) / (n - 1)
+            self.smoothed_conf = 0.6 * confidence + 0.4 * prev_mean
+        else:
+            # Only one value, use it directly
+            self.smoothed_conf = confidence
 
 # Distinct colors for different track IDs (up to 20 tracks)
 TRACK_COLORS = [
@@ -131,33 +203,33 @@ TRACK_COLORS = [
     '#9edae5',  # light cyan
 ]
 
+# RGBA lookup table so per-frame colors are one fancy-indexing op
+TRACK_COLORS_RGBA = np.array([to_rgba(c) for c in TRACK_COLORS])
+MARKER_EDGE_RGBA = np.array(to_rgba('black'))
+
 
-def get_track_color(track_id: int) -> str:
-    """Get a consistent color for a track ID."""
-    return TRACK_COLORS[(track_id - 1) % len(TRACK_COLORS)]
+def get_track_colors(track_ids: np.ndarray) -> np.ndarray:
+    """Get consistent RGBA colors (N, 4) for an array of track IDs."""
+    return TRACK_COLORS_RGBA[(track_ids - 1) % len(TRACK_COLORS_RGBA)]
 
 
-def is_valid_track(track_dict: dict) -> bool:
+def valid_track_mask(tracks: list) -> np.ndarray:
     """
-    Check if a track is valid enough to display.
+    Check which tracks are valid enough to display, in one vectorized pass.
     
     Filters out:
     - Low confidence tracks (noise, false positives)
     - Very new tracks (unstable, might be false)
-    """
-    confidence = track_dict.get("confidence", 0.0)
-    age = track_dict.get("age", 0)
     
-    return confidence >= MIN_CONFIDENCE_TO_DISPLAY and age >= MIN_AGE_TO_DISPLAY
-
-
-def _compute_circular_mean(angles_deg: list) -> float:
-    """Compute circular mean of angles in degrees."""
-    angles_rad = np.deg2rad(angles_deg)
-    mean_sin = np.mean(np.sin(angles_rad))
-    mean_cos = np.mean(np.cos(angles_rad))
-    mean_angle_rad = np.arctan2(mean_sin, mean_cos)
-    return wrap_angle_deg_0_360(np.rad2deg(mean_angle_rad))
+    Returns
+    -------
+    np.ndarray
+        Boolean mask aligned with ``tracks``.
+    """
+    n = len(tracks)
+    conf = np.fromiter((td.get("confidence", 0.0) for td in tracks), dtype=float, count=n)
+    age = np.fromiter((td.get("age", 0) for td in tracks), dtype=float, count=n)
+    return (conf >= MIN_CONFIDENCE_TO_DISPLAY) & (age >= MIN_AGE_TO_DISPLAY)
 
 
 def _merge_close_tracks(track_data: list, merge_threshold_deg: float = 30.0) -> list:
@@ -165,75 +237,158 @@ def _merge_close_tracks(track_data: list, merge_threshold_deg: float = 30.0) ->
     Merge tracks that are visually close (within threshold degrees).
     Uses confidence-weighted circular mean for merged angle.
     More aggressive: merges all tracks within threshold, even if they're not directly adjacent.
+
+    Groups are the connected components of the "within threshold" graph
+    (transitive closure), found with union-find over one vectorized
+    pairwise adjacency matrix; a single call is enough. Adjacency is
+    tested on the unit-circle embedding: |dtheta| <= T  <=>  cos(dtheta) >= cos(T).
     """
-    if len(track_data) <= 1:
+    n = len(track_data)
+    if n <= 1:
         return track_data
     
-    # Sort by confidence (descending) so we process best tracks first
-    sorted_tracks = sorted(track_data, key=lambda t: t["confidence"], reverse=True)
+    theta = np.fromiter((t["theta_deg"] for t in track_data), dtype=np.float64, count=n)
+    conf = np.fromiter((t["confidence"] for t in track_data), dtype=np.float64, count=n)
     
-    merged = []
-    used = [False] * len(sorted_tracks)
+    # Pairwise cos(dtheta) from unit vectors (one matmul) -> union all close pairs
+    angles_rad = np.deg2rad(theta)
+    sin_t = np.sin(angles_rad)
+    cos_t = np.cos(angles_rad)
+    unit = np.column_stack([cos_t, sin_t])
+    # (tiny tolerance keeps the threshold inclusive despite cos() rounding)
+    close = (unit @ unit.T) >= math.cos(math.radians(merge_threshold_deg)) - 1e-12
+    groups = DisjointSet(range(n))
+    for i, j in zip(*np.nonzero(np.triu(close, k=1))):
+        groups.merge(int(i), int(j))
+    
+    # Dense component labels
+    roots = [groups[i] for i in range(n)]
+    label_of = {r: k for k, r in enumerate(dict.fromkeys(roots))}
+    labels = np.fromiter((label_of[r] for r in roots), dtype=np.intp, count=n)
+    n_groups = len(label_of)
     
-    for i, track in enumerate(sorted_tracks):
-        if used[i]:
+    # Per-group confidence-weighted circular mean and average confidence
+    conf_sum = np.bincount(labels, weights=conf, minlength=n_groups)
+    weights = conf / (conf_sum[labels] + 1e-8)
+    mean_sin = np.bincount(labels, weights=weights * sin_t, minlength=n_groups)
+    mean_cos = np.bincount(labels, weights=weights * cos_t, minlength=n_groups)
+    mean_angle_deg = wrap_angle_deg_0_360(np.rad2deg(np.arctan2(mean_sin, mean_cos)))
+    avg_confidence = conf_sum / np.bincount(labels, minlength=n_groups)
+    group_size = np.bincount(labels, minlength=n_groups)
+    
+    # Emit groups best-first; the first member seen of each group is its
+    # highest-confidence track (ID and age come from it)
+    merged = []
+    emitted = np.zeros(n_groups, dtype=bool)
+    for i in np.argsort(-conf, kind="stable"):
+        g = labels[i]
+        if emitted[g]:
             continue
-        
-        # Find all tracks close to this one (including transitive closeness)
-        # Start with this track
-        close_tracks = [track]
-        used[i] = True
-        
-        # Iteratively find all tracks close to any track in the group
-        # This ensures transitive merging (if A is close to B and B is close to C, merge all)
-        changed = True
-        while changed:
-            changed = False
-            for j, other_track in enumerate(sorted_tracks):
-                if used[j]:
-                    continue
-                
-                # Check if this track is close to any track in the close_tracks group
-                for close_track in close_tracks:
-                    dist = abs(circular_distance_deg(close_track["theta_deg"], other_track["theta_deg"]))
-                    if dist <= merge_threshold_deg:
-                        close_tracks.append(other_track)
-                        used[j] = True
-                        changed = True
-                        break
-        
-        # Merge all close tracks
-        if len(close_tracks) == 1:
-            merged.append(track)
+        emitted[g] = True
+        best_track = track_data[i]
+        if group_size[g] == 1:
+            merged.append(best_track)
         else:
-            # Confidence-weighted circular mean of angles
-            angles_rad = np.deg2rad([t["theta_deg"] for t in close_tracks])
-            confidences = np.array([t["confidence"] for t in close_tracks])
-            
-            # Weight by confidence
-            weights = confidences / (np.sum(confidences) + 1e-8)
-            
-            # Weighted circular mean
-            mean_sin = np.sum(weights * np.sin(angles_rad))
-            mean_cos = np.sum(weights * np.cos(angles_rad))
-            mean_angle_rad = np.arctan2(mean_sin, mean_cos)
-            mean_angle_deg = wrap_angle_deg_0_360(np.rad2deg(mean_angle_rad))
-            
-            # Use highest confidence track's ID and age, but weighted average confidence
-            best_track = max(close_tracks, key=lambda t: t["confidence"])
-            avg_confidence = np.mean(confidences)  # Average confidence of merged tracks
-            
             merged.append({
                 "id": best_track["id"],
-                "theta_deg": mean_angle_deg,
-                "confidence": avg_confidence,  # Average confidence
+                "theta_deg": float(mean_angle_deg[g]),
+                "confidence": float(avg_confidence[g]),  # Average confidence
                 "age": best_track["age"],
                 "is_active": best_track.get("is_active", True),
+                "label_prefix": best_track.get("label_prefix", f"ID{best_track['id']}: "),
             })
     
     return merged
 
 
+def _use_fast_backend() -> None:
+    """
+    Prefer the Qt Agg canvas (faster repaints than Tk) when a Qt binding
+    is installed. An explicit MPLBACKEND always wins; without Qt the
+    default backend is kept.
+    """
+    if os.environ.get("MPLBACKEND"):
+        return
+    try:
+        plt.switch_backend(PREFERRED_BACKEND)
+    except ImportError:
+        logger.info("Qt backend unavailable; using default.", extra={"backend": plt.get_backend()})
+
+
+# ---------------------------------------------------------------------
+# DSP process
+# ---------------------------------------------------------------------
+
+def _put_latest(q, item) -> None:
+    """Put `item` on a bounded queue, evicting the oldest entries if full."""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _dsp_worker(pipe_cfg, audio_cfg: dict, sos, snapshot_q, stop_event) -> None:
+    """
+    Capture + DOA loop, run in its own process.
+
+    Keeps process_block() off the UI interpreter so it never holds the GIL
+    the matplotlib event loop needs. After every block that produced STFT
+    frames, the newest frame is published as a plain snapshot:
+
+        {"frame_index": int, "tracks": [TrackState.as_dict(), ...]}
+
+    When the queue is full the oldest queued snapshot is evicted, so after
+    a UI stall the newest frame is still the one drawn.
+    """
+    pipeline = DOAPipeline(pipe_cfg)
+    stream = AudioStream(
+        device=audio_cfg.get("device", "ReSpeaker"),
+        sample_rate=audio_cfg["sample_rate"],
+        block_size=audio_cfg["block_size"],
+        channels=audio_cfg["channels"],
+        channel_mapping=audio_cfg.get("channel_mapping", None),
+        capture_channels=audio_cfg.get("capture_channels", None),
+        max_backlog=audio_cfg.get("max_backlog_blocks"),
+    )
+    stream.start()
+
+    try:
+        while not stop_event.is_set():
+            block = stream.read_block(timeout=0.1)
+            if block is None:
+                continue
+
+            # Optional filtering
+            if sos is not None:
+                block = apply_filter(sos, block, mode="zero_phase")
+
+            try:
+                results = pipeline.process_block(block)
+            except Exception as e:
+                logger.error("DSP processing error", extra={"error": str(e)})
+                continue
+            if not results:
+                continue
+
+            latest = results[-1]
+            snapshot = {
+                "frame_index": latest["frame_index"],
+                "tracks": [t.as_dict() for t in latest["tracks"]],
+            }
+            _put_latest(snapshot_q, snapshot)
+    finally:
+        stream.close()
+        if stream.overruns:
+            print(f"Capture ring overruns (blocks dropped): {stream.overruns}")
+        if stream.dropped:
+            print(f"Backlog drops (oldest blocks skipped): {stream.dropped}")
+
+
 # ---------------------------------------------------------------------
 # Main visualization
 # ---------------------------------------------------------------------
@@ -245,7 +400,6 @@ def main():
     # 1) Load pipeline configs
     # --------------------------------------------------------------
     pipe_cfg, audio_cfg = load_pipeline_config("config/pipeline.yaml")
-    pipeline = DOAPipeline(pipe_cfg)
 
     device = audio_cfg.get("device", "ReSpeaker")
     fs = audio_cfg["sample_rate"]
@@ -283,20 +437,19 @@ def main():
             sos = None
 
     # --------------------------------------------------------------
-    # 3) Start audio
+    # 3) Start audio + DSP process
     # --------------------------------------------------------------
-    channel_mapping = audio_cfg.get("channel_mapping", None)
-    capture_channels = audio_cfg.get("capture_channels", None)
-    
-    stream = AudioStream(
-        device=device,
-        sample_rate=fs,
-        block_size=block_size,
-        channels=channels,
-        channel_mapping=channel_mapping,
-        capture_channels=capture_channels,
+    # spawn: a clean interpreter (no forked GUI/audio state)
+    ctx = mp.get_context("spawn")
+    snapshot_q = ctx.Queue(maxsize=SNAPSHOT_QUEUE_SIZE)
+    stop_dsp = ctx.Event()
+    dsp_proc = ctx.Process(
+        target=_dsp_worker,
+        args=(pipe_cfg, audio_cfg, sos, snapshot_q, stop_dsp),
+        name="DOA-DSP",
+        daemon=True,
     )
-    stream.start()
+    dsp_proc.start()
 
     print("\nPress Ctrl+C to stop.")
     print("Opening polar plot window...\n")
@@ -304,6 +457,10 @@ def main():
     # --------------------------------------------------------------
     # 4) Matplotlib setup
     # --------------------------------------------------------------
+    # Axes decorations (grid, ticks, title) are plain artists drawn only on
+    # full redraws and cached as the blit background; track artists are
+    # animated=True and are the only things redrawn per frame.
+    _use_fast_backend()
     plt.style.use("default")
     fig = plt.figure(figsize=(10, 10))
     ax = fig.add_subplot(111, projection="polar")
@@ -316,126 +473,151 @@ def main():
     ax.set_rticks([0.25, 0.5, 0.75, 1.0])
     ax.set_rlabel_position(22.5)  # Move radial labels
 
-    # Store plot elements for animation
-    arrow_objects: list = []  # Store arrow annotations
-    text_objects: list[Text] = []
+    # Persistent animated artists for blitting: one LineCollection for all
+    # center->source rays, one scatter for all tip markers (they cover
+    # the ray ends), and a pool of labels. update() only resets their
+    # data/styles and shows/hides labels; nothing is created per frame.
+    ray_coll = LineCollection([], zorder=10, animated=True)
+    ax.add_collection(ray_coll, autolim=False)
+    text_pool: list = []
+    for _ in range(MAX_DISPLAY_TRACKS):
+        text_pool.append(
+            ax.text(
+                0.0,
+                0.0,
+                "",
+                fontsize=10,
+                ha='center',
+                va='bottom',
+                bbox=dict(
+                    boxstyle='round,pad=0.4',
+                    facecolor='white',
+                    alpha=0.85,
+                    edgecolor='black',
+                    linewidth=1.0,
+                ),
+                zorder=12,
+                weight='bold',
+                animated=True,
+                visible=False,
+            )
+        )
+    marker_coll = ax.scatter(
+        np.empty(0),
+        np.empty(0),
+        linewidths=1.5,
+        zorder=11,
+        animated=True,
+    )
+    all_artists = [ray_coll, marker_coll, *text_pool]
+    label_texts: list = [None] * MAX_DISPLAY_TRACKS  # last string set on each label
+    
+    # Title lives outside the blitted axes area: only redraw the canvas
+    # when its text actually changes.
+    title_state = {"text": None}
+    
+    def set_title(text: str, bold: bool = False) -> None:
+        if text != title_state["text"]:
+            title_state["text"] = text
+            ax.set_title(text, fontsize=16, pad=20, weight='bold' if bold else 'normal')
+            fig.canvas.draw_idle()
+    
+    def hide_all() -> list:
+        for artist in text_pool:
+            artist.set_visible(False)
+        ray_coll.set_segments([])
+        marker_coll.set_offsets(np.empty((0, 2)))
+        return all_artists
     
     # UI state: track smoothing and hold
     ui_tracks: Dict[int, UITrackState] = {}  # track_id -> UITrackState
     current_frame = 0
     last_snapshot_frame = -1  # Track last snapshot frame to detect updates
-    stop_dsp_thread = threading.Event()
+    last_fresh_ui_frame = 0  # UI frame at which the newest snapshot arrived
+    latest_snapshot = None  # newest snapshot received from the DSP process
     
     # --------------------------------------------------------------
-    # 5) DSP processing thread (runs at audio block rate)
+    # 5) UI update function (runs at fixed FPS)
     # --------------------------------------------------------------
-    def dsp_thread():
-        """Separate thread for DSP processing to avoid blocking UI."""
-        while not stop_dsp_thread.is_set():
-            block = stream.read_block(timeout=0.1)
-            if block is None:
-                continue
-            
-            # Optional filtering
-            if sos is not None:
-                block = apply_filter(sos, block, mode="zero_phase")
-            
-            # Process block - snapshot is updated atomically inside
-            try:
-                pipeline.process_block(block)
-            except Exception as e:
-                logger.error("DSP processing error", extra={"error": str(e)})
-    
-    # Start DSP thread
-    dsp_thread_obj = threading.Thread(target=dsp_thread, daemon=True)
-    dsp_thread_obj.start()
-    
-    # --------------------------------------------------------------
-    # 6) UI update function (runs at fixed FPS)
-    # --------------------------------------------------------------
-    def update(_):
-        nonlocal arrow_objects, text_objects, ui_tracks, current_frame, last_snapshot_frame
+    def update():
+        nonlocal ui_tracks, current_frame, last_snapshot_frame, latest_snapshot, last_fresh_ui_frame
         
         current_frame += 1
         
-        # Get latest snapshot (thread-safe, may be slightly behind)
-        # Force a fresh read each time
-        snapshot = pipeline.get_latest_snapshot()
+        # Drain the snapshot queue, keeping only the newest
+        fresh = None
+        while True:
+            try:
+                fresh = snapshot_q.get_nowait()
+            except queue.Empty:
+                break
+        
+        # Nothing new from DSP and no held tracks fading out: the last
+        # blitted frame is still current, so skip all work (no artists)
+        holding = any(t.hold_frames for t in ui_tracks.values())
+        if fresh is not None:
+            latest_snapshot = fresh
+            last_fresh_ui_frame = current_frame
+        else:
+            # Staleness in UI frames (no wall-clock reads); log once per stall
+            if current_frame - last_fresh_ui_frame == STALE_SNAPSHOT_UI_FRAMES:
+                logger.debug(
+                    "Snapshot is stale (DSP process stalled?)",
+                    extra={
+                        "snapshot_age_frames": STALE_SNAPSHOT_UI_FRAMES,
+                        "frame": current_frame,
+                    },
+                )
+            if not holding:
+                return []
+        
+        snapshot = latest_snapshot
         if snapshot is None:
             # No snapshot yet - clear display
-            for arrow_obj in arrow_objects:
-                arrow_obj.remove()
-            arrow_objects.clear()
-            for text_obj in text_objects:
-                text_obj.remove()
-            text_objects.clear()
             if current_frame % 100 == 0:
-                ax.set_title("DOA Tracks (Live) - Waiting for snapshot...", fontsize=16, pad=20)
-            return []
+                set_title("DOA Tracks (Live) - Waiting for snapshot...")
+            return hide_all()
         
         # Check if snapshot has actually changed
         snapshot_frame = snapshot["frame_index"]
-        if snapshot_frame == last_snapshot_frame:
-            # Snapshot hasn't changed, but still update UI (tracks might have aged/changed internally)
-            # Don't return early - continue to update display
-            pass
-        else:
-            last_snapshot_frame = snapshot_frame
+        if snapshot_frame == last_snapshot_frame and not holding:
+            return []
+        last_snapshot_frame = snapshot_frame
         
         tracks = snapshot["tracks"]
-        snapshot_time = snapshot["timestamp_sec"]
-        current_time = time.time()
+        valid_mask = valid_track_mask(tracks)
         
-        # Debug: log track count occasionally
+        # Debug: log track count occasionally (console dump only with DOA_DEBUG)
         if current_frame % 50 == 0:
-            num_valid = sum(1 for t in tracks if is_valid_track(t.as_dict()))
-            print(f"[UI Frame {current_frame}] Snapshot: {len(tracks)} tracks, {num_valid} valid")
-            if len(tracks) > 0:
-                for t in tracks:
-                    td = t.as_dict()
-                    print(f"  Track ID{t.id}: θ={td['theta_deg']:.1f}° age={t.age} conf={td['confidence']:.2f} valid={is_valid_track(td)}")
+            num_valid = int(np.count_nonzero(valid_mask))
+            if DEBUG:
+                print(f"[UI Frame {current_frame}] Snapshot: {len(tracks)} tracks, {num_valid} valid")
+                for td, valid in zip(tracks, valid_mask):
+                    print(f"  Track ID{td['id']}: θ={td['theta_deg']:.1f}° age={td['age']} conf={td['confidence']:.2f} valid={bool(valid)}")
+            if len(tracks) > 0 and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Snapshot tracks",
                     extra={
                         "frame": current_frame,
                         "num_tracks": len(tracks),
                         "num_valid": num_valid,
-                        "track_ids": [t.id for t in tracks],
-                        "confidences": [t.compute_confidence() for t in tracks],
-                        "ages": [t.age for t in tracks],
+                        "track_ids": [td["id"] for td in tracks],
+                        "confidences": [td["confidence"] for td in tracks],
+                        "ages": [td["age"] for td in tracks],
                     },
                 )
-            elif current_frame % 200 == 0:
+            if DEBUG and not tracks and current_frame % 200 == 0:
                 print(f"[UI Frame {current_frame}] No tracks in snapshot")
         
         # Update UI track states from snapshot
         # Only track IDs that are both in snapshot AND valid
         active_valid_track_ids = set()
         
-        for track in tracks:
-            track_dict = track.as_dict()
+        # Only valid, stable tracks are processed
+        for idx in np.flatnonzero(valid_mask):
+            track_dict = tracks[idx]
             track_id = track_dict["id"]
             
-            # Filter: only process valid, stable tracks
-            if not is_valid_track(track_dict):
-                continue
-            
-            # Check time since snapshot was created (not track update time)
-            # For real-time, snapshot should be recent; for offline, this check is less critical
-            time_since_snapshot_ms = (current_time - snapshot_time) * 1000
-            # Only reject if snapshot is very stale (likely DSP thread stuck)
-            if time_since_snapshot_ms > MAX_TIME_SINCE_UPDATE_MS:
-                # Don't reject tracks, just log warning (snapshot might be from offline processing)
-                if current_frame % 100 == 0:  # Log occasionally
-                    logger.debug(
-                        "Snapshot is stale",
-                        extra={
-                            "time_since_snapshot_ms": time_since_snapshot_ms,
-                            "frame": current_frame,
-                        },
-                    )
-                # Continue anyway - tracks might still be valid
-            
             # This track is valid - add to active set
             active_valid_track_ids.add(track_id)
             
@@ -449,8 +631,7 @@ def main():
                 ui_track = ui_tracks[track_id]
                 ui_track.is_active = True
                 ui_track.hold_frames = 0
-                ui_track.theta_history.append(theta_deg)
-                ui_track.confidence_history.append(confidence)
+                ui_track.push(theta_deg, confidence)
                 ui_track.age = age
                 ui_track.last_update_frame = last_update_frame
             else:
@@ -477,51 +658,28 @@ def main():
                         del ui_tracks[track_id]
                         continue
         
-        # Clear previous arrows and text
-        for arrow_obj in arrow_objects:
-            arrow_obj.remove()
-        arrow_objects.clear()
-        for text_obj in text_objects:
-            text_obj.remove()
-        text_objects.clear()
-        
         if not ui_tracks:
-            if current_frame % 100 == 0:
+            if DEBUG and current_frame % 100 == 0:
                 print(f"[UI Frame {current_frame}] No UI tracks to display (had {len(tracks)} tracks from snapshot)")
-            ax.set_title(f"DOA Tracks (Live) - No valid tracks (snapshot: {len(tracks)} tracks)", fontsize=16, pad=20)
-            return []
+            set_title(f"DOA Tracks (Live) - No valid tracks (snapshot: {len(tracks)} tracks)")
+            return hide_all()
         
         # Prepare track data with UI smoothing
         track_data = []
         for ui_track in ui_tracks.values():
-            # Apply UI-level smoothing (circular mean for angles, EMA for confidence)
-            if len(ui_track.theta_history) > 0:
-                smoothed_theta = _compute_circular_mean(list(ui_track.theta_history))
-            else:
-                smoothed_theta = ui_track.theta_deg
-            
-            if len(ui_track.confidence_history) > 1:
-                # EMA: 0.6 * new + 0.4 * previous average
-                prev_mean = np.mean(list(ui_track.confidence_history)[:-1])
-                smoothed_conf = 0.6 * ui_track.confidence_history[-1] + 0.4 * prev_mean
-            elif len(ui_track.confidence_history) == 1:
-                # Only one value, use it directly
-                smoothed_conf = ui_track.confidence_history[0]
-            else:
-                smoothed_conf = ui_track.confidence
+            # UI-level smoothing (circular mean for angles, EMA for
+            # confidence) is kept up to date by UITrackState.push()
+            smoothed_theta = ui_track.smoothed_theta
+            smoothed_conf = ui_track.smoothed_conf
             
             # Apply fade for held tracks
             if not ui_track.is_active:
                 fade_factor = ui_track.hold_frames / TRACK_HOLD_FRAMES
                 smoothed_conf *= fade_factor * 0.5  # Fade to 50% opacity
             
-            # Validate values before adding (prevent NaN)
-            if np.isnan(smoothed_theta) or np.isnan(smoothed_conf) or np.isinf(smoothed_theta) or np.isinf(smoothed_conf):
-                # Skip this track if it has invalid values
-                continue
-            
-            # Clamp confidence to valid range
-            smoothed_conf = np.clip(smoothed_conf, 0.0, 1.0)
+            # Clamp confidence to valid range (NaN passes through and is
+            # dropped by the vectorized finite check below)
+            smoothed_conf = min(max(smoothed_conf, 0.0), 1.0)
             
             track_data.append({
                 "id": ui_track.track_id,
@@ -529,180 +687,129 @@ def main():
                 "confidence": smoothed_conf,
                 "age": ui_track.age,
                 "is_active": ui_track.is_active,
+                "label_prefix": ui_track.label_prefix,
             })
         
+        # Drop NaN/inf tracks in one vectorized pass, before merging so a
+        # bad value can't poison a group mean
+        if track_data:
+            n_tracks = len(track_data)
+            finite = (
+                np.isfinite(np.fromiter((t["theta_deg"] for t in track_data), dtype=float, count=n_tracks))
+                & np.isfinite(np.fromiter((t["confidence"] for t in track_data), dtype=float, count=n_tracks))
+            )
+            if not finite.all():
+                track_data = [t for t, ok in zip(track_data, finite) if ok]
+        
         # Merge visually close tracks (within 30 degrees) - balanced merging to eliminate duplicates
-        # Do multiple passes to ensure all close tracks are merged
+        # (transitive: one union-find pass merges every chain of close tracks)
         if len(track_data) > 1:
-            prev_len = len(track_data)
             track_data = _merge_close_tracks(track_data, merge_threshold_deg=30.0)
-            # If merging reduced the count, do another pass to catch any remaining close tracks
-            if len(track_data) < prev_len and len(track_data) > 1:
-                track_data = _merge_close_tracks(track_data, merge_threshold_deg=30.0)
 
-        if not track_data or len(track_data) == 0:
-            ax.set_title("DOA Tracks (Live) - No valid tracks", fontsize=16, pad=20)
-            return []
+        if not track_data:
+            set_title("DOA Tracks (Live) - No valid tracks")
+            return hide_all()
 
-        # Convert to radians for polar plot and validate
-        theta_rad = []
-        radii = []
-        colors = []
-        valid_tracks = []
+        # Pool capacity bounds how many sources are drawn
+        del track_data[MAX_DISPLAY_TRACKS:]
         
+        # Convert to radians for polar plot, all tracks at once
         min_radius = 0.4
         max_radius = 0.85
         
-        for track in track_data:
-            theta_deg = track["theta_deg"]
-            confidence = track["confidence"]
-            
-            # Validate before converting
-            if np.isnan(theta_deg) or np.isnan(confidence) or np.isinf(theta_deg) or np.isinf(confidence):
-                continue
-            
-            theta_rad_val = np.deg2rad(theta_deg)
-            radius_val = min_radius + (max_radius - min_radius) * confidence
-            
-            # Double-check after conversion
-            if np.isnan(theta_rad_val) or np.isnan(radius_val):
-                continue
-            
-            theta_rad.append(theta_rad_val)
-            radii.append(radius_val)
-            colors.append(get_track_color(track["id"]))
-            valid_tracks.append(track)
-        
-        # Update track_data to only valid tracks
-        track_data = valid_tracks
-        
-        # If no valid tracks after filtering, return early
-        if not track_data or len(track_data) == 0:
-            ax.set_title("DOA Tracks (Live) - No valid tracks", fontsize=16, pad=20)
-            return []
+        n_shown = len(track_data)
+        theta_arr = np.deg2rad(np.fromiter((t["theta_deg"] for t in track_data), dtype=float, count=n_shown))
+        conf_arr = np.fromiter((t["confidence"] for t in track_data), dtype=float, count=n_shown)
+        radii_arr = min_radius + (max_radius - min_radius) * conf_arr
         
-        # Draw arrows from center (0, 0) to track positions
-        for i, track in enumerate(track_data):
-            theta_rad_i = theta_rad[i]
-            radius_i = radii[i]
-            color_i = colors[i]
-            confidence_i = track["confidence"]
-            
-            # Arrow width proportional to confidence
-            arrow_width = 2.0 + 3.0 * confidence_i
-            
-            # Alpha based on active state (fade for held tracks)
-            alpha = 0.8 if track.get("is_active", True) else 0.4
-            
-            # Draw arrow from center to track position
-            try:
-                arrow_obj = ax.annotate(
-                    '',
-                    xy=(theta_rad_i, radius_i),  # Arrow tip position
-                    xytext=(0, 0),  # Arrow start (center)
-                    arrowprops=dict(
-                        arrowstyle='->',
-                        lw=arrow_width,
-                        color=color_i,
-                        alpha=alpha,
-                        zorder=10,
-                    ),
-                )
-                arrow_objects.append(arrow_obj)
-            except Exception as e:
-                # Skip if arrow creation fails
-                logger.debug(f"Failed to create arrow: {e}")
-                continue
-            
-            # Add marker at arrow tip (small circle)
-            try:
-                marker_obj = ax.scatter(
-                    [theta_rad_i],  # Wrap in list to ensure it's an array
-                    [radius_i],
-                    s=[100 + 200 * confidence_i],  # Wrap in list
-                    c=[color_i],
-                    alpha=alpha * 0.9,
-                    edgecolors='black',
-                    linewidths=1.5,
-                    zorder=11,
-                )
-                arrow_objects.append(marker_obj)
-            except Exception as e:
-                # Skip if marker creation fails
-                logger.debug(f"Failed to create marker: {e}")
-                continue
-
-        # Add text labels near arrow tips
+        # Restyle pooled artists: ray from center to the track position,
+        # marker at the tip, label just outside it
         label_offset_radius = 0.12  # Offset from arrow tip for text
+        label_radii = np.minimum(0.95, radii_arr + label_offset_radius)
+        ids_arr = np.fromiter((t["id"] for t in track_data), dtype=np.int64, count=n_shown)
+        # Alpha based on active state (fade for held tracks)
+        alpha_arr = np.fromiter(
+            (0.8 if t.get("is_active", True) else 0.4 for t in track_data), dtype=float, count=n_shown
+        )
+        base_rgba = get_track_colors(ids_arr)
+        
         for i, track in enumerate(track_data):
-            try:
-                theta_rad_i = theta_rad[i]
-                radius_i = radii[i]
-                color_i = colors[i]
-                
-                # Validate coordinates
-                if np.isnan(theta_rad_i) or np.isnan(radius_i):
-                    continue
-                
-                # Position text slightly outside the arrow tip
-                label_radius = min(0.95, radius_i + label_offset_radius)
-                
-                # Format label: "ID1: 154° (87%)"
-                label = f"ID{track['id']}: {track['theta_deg']:.0f}° ({track['confidence']*100:.0f}%)"
-                
-                # Add text
-                text_obj = ax.text(
-                    theta_rad_i,
-                    label_radius,
-                    label,
-                    fontsize=10,
-                    ha='center',
-                    va='bottom',
-                    bbox=dict(
-                        boxstyle='round,pad=0.4',
-                        facecolor=color_i,
-                        alpha=0.85,
-                        edgecolor='black',
-                        linewidth=1.0,
-                    ),
-                    zorder=12,
-                    weight='bold',
-                )
-                text_objects.append(text_obj)
-            except Exception as e:
-                # Skip if text creation fails
-                logger.debug(f"Failed to create text label: {e}")
-                continue
+            # Format label: "ID1: 154° (87%)"
+            text = text_pool[i]
+            text.set_position((theta_arr[i], label_radii[i]))
+            label = f"{track['label_prefix']}{track['theta_deg']:.0f}° ({track['confidence']*100:.0f}%)"
+            if label != label_texts[i]:
+                label_texts[i] = label
+                text.set_text(label)
+            text.get_bbox_patch().set_facecolor(base_rgba[i])
+            text.set_visible(True)
+        
+        for i in range(n_shown, MAX_DISPLAY_TRACKS):
+            text_pool[i].set_visible(False)
+        
+        # Rays from center, width proportional to confidence (radial: r from 0 at theta)
+        ray_segments = np.empty((n_shown, 2, 2))
+        ray_segments[:, :, 0] = theta_arr[:, None]
+        ray_segments[:, 0, 1] = 0.0
+        ray_segments[:, 1, 1] = radii_arr
+        ray_rgba = base_rgba.copy()
+        ray_rgba[:, 3] = alpha_arr
+        ray_coll.set_segments(ray_segments)
+        ray_coll.set_colors(ray_rgba)
+        ray_coll.set_linewidths(2.0 + 3.0 * conf_arr)
+        
+        face_rgba = base_rgba.copy()
+        face_rgba[:, 3] = alpha_arr * 0.9
+        edge_rgba = np.tile(MARKER_EDGE_RGBA, (n_shown, 1))
+        edge_rgba[:, 3] = alpha_arr * 0.9
+        marker_coll.set_offsets(np.column_stack([theta_arr, radii_arr]))
+        marker_coll.set_sizes(100 + 200 * conf_arr)
+        marker_coll.set_facecolors(face_rgba)
+        marker_coll.set_edgecolors(edge_rgba)
 
         # Update title with valid track count
-        ax.set_title(
-            f"DOA Tracks (Live) - {len(track_data)} valid source(s)",
-            fontsize=16,
-            pad=20,
-            weight='bold',
-        )
+        set_title(f"DOA Tracks (Live) - {len(track_data)} valid source(s)", bold=True)
 
-        # Return all plot elements for animation
-        # FuncAnimation will handle redrawing automatically
-        return arrow_objects + text_objects
+        # Return the pooled artists so the blit loop redraws only them
+        return all_artists
 
     # --------------------------------------------------------------
-    # 7) Start animation (fixed frame rate)
+    # 6) Manual blit loop (fixed frame rate)
     # --------------------------------------------------------------
+    # The static background (grid, ticks, title) is captured after every
+    # full draw, so resizes and title changes refresh it automatically.
+    canvas = fig.canvas
+    blit_state = {"bg": None}
+    
+    def on_draw(_event) -> None:
+        blit_state["bg"] = canvas.copy_from_bbox(fig.bbox)
+        for artist in all_artists:
+            ax.draw_artist(artist)
+        canvas.blit(fig.bbox)
+    
+    def on_timer() -> None:
+        artists = update()
+        if not artists or blit_state["bg"] is None:
+            return
+        canvas.restore_region(blit_state["bg"])
+        for artist in artists:
+            ax.draw_artist(artist)
+        canvas.blit(fig.bbox)
+    
     try:
-        interval_ms = int(1000 / UI_FPS)  # Convert FPS to milliseconds
-        ani = animation.FuncAnimation(
-            fig,
-            update,
-            interval=interval_ms,  # Fixed frame rate (20 FPS = 50ms)
-            blit=False,   # Don't use blit since we're removing/adding elements
-        )
+        canvas.mpl_connect("draw_event", on_draw)
+        interval_ms = int(1000 / UI_FPS)  # Fixed frame rate (20 FPS = 50ms)
+        timer = canvas.new_timer(interval=interval_ms)
+        timer.add_callback(on_timer)
+        timer.start()
         plt.show()
     except KeyboardInterrupt:
         print("\nStopping visualization...")
     finally:
-        stop_dsp_thread.set()
-        stream.close()
+        stop_dsp.set()
+        dsp_proc.join(timeout=DSP_JOIN_TIMEOUT_SEC)
+        if dsp_proc.is_alive():
+            dsp_proc.terminate()
         print("Audio stream closed.")
 
 
@@ -7,6 +7,7 @@ Real-time DOA track visualization with class labels.
 This script:
     - Receives 4-channel audio segments (1.5s) with class labels from another project
     - Processes each classified audio segment through the DOA pipeline
+      (tracker state carries across segments until flush() is called)
     - Associates class labels with detected tracks
     - Visualizes tracked sound sources on a polar plot with arrows from center
     - Shows track ID, azimuth, confidence, and class label for each active track
@@ -27,20 +28,37 @@ Usage:
     audio_segment = np.array(...)  # shape: (4, n_samples), 1.5s at 16kHz = 24000 samples
     class_label = "human"
     visualizer.process_classified_audio(audio_segment, class_label)
+
+    # When the next segment is not a continuation (new recording, stream
+    # gap), drop all tracks first:
+    visualizer.flush()
+
+    DOA processing runs in a separate process started with the "spawn"
+    method, which re-imports the caller's __main__ module in the child.
+    The calling script must therefore keep its top-level code under an
+    `if __name__ == "__main__":` guard; without it the script re-runs
+    itself in the child, or start() fails with a RuntimeError.
+
+    Each pushed segment (its list of source dicts and audio arrays) is
+    pickled through a multiprocessing queue to the DSP process, so every
+    entry must be picklable. Pickling happens later, on the queue's
+    feeder thread, so do not modify the arrays after pushing them.
 """
 
 from __future__ import annotations
 
+import math
+import multiprocessing as mp
 import numpy as np
 import yaml
 import time
-import threading
 import queue
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.text import Text
-from collections import deque
+from matplotlib.colors import to_rgba
+from matplotlib.patches import FancyArrowPatch
+from collections import defaultdict, deque
+from scipy.cluster.hierarchy import DisjointSet
 from dataclasses import dataclass, field
 
 from pathlib import Path
@@ -49,8 +67,6 @@ from src.my_doa.utils.config_loader import load_pipeline_config
 from src.my_doa.pipeline.doa_pipeline import DOAPipeline
 from src.my_doa.utils.logger import get_logger
 from src.my_doa.dsp.filters import design_highpass, design_bandpass, apply_filter
-from src.my_doa.utils.math_utils import wrap_angle_deg_0_360, circular_distance_deg
-from copy import deepcopy
 logger = get_logger(__name__)
 
 
@@ -68,6 +84,17 @@ UI_FPS = 20  # Fixed UI refresh rate (50ms per frame)
 UI_SMOOTHING_FRAMES = 3  # Number of frames for UI-level smoothing
 TRACK_HOLD_FRAMES = 3  # Keep disappearing tracks visible for 3 frames with fade
 
+# Persistent artist pool size (arrows/labels are reused, never recreated)
+MAX_TRACKS = 16
+
+# DSP process <-> UI queues
+AUDIO_QUEUE_SIZE = 2  # latest segment + a pending flush
+SNAPSHOT_QUEUE_SIZE = 4  # UI only ever uses the newest
+DSP_JOIN_TIMEOUT_SEC = 2.0
+
+# Queued in place of a segment to reset the DSP process's pipeline
+FLUSH_SENTINEL = None
+
 
 # ---------------------------------------------------------------------
 # Data structures
@@ -85,15 +112,32 @@ class ClassifiedTrack:
     hold_frames: int = 0
     is_active: bool = True
     
-    # Smoothing history
-    theta_history: deque = field(default_factory=lambda: deque(maxlen=UI_SMOOTHING_FRAMES))
+    # Smoothing history: sin/cos of each angle (with running sums, so the
+    # circular mean is O(1) per update) and raw confidences
+    sin_history: deque = field(default_factory=lambda: deque(maxlen=UI_SMOOTHING_FRAMES))
+    cos_history: deque = field(default_factory=lambda: deque(maxlen=UI_SMOOTHING_FRAMES))
+    sum_sin: float = 0.0
+    sum_cos: float = 0.0
     confidence_history: deque = field(default_factory=lambda: deque(maxlen=UI_SMOOTHING_FRAMES))
     
     def __post_init__(self):
-        if len(self.theta_history) == 0:
-            self.theta_history.append(self.theta_deg)
+        if len(self.sin_history) == 0:
+            self.push_theta(self.theta_deg)
         if len(self.confidence_history) == 0:
             self.confidence_history.append(self.confidence)
+    
+    def push_theta(self, theta_deg: float) -> None:
+        """Append one angle, keeping the sin/cos running sums in step."""
+        r = math.radians(theta_deg)
+        s = math.sin(r)
+        c = math.cos(r)
+        if len(self.sin_history) == self.sin_history.maxlen:
+            self.sum_sin -= self.sin_history[0]
+            self.sum_cos -= self.cos_history[0]
+        self.sin_history.append(s)
+        self.cos_history.append(c)
+        self.sum_sin += s
+        self.sum_cos += c
 
 
 # Fallback colors for unknown classes
@@ -122,13 +166,65 @@ def is_valid_track(track_dict: dict) -> bool:
     return confidence >= MIN_CONFIDENCE_TO_DISPLAY and age >= MIN_AGE_TO_DISPLAY
 
 
-def _compute_circular_mean(angles_deg: list) -> float:
-    """Compute circular mean of angles in degrees."""
-    angles_rad = np.deg2rad(angles_deg)
-    mean_sin = np.mean(np.sin(angles_rad))
-    mean_cos = np.mean(np.cos(angles_rad))
-    mean_angle_rad = np.arctan2(mean_sin, mean_cos)
-    return wrap_angle_deg_0_360(np.rad2deg(mean_angle_rad))
+def _circular_mean_from_sc(sum_sin: float, sum_cos: float) -> float:
+    """Circular mean in degrees [0, 360) from sin/cos sums (atan2 is scale-invariant)."""
+    return math.degrees(math.atan2(sum_sin, sum_cos)) % 360.0
+
+
+def _merge_class_group(class_tracks: list, class_label: str, merge_threshold_deg: float) -> list:
+    """
+    Merge one class's tracks: groups are the connected components of the
+    "within threshold" graph, found with union-find over a single
+    vectorized pairwise distance matrix. Groups are emitted best-first.
+    """
+    n = len(class_tracks)
+    theta = np.fromiter((t["theta_deg"] for t in class_tracks), dtype=np.float64, count=n)
+    conf = np.fromiter((t["confidence"] for t in class_tracks), dtype=np.float64, count=n)
+    
+    # Pairwise circular distances (wrapped to [-180, 180)) -> union all close pairs
+    dist = np.abs((theta[None, :] - theta[:, None] + 180.0) % 360.0 - 180.0)
+    groups = DisjointSet(range(n))
+    for i, j in zip(*np.nonzero(np.triu(dist <= merge_threshold_deg, k=1))):
+        groups.merge(int(i), int(j))
+    
+    # Dense component labels
+    roots = [groups[i] for i in range(n)]
+    label_of = {r: k for k, r in enumerate(dict.fromkeys(roots))}
+    labels = np.fromiter((label_of[r] for r in roots), dtype=np.intp, count=n)
+    n_groups = len(label_of)
+    
+    # Per-group confidence-weighted circular mean and average confidence
+    group_size = np.bincount(labels, minlength=n_groups)
+    conf_sum = np.bincount(labels, weights=conf, minlength=n_groups)
+    weights = conf / (conf_sum[labels] + 1e-8)
+    angles_rad = np.deg2rad(theta)
+    mean_sin = np.bincount(labels, weights=weights * np.sin(angles_rad), minlength=n_groups)
+    mean_cos = np.bincount(labels, weights=weights * np.cos(angles_rad), minlength=n_groups)
+    mean_angle_deg = np.rad2deg(np.arctan2(mean_sin, mean_cos)) % 360.0
+    avg_confidence = conf_sum / group_size
+    
+    # The first member seen of each group (by descending confidence) is
+    # its best track; ID and age come from it
+    merged = []
+    emitted = np.zeros(n_groups, dtype=bool)
+    for i in np.argsort(-conf, kind="stable"):
+        g = labels[i]
+        if emitted[g]:
+            continue
+        emitted[g] = True
+        best_track = class_tracks[i]
+        if group_size[g] == 1:
+            merged.append(best_track)
+        else:
+            merged.append({
+                "id": best_track["id"],
+                "theta_deg": float(mean_angle_deg[g]),
+                "confidence": float(avg_confidence[g]),
+                "age": best_track["age"],
+                "class_label": class_label,
+                "is_active": best_track.get("is_active", True),
+            })
+    return merged
 
 
 def _merge_close_tracks(track_data: list, merge_threshold_deg: float = 40.0) -> list:
@@ -136,17 +232,16 @@ def _merge_close_tracks(track_data: list, merge_threshold_deg: float = 40.0) ->
     Merge tracks that are visually close (within threshold degrees).
     Merges tracks with the same class label only.
     Uses confidence-weighted circular mean for merged angle.
+
+    Merging is transitive within a class, so a single call is enough.
     """
     if len(track_data) <= 1:
         return track_data
     
-    # Group by class label first
-    by_class: Dict[str, list] = {}
+    # Group by class label first (UI track dicts always carry one)
+    by_class: Dict[str, list] = defaultdict(list)
     for track in track_data:
-        class_label = track.get("class_label", "unknown")
-        if class_label not in by_class:
-            by_class[class_label] = []
-        by_class[class_label].append(track)
+        by_class[track["class_label"]].append(track)
     
     merged = []
     
@@ -155,62 +250,99 @@ def _merge_close_tracks(track_data: list, merge_threshold_deg: float = 40.0) ->
         if len(class_tracks) <= 1:
             merged.extend(class_tracks)
             continue
-        
-        # Sort by confidence (descending)
-        sorted_tracks = sorted(class_tracks, key=lambda t: t["confidence"], reverse=True)
-        
-        used = [False] * len(sorted_tracks)
-        
-        for i, track in enumerate(sorted_tracks):
-            if used[i]:
+        merged.extend(_merge_class_group(class_tracks, class_label, merge_threshold_deg))
+    
+    return merged
+
+
+# ---------------------------------------------------------------------
+# DSP process
+# ---------------------------------------------------------------------
+
+def _put_latest(q, item) -> None:
+    """Put `item` on a bounded queue, evicting the oldest entries if full."""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _processing_worker(pipe_cfg, audio_cfg: dict, sos, audio_q, snapshot_q, stop_event) -> None:
+    """
+    Process classified audio segments, run in its own process.
+
+    Keeps DOAPipeline.process_block() off the UI interpreter so it never
+    holds the GIL the matplotlib event loop needs. After every block, the
+    per-source snapshots are published as one plain list; when the queue is
+    full the oldest list is evicted (the UI drains it and keeps the newest).
+    """
+    pipeline = DOAPipeline(pipe_cfg)
+    block_size = audio_cfg["block_size"]
+    # (n_sources, n_mics, n_samples) segment buffer, reused across segments
+    soa_buf: Optional[np.ndarray] = None
+    while not stop_event.is_set():
+        try:
+            # Get audio segment with timeout
+            sep_audios = audio_q.get(timeout=0.1)
+
+            # Segments are treated as contiguous; only an explicit flush
+            # resets tracking
+            if sep_audios is FLUSH_SENTINEL:
+                pipeline.reset()
                 continue
             
-            # Find all tracks close to this one (transitive)
-            close_tracks = [track]
-            used[i] = True
-            
-            changed = True
-            while changed:
-                changed = False
-                for j, other_track in enumerate(sorted_tracks):
-                    if used[j]:
-                        continue
+            # Stack all sources into one contiguous array (metadata stays in
+            # parallel lists along the source axis)
+            audios = [sep_audio["audio"] for sep_audio in sep_audios]
+            shape = (len(audios),) + np.shape(audios[0])
+            if soa_buf is None or soa_buf.shape != shape:
+                soa_buf = np.empty(shape, dtype=np.float32)
+            np.stack(audios, axis=0, out=soa_buf)
+
+            # Apply pre-filter if enabled: one batched call over every
+            # source's channels, written back in place
+            if sos is not None:
+                flat = soa_buf.reshape(-1, shape[-1])
+                apply_filter(sos, flat, mode="zero_phase", out=flat)
                     
-                    for close_track in close_tracks:
-                        dist = abs(circular_distance_deg(close_track["theta_deg"], other_track["theta_deg"]))
-                        if dist <= merge_threshold_deg:
-                            close_tracks.append(other_track)
-                            used[j] = True
-                            changed = True
-                            break
+            # Hoist per-source fields out of the block loop
+            sources = [
+                (soa_buf[s_idx], sep_audio["class_name"], sep_audio["active_names"], sep_audio["color"])
+                for s_idx, sep_audio in enumerate(sep_audios)
+            ]
+            for i in range(0, shape[-1], block_size):
+                snapshots = []
+                for audio, class_name, active_names, color in sources:
+                    results = pipeline.process_block(audio[:, i:i + block_size])
+                    # Get final tracks from the segment
+                    if results:
+                        # Tracks from the last frame (most stable), tagged with the class label
+                        classified_tracks = [
+                            {**track.as_dict(), "class_label": class_name}
+                            for track in results[-1]["tracks"]
+                        ]
+                        
+                        # Update snapshot
+                        snapshot = {
+                            "frame_index": pipeline.frame_index,
+                            "tracks": classified_tracks,
+                            "monotonic_sec": time.monotonic(),  # system-wide clock, comparable across processes
+                            "class_label": class_name,
+                            "active_labels": active_names,
+                            "color": color,
+                        }
+                        snapshots.append(snapshot)
+                _put_latest(snapshot_q, snapshots)
             
-            # Merge close tracks
-            if len(close_tracks) == 1:
-                merged.append(track)
-            else:
-                # Confidence-weighted circular mean
-                angles_rad = np.deg2rad([t["theta_deg"] for t in close_tracks])
-                confidences = np.array([t["confidence"] for t in close_tracks])
-                
-                weights = confidences / (np.sum(confidences) + 1e-8)
-                mean_sin = np.sum(weights * np.sin(angles_rad))
-                mean_cos = np.sum(weights * np.cos(angles_rad))
-                mean_angle_rad = np.arctan2(mean_sin, mean_cos)
-                mean_angle_deg = wrap_angle_deg_0_360(np.rad2deg(mean_angle_rad))
-                
-                best_track = max(close_tracks, key=lambda t: t["confidence"])
-                avg_confidence = np.mean(confidences)
-                
-                merged.append({
-                    "id": best_track["id"],
-                    "theta_deg": mean_angle_deg,
-                    "confidence": avg_confidence,
-                    "age": best_track["age"],
-                    "class_label": class_label,
-                    "is_active": best_track.get("is_active", True),
-                })
-    
-    return merged
+        except queue.Empty:
+            continue
+        except Exception as e:
+            logger.error(f"Error processing audio segment {e}", extra={"error": str(e)})
 
 
 # ---------------------------------------------------------------------
@@ -233,26 +365,27 @@ class ClassifiedDOAVisualizer:
         self.pipe_cfg, self.audio_cfg = load_pipeline_config("sound_event/config/pipeline.yaml")
         self.fs = self.pipe_cfg.sample_rate
         
-        # Create pipeline (will be reset per segment)
-        self.pipeline = DOAPipeline(self.pipe_cfg)
-        
         # Load optional pre-filter
         self.sos = self._load_pre_filter()
         
+        # The DOA pipeline runs in a separate process (created in start());
+        # spawn gives it a clean interpreter (no forked GUI state)
+        self._mp_ctx = mp.get_context("spawn")
+        
         # Queue for receiving audio segments with class labels
-        self.audio_queue: queue.Queue[Tuple[np.ndarray, str]] = queue.Queue(maxsize=10)
+        self.audio_queue = self._mp_ctx.Queue(maxsize=AUDIO_QUEUE_SIZE)
         
-        # Latest snapshot with class labels
-        self._snapshot_lock = threading.Lock()
+        # Snapshots from the DSP process; the newest is cached for the UI
+        self._snapshot_q = self._mp_ctx.Queue(maxsize=SNAPSHOT_QUEUE_SIZE)
         self._latest_snapshots: Optional[list[Dict]] = None
         
         # UI state
         self.ui_tracks: Dict[int, ClassifiedTrack] = {}
         self.current_frame = 0
-        self.stop_processing = threading.Event()
+        self.stop_processing = self._mp_ctx.Event()
         
-        # Processing thread
-        self.processing_thread: Optional[threading.Thread] = None
+        # Processing process
+        self.processing_proc: Optional[mp.process.BaseProcess] = None
         
         print(f"Sample rate: {self.fs} Hz")
         print(f"Expected audio shape: (4, n_samples) where n_samples = {int(1.5 * self.fs)} for 1.5s")
@@ -293,75 +426,70 @@ class ClassifiedDOAVisualizer:
             logger.warning("Failed to load pre-filter", extra={"error": str(e)})
             return None
     
-    def process_classified_audio(self, audios: list):
-        # Add to queue (non-blocking, drop if queue is full)
-        try:
-            self.audio_queue.put_nowait(audios)
-        except queue.Full:
-            logger.warning("Audio queue full, dropping segment")
-    def _processing_loop(self):
-        """Process audio segments from queue."""
-        while not self.stop_processing.is_set():
+    def _drain_audio_queue(self) -> bool:
+        """Discard unprocessed queue items; return True if a flush was among them."""
+        flush_pending = False
+        while True:
             try:
-                # Get audio segment with timeout
-                sep_audios = self.audio_queue.get(timeout=0.1)
+                item = self.audio_queue.get_nowait()
+            except queue.Empty:
+                return flush_pending
+            if item is FLUSH_SENTINEL:
+                flush_pending = True
+            else:
+                logger.debug("Replacing unprocessed audio segment")
 
-                # Reset pipeline for new segment (fresh tracking)
-                self.pipeline.reset()
-                
-                for sep_audio in sep_audios:    
-                    # Apply pre-filter if enabled
-                    if self.sos is not None:
-                        sep_audio["audio"] = apply_filter(self.sos, sep_audio["audio"], mode="zero_phase")
-                        
-                audio_samples = sep_audios[0]["audio"].shape[1]
-                for i in range(0, audio_samples, self.audio_cfg["block_size"]):
-                    snapshots = []
-                    for sep_audio in sep_audios:
-                        results = self.pipeline.process_block(sep_audio["audio"][:,i:i+self.audio_cfg["block_size"]])
-                        # Get final tracks from the segment
-                        if results:
-                            # Get tracks from the last frame (most stable)
-                            last_result = results[-1]
-                            tracks = last_result["tracks"]
-                            
-                            # Associate class label with tracks
-                            classified_tracks = []
-                            for track in tracks:
-                                track_dict = track.as_dict()
-                                track_dict["class_label"] = sep_audio["class_name"]
-                                classified_tracks.append(track_dict)
-                            
-                            # Update snapshot
-                            snapshot = {
-                                "frame_index": self.pipeline.frame_index,
-                                "tracks": classified_tracks,
-                                "timestamp_sec": time.time(),
-                                "class_label": sep_audio["class_name"],
-                                "active_labels": sep_audio["active_names"],
-                                "color":sep_audio["color"]
-                            }
-                            snapshots.append(snapshot)
-                    with self._snapshot_lock:
-                        self._latest_snapshots = snapshots
-                
+    def process_classified_audio(self, audios: list):
+        # Latest wins: a segment the DSP process has not picked up yet is
+        # stale, so replace it rather than queueing behind it (a pending
+        # flush is kept ahead of the new segment)
+        if self._drain_audio_queue():
+            _put_latest(self.audio_queue, FLUSH_SENTINEL)
+        _put_latest(self.audio_queue, audios)
+
+    def flush(self):
+        """
+        Reset DOA tracking before the next segment.
+
+        Segments are processed as one continuous stream, so tracks persist
+        from one segment to the next. Call this when the following segment
+        is not a continuation of the previous one; any segment still
+        waiting to be processed is discarded.
+        """
+        self._drain_audio_queue()
+        _put_latest(self.audio_queue, FLUSH_SENTINEL)
+
+    def get_latest_snapshot(self) -> Optional[list[Dict]]:
+        """
+        Get latest snapshots (UI side).
+
+        Drains the DSP process's snapshot queue and keeps only the newest
+        list, which stays current until a newer one arrives. Callers must
+        treat it and its dicts as read-only.
+        """
+        while True:
+            try:
+                self._latest_snapshots = self._snapshot_q.get_nowait()
             except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"Error processing audio segment {e}", extra={"error": str(e)})
-    
-    def get_latest_snapshot(self) -> Optional[Dict]:
-        """Get latest snapshot (thread-safe)."""
-        with self._snapshot_lock:
-            if self._latest_snapshots is None:
-                return None
-            return deepcopy(self._latest_snapshots)
+                return self._latest_snapshots
     
     def start(self):
-        """Start the visualization UI and processing thread."""
-        # Start processing thread
-        self.processing_thread = threading.Thread(target=self._processing_loop, daemon=True)
-        self.processing_thread.start()
+        """Start the visualization UI and the DSP process."""
+        # Start DSP process
+        self.processing_proc = self._mp_ctx.Process(
+            target=_processing_worker,
+            args=(
+                self.pipe_cfg,
+                self.audio_cfg,
+                self.sos,
+                self.audio_queue,
+                self._snapshot_q,
+                self.stop_processing,
+            ),
+            name="DOA-DSP",
+            daemon=True,
+        )
+        self.processing_proc.start()
         
         # Setup matplotlib
         plt.style.use("default")
@@ -376,36 +504,102 @@ class ClassifiedDOAVisualizer:
         ax.set_rticks([0.25, 0.5, 0.75, 1.0])
         ax.set_rlabel_position(22.5)
         
-        # Store plot elements
-        arrow_objects: list = []
-        text_objects: list[Text] = []
-        last_snapshot_frame = -1
+        # Persistent animated artists for blitting: one arrow + label per slot and a single
+        # scatter for all tip markers. update() only moves, restyles and
+        # shows/hides them; unused slots stay hidden.
+        arrow_pool: list[FancyArrowPatch] = []
+        text_pool: list = []
+        for _ in range(MAX_TRACKS):
+            arrow = FancyArrowPatch(
+                (0.0, 0.0),
+                (0.0, 0.0),
+                arrowstyle='->',
+                mutation_scale=10,  # matches ax.annotate's default arrow head
+                zorder=10,
+                animated=True,
+                visible=False,
+            )
+            ax.add_artist(arrow)
+            arrow_pool.append(arrow)
+            text_pool.append(
+                ax.text(
+                    0.0,
+                    0.0,
+                    "",
+                    fontsize=10,
+                    ha='center',
+                    va='bottom',
+                    bbox=dict(
+                        boxstyle='round,pad=0.4',
+                        facecolor='white',
+                        alpha=0.85,
+                        edgecolor='black',
+                        linewidth=1.0,
+                    ),
+                    zorder=12,
+                    weight='bold',
+                    animated=True,
+                    visible=False,
+                )
+            )
+        marker_coll = ax.scatter(
+            np.zeros(MAX_TRACKS),
+            np.zeros(MAX_TRACKS),
+            linewidths=1.5,
+            zorder=11,
+            animated=True,
+        )
+        marker_coll.set_offsets(np.empty((0, 2)))
+        all_artists = [*arrow_pool, marker_coll, *text_pool]
+        
+        # Snapshot list the pooled artists currently show
+        drawn_state = {"snapshots": None}
+        
+        # Class colors arrive as strings on every snapshot; parse each once
+        rgba_by_color: Dict[str, tuple] = {}
+        
+        # Title lives outside the blitted axes area: only redraw the canvas
+        # when its text actually changes.
+        title_state = {"text": None}
+        
+        def set_title(text: str, bold: bool = False) -> None:
+            if text != title_state["text"]:
+                title_state["text"] = text
+                ax.set_title(text, fontsize=16, pad=20, weight='bold' if bold else 'normal')
+                fig.canvas.draw_idle()
+        
+        def hide_all() -> list:
+            for artist in arrow_pool:
+                artist.set_visible(False)
+            for artist in text_pool:
+                artist.set_visible(False)
+            marker_coll.set_offsets(np.empty((0, 2)))
+            return all_artists
         
         def update(_):
-            nonlocal arrow_objects, text_objects, last_snapshot_frame
             self.current_frame += 1
             
             # Get latest snapshot
             snapshots = self.get_latest_snapshot()
             if snapshots is None or len(snapshots) == 0:
                 # Clear display
-                for arrow_obj in arrow_objects:
-                    arrow_obj.remove()
-                arrow_objects.clear()
-                for text_obj in text_objects:
-                    text_obj.remove()
-                text_objects.clear()
                 if self.current_frame % 100 == 0:
-                    ax.set_title("DOA Tracks with Class Labels - Waiting for audio...", fontsize=16, pad=20)
-                return []
-            current_time = time.time()
+                    set_title("DOA Tracks with Class Labels - Waiting for audio...")
+                return hide_all()
+            current_time = time.monotonic()
+            
+            # Idle frame: nothing new since the last draw and no track is
+            # fading or about to expire -> nothing to blit, the canvas (and
+            # on_draw after a full redraw) already shows this state
+            if snapshots is drawn_state["snapshots"] and all(t.is_active for t in self.ui_tracks.values()):
+                newest_ms = max(s["monotonic_sec"] for s in snapshots) * 1000
+                if not self.ui_tracks or current_time * 1000 - newest_ms <= MAX_TIME_SINCE_UPDATE_MS:
+                    return []
+            drawn_state["snapshots"] = snapshots
+            
             for snapshot in snapshots:
-                snapshot_frame = snapshot["frame_index"]
-                if snapshot_frame != last_snapshot_frame:
-                    last_snapshot_frame = snapshot_frame
-                
                 tracks = snapshot["tracks"]
-                snapshot_time = snapshot["timestamp_sec"]
+                snapshot_time = snapshot["monotonic_sec"]
                 
                 # Update UI track states
                 active_valid_track_ids = set()
@@ -432,7 +626,7 @@ class ClassifiedDOAVisualizer:
                         ui_track = self.ui_tracks[track_id]
                         ui_track.is_active = True
                         ui_track.hold_frames = 0
-                        ui_track.theta_history.append(theta_deg)
+                        ui_track.push_theta(theta_deg)
                         ui_track.confidence_history.append(confidence)
                         ui_track.age = age
                         ui_track.class_label = class_label  # Update class label
@@ -459,32 +653,27 @@ class ClassifiedDOAVisualizer:
                                 del self.ui_tracks[track_id]
                                 continue
                 
-                # Clear previous arrows and text
-                for arrow_obj in arrow_objects:
-                    arrow_obj.remove()
-                arrow_objects.clear()
-                for text_obj in text_objects:
-                    text_obj.remove()
-                text_objects.clear()
-                
                 if not self.ui_tracks:
-                    ax.set_title("DOA Tracks with Class Labels - No valid tracks", fontsize=16, pad=20)
-                    return []
+                    set_title("DOA Tracks with Class Labels - No valid tracks")
+                    return hide_all()
                 
                 # Prepare track data with UI smoothing
                 track_data = []
                 for ui_track in self.ui_tracks.values():
                     # Apply UI-level smoothing
-                    if len(ui_track.theta_history) > 0:
-                        smoothed_theta = _compute_circular_mean(list(ui_track.theta_history))
+                    if len(ui_track.sin_history) > 0:
+                        smoothed_theta = _circular_mean_from_sc(ui_track.sum_sin, ui_track.sum_cos)
                     else:
                         smoothed_theta = ui_track.theta_deg
                     
-                    if len(ui_track.confidence_history) > 1:
-                        prev_mean = np.mean(list(ui_track.confidence_history)[:-1])
-                        smoothed_conf = 0.6 * ui_track.confidence_history[-1] + 0.4 * prev_mean
-                    elif len(ui_track.confidence_history) == 1:
-                        smoothed_conf = ui_track.confidence_history[0]
+                    conf_hist = ui_track.confidence_history
+                    if len(conf_hist) > 1:
+                        # Scalar math on a <= UI_SMOOTHING_FRAMES deque; no ndarray round trip
+                        last_conf = conf_hist[-1]
+                        prev_mean = (math.fsum(conf_hist) - last_conf) / (len(conf_hist) - 1)
+                        smoothed_conf = 0.6 * last_conf + 0.4 * prev_mean
+                    elif len(conf_hist) == 1:
+                        smoothed_conf = conf_hist[0]
                     else:
                         smoothed_conf = ui_track.confidence
                     
@@ -492,10 +681,7 @@ class ClassifiedDOAVisualizer:
                         fade_factor = ui_track.hold_frames / TRACK_HOLD_FRAMES
                         smoothed_conf *= fade_factor * 0.5
                     
-                    if np.isnan(smoothed_theta) or np.isnan(smoothed_conf) or np.isinf(smoothed_theta) or np.isinf(smoothed_conf):
-                        continue
-                    
-                    smoothed_conf = np.clip(smoothed_conf, 0.0, 1.0)
+                    smoothed_conf = min(max(smoothed_conf, 0.0), 1.0)
                     
                     track_data.append({
                         "id": ui_track.track_id,
@@ -506,151 +692,106 @@ class ClassifiedDOAVisualizer:
                         "is_active": ui_track.is_active,
                     })
                 
+                # Drop non-finite smoothed values with one mask pass (the
+                # only NaN/Inf guard; merging finite tracks stays finite)
+                n_tracks = len(track_data)
+                theta_deg_arr = np.fromiter((t["theta_deg"] for t in track_data), dtype=float, count=n_tracks)
+                conf_arr = np.fromiter((t["confidence"] for t in track_data), dtype=float, count=n_tracks)
+                valid = np.isfinite(theta_deg_arr) & np.isfinite(conf_arr)
+                if not valid.all():
+                    track_data = [t for t, ok in zip(track_data, valid) if ok]
+                
                 # Merge visually close tracks (within same class)
                 if len(track_data) > 1:
-                    prev_len = len(track_data)
                     track_data = _merge_close_tracks(track_data, merge_threshold_deg=40.0)
-                    if len(track_data) < prev_len and len(track_data) > 1:
-                        track_data = _merge_close_tracks(track_data, merge_threshold_deg=40.0)
                 
                 if not track_data or len(track_data) == 0:
-                    ax.set_title("DOA Tracks with Class Labels - No valid tracks", fontsize=16, pad=20)
-                    return []
-                
-                # Convert to radians and validate
-                theta_rad = []
-                radii = []
-                colors = []
-                valid_tracks = []
+                    set_title("DOA Tracks with Class Labels - No valid tracks")
+                    return hide_all()
                 
+                # Per-track display math as arrays
                 min_radius = 0.4
                 max_radius = 0.85
                 
-                for track in track_data:
-                    theta_deg = track["theta_deg"]
-                    confidence = track["confidence"]
-                    
-                    if np.isnan(theta_deg) or np.isnan(confidence) or np.isinf(theta_deg) or np.isinf(confidence):
-                        continue
-                    
-                    theta_rad_val = np.deg2rad(theta_deg)
-                    radius_val = min_radius + (max_radius - min_radius) * confidence
-                    
-                    if np.isnan(theta_rad_val) or np.isnan(radius_val):
-                        continue
-                    
-                    theta_rad.append(theta_rad_val)
-                    radii.append(radius_val)
-                    colors.append(snapshot["color"])
-                    valid_tracks.append(track)
-                
-                track_data = valid_tracks
+                # Pool capacity bounds how many sources are drawn
+                del track_data[MAX_TRACKS:]
+                n_shown = len(track_data)
+                theta_rad = np.deg2rad(np.fromiter((t["theta_deg"] for t in track_data), dtype=float, count=n_shown))
+                conf_arr = np.fromiter((t["confidence"] for t in track_data), dtype=float, count=n_shown)
+                radii = min_radius + (max_radius - min_radius) * conf_arr
+                arrow_widths = 2.0 + 3.0 * conf_arr
+                is_active_arr = np.fromiter((t.get("is_active", True) for t in track_data), dtype=bool, count=n_shown)
+                alphas = np.where(is_active_arr, 0.8, 0.4)
                 
-                if not track_data or len(track_data) == 0:
-                    ax.set_title("DOA Tracks with Class Labels - No valid tracks", fontsize=16, pad=20)
-                    return []
-                
-                # Draw arrows and markers
+                # Move/restyle pooled artists: arrow from center to the track
+                # position, marker at the tip, label with class just outside it
+                label_offset_radius = 0.12
+                label_radii = np.minimum(0.95, radii + label_offset_radius)
+                color = rgba_by_color.get(snapshot["color"])
+                if color is None:
+                    color = rgba_by_color[snapshot["color"]] = to_rgba(snapshot["color"])
                 for i, track in enumerate(track_data):
-                    theta_rad_i = theta_rad[i]
-                    radius_i = radii[i]
-                    color_i = colors[i]
-                    confidence_i = track["confidence"]
-                    class_label = track["class_label"]
+                    arrow = arrow_pool[i]
+                    arrow.set_positions((0.0, 0.0), (theta_rad[i], radii[i]))
+                    arrow.set_linewidth(arrow_widths[i])
+                    arrow.set_color(color)
+                    arrow.set_alpha(alphas[i])
+                    arrow.set_visible(True)
                     
-                    arrow_width = 2.0 + 3.0 * confidence_i
-                    alpha = 0.8 if track.get("is_active", True) else 0.4
-                    
-                    try:
-                        arrow_obj = ax.annotate(
-                            '',
-                            xy=(theta_rad_i, radius_i),
-                            xytext=(0, 0),
-                            arrowprops=dict(
-                                arrowstyle='->',
-                                lw=arrow_width,
-                                color=color_i,
-                                alpha=alpha,
-                                zorder=10,
-                            ),
-                        )
-                        arrow_objects.append(arrow_obj)
-                    except Exception as e:
-                        logger.debug(f"Failed to create arrow: {e}")
-                        continue
-                    
-                    try:
-                        marker_obj = ax.scatter(
-                            [theta_rad_i],
-                            [radius_i],
-                            s=[100 + 200 * confidence_i],
-                            c=[color_i],
-                            alpha=alpha * 0.9,
-                            edgecolors='black',
-                            linewidths=1.5,
-                            zorder=11,
-                        )
-                        arrow_objects.append(marker_obj)
-                    except Exception as e:
-                        logger.debug(f"Failed to create marker: {e}")
-                        continue
+                    # Format label: "ID1: 154° (87%) [human]"
+                    text = text_pool[i]
+                    text.set_position((theta_rad[i], label_radii[i]))
+                    text.set_text(f"ID{track['id']}: {track['theta_deg']:.0f}° ({track['confidence']*100:.0f}%) [{track['class_label']}]")
+                    text.get_bbox_patch().set_facecolor(color)
+                    text.set_visible(True)
                 
-                # Add text labels with class information
-                label_offset_radius = 0.12
-                for i, track in enumerate(track_data):
-                    try:
-                        theta_rad_i = theta_rad[i]
-                        radius_i = radii[i]
-                        color_i = colors[i]
-                        class_label = track["class_label"]
-                        if np.isnan(theta_rad_i) or np.isnan(radius_i):
-                            continue
-                        
-                        label_radius = min(0.95, radius_i + label_offset_radius)
-                        # Format label: "ID1: 154° (87%) [human]"
-                        label = f"ID{track['id']}: {track['theta_deg']:.0f}° ({track['confidence']*100:.0f}%) [{class_label}]"
-                        
-                        text_obj = ax.text(
-                            theta_rad_i,
-                            label_radius,
-                            label,
-                            fontsize=10,
-                            ha='center',
-                            va='bottom',
-                            bbox=dict(
-                                boxstyle='round,pad=0.4',
-                                facecolor=color_i,
-                                alpha=0.85,
-                                edgecolor='black',
-                                linewidth=1.0,
-                            ),
-                            zorder=12,
-                            weight='bold',
-                        )
-                        text_objects.append(text_obj)
-                    except Exception as e:
-                        logger.debug(f"Failed to create text label: {e}")
-                        continue
+                for i in range(n_shown, MAX_TRACKS):
+                    arrow_pool[i].set_visible(False)
+                    text_pool[i].set_visible(False)
+                
+                marker_rgba = np.empty((n_shown, 4))
+                marker_rgba[:] = color
+                marker_rgba[:, 3] = alphas * 0.9
+                edge_rgba = np.zeros((n_shown, 4))
+                edge_rgba[:, 3] = alphas * 0.9  # black
+                marker_coll.set_offsets(np.column_stack([theta_rad, radii]))
+                marker_coll.set_sizes(100 + 200 * conf_arr)
+                marker_coll.set_facecolors(marker_rgba)
+                marker_coll.set_edgecolors(edge_rgba)
                 
                 # Update title
-                ax.set_title(
-                    f"DOA Tracks with Class Labels - {len(track_data)} valid source(s)",
-                    fontsize=16,
-                    pad=20,
-                    weight='bold',
-                )
+                set_title(f"DOA Tracks with Class Labels - {len(track_data)} valid source(s)", bold=True)
                 
-            return arrow_objects + text_objects
+            return all_artists
+        
+        # Manual blit loop (fixed frame rate). The background is captured
+        # over the whole figure after every full draw, so labels that
+        # extend past the polar axes box are restored too, and resizes and
+        # title changes refresh it automatically.
+        canvas = fig.canvas
+        blit_state = {"bg": None}
+        
+        def on_draw(_event) -> None:
+            blit_state["bg"] = canvas.copy_from_bbox(fig.bbox)
+            for artist in all_artists:
+                ax.draw_artist(artist)
+            canvas.blit(fig.bbox)
+        
+        def on_timer() -> None:
+            artists = update(None)
+            if not artists or blit_state["bg"] is None:
+                return
+            canvas.restore_region(blit_state["bg"])
+            for artist in artists:
+                ax.draw_artist(artist)
+            canvas.blit(fig.bbox)
         
-        # Start animation
         try:
+            canvas.mpl_connect("draw_event", on_draw)
             interval_ms = int(1000 / UI_FPS)
-            ani = animation.FuncAnimation(
-                fig,
-                update,
-                interval=interval_ms,
-                blit=False,
-            )
+            timer = canvas.new_timer(interval=interval_ms)
+            timer.add_callback(on_timer)
+            timer.start()
             print("Opening polar plot window...")
             plt.show()
         except KeyboardInterrupt:
@@ -658,14 +799,16 @@ class ClassifiedDOAVisualizer:
         except Exception as e:
             print(f"Error in visualization: {e}")
         finally:
-            self.stop_processing.set()
+            self.stop()
             print("Visualization stopped.")
     
     def stop(self):
         """Stop the visualizer."""
         self.stop_processing.set()
-        if self.processing_thread is not None:
-            self.processing_thread.join(timeout=1.0)
+        if self.processing_proc is not None:
+            self.processing_proc.join(timeout=DSP_JOIN_TIMEOUT_SEC)
+            if self.processing_proc.is_alive():
+                self.processing_proc.terminate()
 
 
 # ---------------------------------------------------------------------
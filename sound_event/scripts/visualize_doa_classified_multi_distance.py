@@ -31,26 +31,30 @@ Usage:
 
 from __future__ import annotations
 
+import math
 import numpy as np
 import yaml
 import time
 import threading
 import queue
+from collections import defaultdict
 import json
 import asyncio
 import websockets
 from typing import Dict, Optional, Tuple
-from collections import deque
 from dataclasses import dataclass, field
 
 from pathlib import Path
 
+try:
+    import orjson  # optional: faster encoder for the per-tick broadcast
+except ImportError:
+    orjson = None
+
 from src.my_doa.utils.config_loader import load_pipeline_config
 from src.my_doa.pipeline.doa_pipeline import DOAPipeline
 from src.my_doa.utils.logger import get_logger
 from src.my_doa.dsp.filters import design_highpass, design_bandpass, apply_filter
-from src.my_doa.utils.math_utils import wrap_angle_deg_0_360, circular_distance_deg
-from copy import deepcopy
 logger = get_logger(__name__)
 
 from src.my_doa.pipeline.distance_estimation import (
@@ -77,6 +81,12 @@ UI_FPS = 20  # Fixed UI refresh rate (50ms per frame)
 UI_SMOOTHING_FRAMES = 3  # Number of frames for UI-level smoothing
 TRACK_HOLD_FRAMES = 3  # Keep disappearing tracks visible for 3 frames with fade
 
+# Processing
+AUDIO_QUEUE_SIZE = 1  # only the newest segment is worth processing
+
+# WebSocket broadcast
+BROADCAST_HEARTBEAT_SEC = 1.0  # Resend the full point set at least this often
+
 
 # ---------------------------------------------------------------------
 # Data structures
@@ -96,15 +106,51 @@ class ClassifiedTrack:
     hold_frames: int = 0
     is_active: bool = True
     
-    # Smoothing history
-    theta_history: deque = field(default_factory=lambda: deque(maxlen=UI_SMOOTHING_FRAMES))
-    confidence_history: deque = field(default_factory=lambda: deque(maxlen=UI_SMOOTHING_FRAMES))
+    # Smoothing history: fixed ring of (sin, cos, confidence) rows; empty
+    # slots stay zero so they contribute nothing to the running sums
+    history: np.ndarray = field(default_factory=lambda: np.zeros((UI_SMOOTHING_FRAMES, 3)))
+    n_pushed: int = 0
+    
+    # Running sums over the history and the smoothed values derived from
+    # them; maintained by push(), read as plain fields by the track loop
+    sum_sin: float = 0.0
+    sum_cos: float = 0.0
+    sum_conf: float = 0.0
+    smoothed_theta: float = 0.0
+    smoothed_conf: float = 0.0
     
     def __post_init__(self):
-        if len(self.theta_history) == 0:
-            self.theta_history.append(self.theta_deg)
-        if len(self.confidence_history) == 0:
-            self.confidence_history.append(self.confidence)
+        self.push(self.theta_deg, self.confidence)
+    
+    def push(self, theta_deg: float, confidence: float) -> None:
+        """
+        Add one observation and refresh the smoothed values incrementally.
+
+        Angle: circular mean of the history (atan2 of the running sin/cos
+        sums). Confidence: EMA, 0.6 * new + 0.4 * mean of the previous values.
+        """
+        r = math.radians(theta_deg)
+        sin_r = math.sin(r)
+        cos_r = math.cos(r)
+        row = self.history[self.n_pushed % UI_SMOOTHING_FRAMES]
+        old_sin, old_cos, old_conf = row.tolist()
+        row[0] = sin_r
+        row[1] = cos_r
+        row[2] = confidence
+        self.n_pushed += 1
+        
+        self.sum_sin += sin_r - old_sin
+        self.sum_cos += cos_r - old_cos
+        self.smoothed_theta = math.degrees(math.atan2(self.sum_sin, self.sum_cos)) % 360.0
+        
+        self.sum_conf += confidence - old_conf
+        n = min(self.n_pushed, UI_SMOOTHING_FRAMES)
+        if n > 1:
+            prev_mean = (self.sum_conf - confidence) / (n - 1)
+            self.smoothed_conf = 0.6 * confidence + 0.4 * prev_mean
+        else:
+            # Only one value, use it directly
+            self.smoothed_conf = confidence
 
 
 # Fallback colors for unknown classes
@@ -119,6 +165,13 @@ FALLBACK_COLORS = [
 # Helper functions
 # ---------------------------------------------------------------------
 
+def _dumps(payload: dict) -> str:
+    """Encode a WebSocket message as JSON text (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(payload)
+
+
 def is_valid_track(track_dict: dict) -> bool:
     """
     Check if a track is valid enough to display.
@@ -127,19 +180,101 @@ def is_valid_track(track_dict: dict) -> bool:
     - Low confidence tracks (noise, false positives)
     - Very new tracks (unstable, might be false)
     """
-    confidence = track_dict.get("confidence", 0.0)
-    age = track_dict.get("age", 0)
+    confidence = track_dict["confidence"]
+    age = track_dict["age"]
     
     return confidence >= MIN_CONFIDENCE_TO_DISPLAY and age >= MIN_AGE_TO_DISPLAY
 
 
-def _compute_circular_mean(angles_deg: list) -> float:
-    """Compute circular mean of angles in degrees."""
-    angles_rad = np.deg2rad(angles_deg)
-    mean_sin = np.mean(np.sin(angles_rad))
-    mean_cos = np.mean(np.cos(angles_rad))
-    mean_angle_rad = np.arctan2(mean_sin, mean_cos)
-    return wrap_angle_deg_0_360(np.rad2deg(mean_angle_rad))
+def _group_mean_or_none(values: np.ndarray, labels: np.ndarray, n_groups: int) -> list:
+    """Per-group mean of the finite entries of `values`; None where a group has none."""
+    finite = np.isfinite(values)
+    counts = np.bincount(labels, weights=finite, minlength=n_groups)
+    sums = np.bincount(labels, weights=np.where(finite, values, 0.0), minlength=n_groups)
+    return [float(s / c) if c > 0 else None for s, c in zip(sums, counts)]
+
+
+def _cluster_angles(theta_deg: np.ndarray, threshold_deg: float) -> Tuple[int, np.ndarray]:
+    """
+    Connected components of the graph joining angles within `threshold_deg`
+    (circular distance), i.e. transitive single-linkage clustering.
+
+    On a circle two angles are connected exactly when every gap between
+    neighbours on the arc between them is within the threshold, so the
+    components are the runs of sorted angles split at the larger gaps.
+    This needs one sort instead of the O(N^2) pairwise matrix and loop.
+
+    Returns
+    -------
+    n_groups : int
+    labels : np.ndarray (N,)
+        Component index in [0, n_groups) for each angle.
+    """
+    order = np.argsort(theta_deg % 360.0, kind="stable")
+    sorted_deg = theta_deg[order] % 360.0
+    # Gap from each sorted angle to the next one, the last wrapping around
+    gaps = np.diff(sorted_deg, append=sorted_deg[0] + 360.0)
+    breaks = gaps > threshold_deg
+    n_groups = int(np.count_nonzero(breaks))
+    labels = np.zeros(len(theta_deg), dtype=np.intp)
+    if n_groups > 1:
+        # A new run starts after every break; the run after the last break
+        # wraps around into the first one
+        labels[order] = np.cumsum(np.roll(breaks, 1)) % n_groups
+    return max(n_groups, 1), labels
+
+
+def _merge_class_group(class_tracks: list, class_label: str, merge_threshold_deg: float) -> list:
+    """
+    Merge one class's tracks: groups are the connected components of the
+    "within threshold" graph (see `_cluster_angles`). Groups are emitted
+    best-first.
+    """
+    n = len(class_tracks)
+    theta = np.fromiter((t["theta_deg"] for t in class_tracks), dtype=np.float64, count=n)
+    conf = np.fromiter((t["confidence"] for t in class_tracks), dtype=np.float64, count=n)
+    # Distance/SPL are optional per track (None -> NaN, ignored in the means)
+    distances = np.array([t["distance_m"] for t in class_tracks], dtype=np.float64)
+    spls = np.array([t["spl_db"] for t in class_tracks], dtype=np.float64)
+    
+    n_groups, labels = _cluster_angles(theta, merge_threshold_deg)
+    
+    # Per-group confidence-weighted circular mean and plain averages
+    group_size = np.bincount(labels, minlength=n_groups)
+    conf_sum = np.bincount(labels, weights=conf, minlength=n_groups)
+    weights = conf / (conf_sum[labels] + 1e-8)
+    angles_rad = np.deg2rad(theta)
+    mean_sin = np.bincount(labels, weights=weights * np.sin(angles_rad), minlength=n_groups)
+    mean_cos = np.bincount(labels, weights=weights * np.cos(angles_rad), minlength=n_groups)
+    mean_angle_deg = np.rad2deg(np.arctan2(mean_sin, mean_cos)) % 360.0
+    avg_confidence = conf_sum / group_size
+    avg_distance = _group_mean_or_none(distances, labels, n_groups)
+    avg_spl = _group_mean_or_none(spls, labels, n_groups)
+    
+    # The first member seen of each group (by descending confidence) is
+    # its best track; ID and age come from it
+    merged = []
+    emitted = np.zeros(n_groups, dtype=bool)
+    for i in np.argsort(-conf, kind="stable"):
+        g = labels[i]
+        if emitted[g]:
+            continue
+        emitted[g] = True
+        best_track = class_tracks[i]
+        if group_size[g] == 1:
+            merged.append(best_track)
+        else:
+            merged.append({
+                "id": best_track["id"],
+                "theta_deg": float(mean_angle_deg[g]),
+                "confidence": float(avg_confidence[g]),
+                "distance_m": avg_distance[g],
+                "spl_db": avg_spl[g],
+                "age": best_track["age"],
+                "class_label": class_label,
+                "is_active": best_track["is_active"],
+            })
+    return merged
 
 
 def _merge_close_tracks(track_data: list, merge_threshold_deg: float = 40.0) -> list:
@@ -147,17 +282,16 @@ def _merge_close_tracks(track_data: list, merge_threshold_deg: float = 40.0) ->
     Merge tracks that are visually close (within threshold degrees).
     Merges tracks with the same class label only.
     Uses confidence-weighted circular mean for merged angle.
+
+    Merging is transitive within a class, so a single call is enough.
     """
     if len(track_data) <= 1:
         return track_data
     
     # Group by class label first
-    by_class: Dict[str, list] = {}
+    by_class: Dict[str, list] = defaultdict(list)
     for track in track_data:
-        class_label = track.get("class_label", "unknown")
-        if class_label not in by_class:
-            by_class[class_label] = []
-        by_class[class_label].append(track)
+        by_class[track["class_label"]].append(track)
     
     merged = []
     
@@ -166,65 +300,7 @@ def _merge_close_tracks(track_data: list, merge_threshold_deg: float = 40.0) ->
         if len(class_tracks) <= 1:
             merged.extend(class_tracks)
             continue
-        
-        # Sort by confidence (descending)
-        sorted_tracks = sorted(class_tracks, key=lambda t: t["confidence"], reverse=True)
-        
-        used = [False] * len(sorted_tracks)
-        
-        for i, track in enumerate(sorted_tracks):
-            if used[i]:
-                continue
-            
-            # Find all tracks close to this one (transitive)
-            close_tracks = [track]
-            used[i] = True
-            
-            changed = True
-            while changed:
-                changed = False
-                for j, other_track in enumerate(sorted_tracks):
-                    if used[j]:
-                        continue
-                    
-                    for close_track in close_tracks:
-                        dist = abs(circular_distance_deg(close_track["theta_deg"], other_track["theta_deg"]))
-                        if dist <= merge_threshold_deg:
-                            close_tracks.append(other_track)
-                            used[j] = True
-                            changed = True
-                            break
-            
-            # Merge close tracks
-            if len(close_tracks) == 1:
-                merged.append(track)
-            else:
-                # Confidence-weighted circular mean
-                angles_rad = np.deg2rad([t["theta_deg"] for t in close_tracks])
-                confidences = np.array([t["confidence"] for t in close_tracks])
-                distances = np.array([t["distance_m"] for t in close_tracks])
-                spls = np.array([t["spl_db"] for t in close_tracks])
-                
-                weights = confidences / (np.sum(confidences) + 1e-8)
-                mean_sin = np.sum(weights * np.sin(angles_rad))
-                mean_cos = np.sum(weights * np.cos(angles_rad))
-                mean_angle_rad = np.arctan2(mean_sin, mean_cos)
-                mean_angle_deg = wrap_angle_deg_0_360(np.rad2deg(mean_angle_rad))
-                
-                best_track = max(close_tracks, key=lambda t: t["confidence"])
-                avg_confidence = np.mean(confidences)
-                avg_distance = np.mean(distances)
-                avg_spl = np.mean(spls)
-                merged.append({
-                    "id": best_track["id"],
-                    "theta_deg": mean_angle_deg,
-                    "confidence": avg_confidence,
-                    "distance_m": avg_distance,
-                    "spl_db": avg_spl,
-                    "age": best_track["age"],
-                    "class_label": class_label,
-                    "is_active": best_track.get("is_active", True),
-                })
+        merged.extend(_merge_class_group(class_tracks, class_label, merge_threshold_deg))
     
     return merged
 
@@ -255,8 +331,8 @@ class ClassifiedDOAVisualizer:
         # Load optional pre-filter
         self.sos = self._load_pre_filter()
         
-        # Queue for receiving audio segments with class labels
-        self.audio_queue: queue.Queue[Tuple[np.ndarray, str]] = queue.Queue(maxsize=10)
+        # Queue for receiving audio segments with class labels (newest only)
+        self.audio_queue: queue.Queue[Tuple[np.ndarray, str]] = queue.Queue(maxsize=AUDIO_QUEUE_SIZE)
         
         # Latest snapshot with class labels
         self._snapshot_lock = threading.Lock()
@@ -278,6 +354,11 @@ class ClassifiedDOAVisualizer:
         self.latest_track_data_lock = threading.Lock()
         self.latest_track_data = []  # Store latest track data for WebSocket broadcasting
         self.latest_snapshot_color = "#00d9ff"  # Default color
+        # Per-track point dicts reused across broadcasts (broadcast loop only)
+        self._payload_cache: Dict[int, dict] = {}
+        # id -> ((class_label, color), quantized (direction, intensity, distance))
+        # as last sent to clients, for the delta protocol (broadcast loop only)
+        self._last_sent: Dict[int, tuple] = {}
         
         print(f"Sample rate: {self.fs} Hz")
         print(f"Expected audio shape: (4, n_samples) where n_samples = {int(1.5 * self.fs)} for 1.5s")
@@ -320,11 +401,20 @@ class ClassifiedDOAVisualizer:
             return None
     
     def process_classified_audio(self, audios: list):
-        # Add to queue (non-blocking, drop if queue is full)
-        try:
-            self.audio_queue.put_nowait(audios)
-        except queue.Full:
-            logger.warning("Audio queue full, dropping segment")
+        # Latest wins: a segment the processing thread has not picked up yet
+        # is stale, so replace it rather than queueing behind it
+        while True:
+            try:
+                self.audio_queue.get_nowait()
+                logger.debug("Replacing unprocessed audio segment")
+            except queue.Empty:
+                pass
+            try:
+                self.audio_queue.put_nowait(audios)
+                return
+            except queue.Full:
+                continue
+    
     def _processing_loop(self):
         """Process audio segments from queue."""
         while not self.stop_processing.is_set():
@@ -332,10 +422,15 @@ class ClassifiedDOAVisualizer:
                 # Get audio segment with timeout
                 sep_audios = self.audio_queue.get(timeout=0.1)
 
-                for sep_audio in sep_audios:    
-                    # Apply pre-filter if enabled
-                    if self.sos is not None:
-                        sep_audio["audio"] = apply_filter(self.sos, sep_audio["audio"], mode="zero_phase")
+                # Apply pre-filter if enabled: stack all sources into one
+                # (n_sources, n_mics, n_samples) array and filter every
+                # channel in a single batched call, in place
+                if self.sos is not None:
+                    stacked = np.stack([sep_audio["audio"] for sep_audio in sep_audios], axis=0).astype(np.float32, copy=False)
+                    flat = stacked.reshape(-1, stacked.shape[-1])
+                    apply_filter(self.sos, flat, mode="zero_phase", out=flat)
+                    for k, sep_audio in enumerate(sep_audios):
+                        sep_audio["audio"] = stacked[k]
 
                 pipelines = [ DOAPipeline(self.pipe_cfg) for _ in range(len(sep_audios))]
                 audio_samples = sep_audios[0]["audio"].shape[1]
@@ -378,11 +473,10 @@ class ClassifiedDOAVisualizer:
                                 track_dict = track.as_dict()
                                 track_dict["class_label"] = sep_audio["class_name"]
 
-                                #Attach distance information if successfully computed
-                                if r_hat is not None:
-                                    track_dict["distance_m"] = r_hat
-                                if L_db is not None:
-                                    track_dict["spl_db"] = L_db
+                                # Distance information (None if not computed), so
+                                # every track dict has the same keys downstream
+                                track_dict["distance_m"] = r_hat
+                                track_dict["spl_db"] = L_db
 
                                 classified_tracks.append(track_dict)
                             
@@ -404,12 +498,16 @@ class ClassifiedDOAVisualizer:
             except Exception as e:
                 logger.error(f"Error processing audio segment {e}", extra={"error": str(e)})
     
-    def get_latest_snapshot(self) -> Optional[Dict]:
-        """Get latest snapshot (thread-safe)."""
+    def get_latest_snapshot(self) -> Optional[list[Dict]]:
+        """
+        Get latest snapshots (thread-safe).
+
+        The processing loop publishes a freshly built list on every block
+        and never touches it again, so the shared list is returned as-is
+        (no copy). Callers must treat it and its dicts as read-only.
+        """
         with self._snapshot_lock:
-            if self._latest_snapshots is None:
-                return None
-            return deepcopy(self._latest_snapshots)
+            return self._latest_snapshots
     
     async def _websocket_handler(self, websocket, path):
         """Handle WebSocket client connections."""
@@ -423,7 +521,7 @@ class ClassifiedDOAVisualizer:
             
             # Send initial empty data to confirm connection
             try:
-                initial_message = json.dumps({
+                initial_message = _dumps({
                     "points": [],
                     "timestamp": int(time.time() * 1000),
                 })
@@ -443,46 +541,139 @@ class ClassifiedDOAVisualizer:
             logger.info(f"WebSocket client disconnected. Total clients: {client_count}")
     
     async def _broadcast_loop(self):
-        """Broadcast track data to all connected WebSocket clients."""
+        """
+        Broadcast track data to all connected WebSocket clients.
+
+        Clients first receive the full point set::
+
+            {"points": [...], "timestamp": ms}
+
+        and afterwards only deltas against what was last sent::
+
+            {"added": [...], "updates": [{"id", "d", "i", "r"}],
+             "removed": [ids], "timestamp": ms}
+
+        ``added`` carries full point dicts (new ids, or ids whose class or
+        color changed); ``updates`` carries direction, intensity and distance
+        of tracks that moved by more than the display precision. Ticks with
+        an empty delta send nothing. The full set is resent every
+        BROADCAST_HEARTBEAT_SEC and whenever a new client connects, so
+        clients resynchronize after quantization drift or a missed frame.
+        """
+        synced_clients = set()
+        last_full = 0.0
         while not self.stop_processing.is_set():
             try:
+                with self.websocket_lock:
+                    clients_to_send = list(self.websocket_clients)
+                # Drop disconnected clients; with none left there is nothing to send
+                synced_clients.intersection_update(clients_to_send)
+                if not clients_to_send:
+                    await asyncio.sleep(1.0 / UI_FPS)
+                    continue
+                
                 # Get latest track data
                 with self.latest_track_data_lock:
                     track_data = list(self.latest_track_data)
                     snapshot_color = self.latest_snapshot_color
                 
-                # Transform track data to match frontend format
+                # Transform track data to match frontend format, updating the
+                # cached per-track point dicts in place
+                timestamp_ms = int(time.time() * 1000)
                 points = []
                 for track in track_data:
-                    # Fill missing fields with 0 or defaults
-                    point = {
-                        "id": track.get("id", 0),
-                        "direction": float(track.get("theta_deg", 0)),
-                        "distance": float(track.get("distance_m", 0)) if track.get("distance_m") is not None else 0.0,
-                        "intensity": float(track.get("confidence", 0)),
-                        "timestamp": int(time.time() * 1000),
-                        "class_label": track.get("class_label", "unknown"),
-                        "color": snapshot_color,
-                    }
+                    track_id = track["id"]
+                    point = self._payload_cache.get(track_id)
+                    if point is None:
+                        point = self._payload_cache[track_id] = {"id": track_id}
+                    # Track dicts carry every key (normalized at ingest);
+                    # only an unknown distance needs a default
+                    distance_m = track["distance_m"]
+                    point["direction"] = float(track["theta_deg"])
+                    point["distance"] = float(distance_m) if distance_m is not None else 0.0
+                    point["intensity"] = float(track["confidence"])
+                    point["timestamp"] = timestamp_ms
+                    point["class_label"] = track["class_label"]
+                    point["color"] = snapshot_color
                     points.append(point)
                 
-                # Create message
-                message = json.dumps({
-                    "points": points,
-                    "timestamp": int(time.time() * 1000),
-                })
+                # Forget tracks that are no longer broadcast
+                if len(self._payload_cache) > len(points):
+                    live_ids = {point["id"] for point in points}
+                    for track_id in [k for k in self._payload_cache if k not in live_ids]:
+                        del self._payload_cache[track_id]
                 
-                # Broadcast to all connected clients
-                with self.websocket_lock:
-                    clients_to_send = list(self.websocket_clients)
+                # Quantize at display precision: 0.1 deg, 0.001 confidence, 1 cm
+                current = {
+                    point["id"]: (
+                        (point["class_label"], point["color"]),
+                        (
+                            round(point["direction"] * 10),
+                            round(point["intensity"] * 1000),
+                            round(point["distance"] * 100),
+                        ),
+                    )
+                    for point in points
+                }
+                
+                now = time.monotonic()
+                if (
+                    now - last_full >= BROADCAST_HEARTBEAT_SEC
+                    or not synced_clients.issuperset(clients_to_send)
+                ):
+                    # Full frame: (re)synchronizes every client
+                    message = _dumps({
+                        "points": points,
+                        "timestamp": timestamp_ms,
+                    })
+                    self._last_sent = current
+                    synced_clients = set(clients_to_send)
+                    last_full = now
+                else:
+                    added = []
+                    updates = []
+                    for point in points:
+                        identity, quantized = current[point["id"]]
+                        previous = self._last_sent.get(point["id"])
+                        if previous is None or previous[0] != identity:
+                            added.append(point)
+                        elif previous[1] != quantized:
+                            updates.append({
+                                "id": point["id"],
+                                "d": point["direction"],
+                                "i": point["intensity"],
+                                "r": point["distance"],
+                            })
+                        else:
+                            # Below display precision: keep the last sent value
+                            # so slow drift still accumulates into an update
+                            continue
+                        self._last_sent[point["id"]] = current[point["id"]]
+                    removed = [track_id for track_id in self._last_sent if track_id not in current]
+                    for track_id in removed:
+                        del self._last_sent[track_id]
+                    
+                    if not (added or updates or removed):
+                        await asyncio.sleep(1.0 / UI_FPS)
+                        continue
+                    message = _dumps({
+                        "added": added,
+                        "updates": updates,
+                        "removed": removed,
+                        "timestamp": timestamp_ms,
+                    })
                 
+                # Broadcast to all connected clients
                 if clients_to_send:
+                    # Send concurrently so one slow client doesn't delay the rest
+                    results = await asyncio.gather(
+                        *(client.send(message) for client in clients_to_send),
+                        return_exceptions=True,
+                    )
                     disconnected = set()
-                    for client in clients_to_send:
-                        try:
-                            await client.send(message)
-                        except Exception as e:
-                            logger.debug(f"Error sending to client: {e}")
+                    for client, result in zip(clients_to_send, results):
+                        if isinstance(result, Exception):
+                            logger.debug(f"Error sending to client: {result}")
                             disconnected.add(client)
                     
                     # Remove disconnected clients
@@ -591,9 +782,9 @@ class ClassifiedDOAVisualizer:
                             theta_deg = track_dict["theta_deg"]
                             confidence = track_dict["confidence"]
                             age = track_dict["age"]
-                            distance_m = track_dict.get("distance_m", None)
-                            spl_db = track_dict.get("spl_db", None)
-                            class_label = track_dict.get("class_label", "unknown")
+                            distance_m = track_dict["distance_m"]
+                            spl_db = track_dict["spl_db"]
+                            class_label = track_dict["class_label"]
                             
                             active_valid_track_ids.add(track_id)
                             
@@ -602,8 +793,7 @@ class ClassifiedDOAVisualizer:
                                 ui_track = self.ui_tracks[track_id]
                                 ui_track.is_active = True
                                 ui_track.hold_frames = 0
-                                ui_track.theta_history.append(theta_deg)
-                                ui_track.confidence_history.append(confidence)
+                                ui_track.push(theta_deg, confidence)
                                 ui_track.age = age
                                 ui_track.class_label = class_label
                                 ui_track.distance_m = distance_m
@@ -642,28 +832,18 @@ class ClassifiedDOAVisualizer:
                         # Prepare track data with UI smoothing
                         track_data = []
                         for ui_track in self.ui_tracks.values():
-                            # Apply UI-level smoothing
-                            if len(ui_track.theta_history) > 0:
-                                smoothed_theta = _compute_circular_mean(list(ui_track.theta_history))
-                            else:
-                                smoothed_theta = ui_track.theta_deg
-                            
-                            if len(ui_track.confidence_history) > 1:
-                                prev_mean = np.mean(list(ui_track.confidence_history)[:-1])
-                                smoothed_conf = 0.6 * ui_track.confidence_history[-1] + 0.4 * prev_mean
-                            elif len(ui_track.confidence_history) == 1:
-                                smoothed_conf = ui_track.confidence_history[0]
-                            else:
-                                smoothed_conf = ui_track.confidence
+                            # UI-level smoothing, kept up to date by ClassifiedTrack.push()
+                            smoothed_theta = ui_track.smoothed_theta
+                            smoothed_conf = ui_track.smoothed_conf
                             
                             if not ui_track.is_active:
                                 fade_factor = ui_track.hold_frames / TRACK_HOLD_FRAMES
                                 smoothed_conf *= fade_factor * 0.5
                             
-                            if np.isnan(smoothed_theta) or np.isnan(smoothed_conf) or np.isinf(smoothed_theta) or np.isinf(smoothed_conf):
+                            if not (math.isfinite(smoothed_theta) and math.isfinite(smoothed_conf)):
                                 continue
                             
-                            smoothed_conf = np.clip(smoothed_conf, 0.0, 1.0)
+                            smoothed_conf = min(max(smoothed_conf, 0.0), 1.0)
                             
                             track_data.append({
                                 "id": ui_track.track_id,
@@ -678,10 +858,7 @@ class ClassifiedDOAVisualizer:
                         
                         # Merge visually close tracks (within same class)
                         if len(track_data) > 1:
-                            prev_len = len(track_data)
                             track_data = _merge_close_tracks(track_data, merge_threshold_deg=40.0)
-                            if len(track_data) < prev_len and len(track_data) > 1:
-                                track_data = _merge_close_tracks(track_data, merge_threshold_deg=40.0)
                         
                         # Filter out invalid tracks
                         valid_tracks = []
@@ -689,7 +866,7 @@ class ClassifiedDOAVisualizer:
                             theta_deg = track["theta_deg"]
                             confidence = track["confidence"]
                             
-                            if np.isnan(theta_deg) or np.isnan(confidence) or np.isinf(theta_deg) or np.isinf(confidence):
+                            if not (math.isfinite(theta_deg) and math.isfinite(confidence)):
                                 continue
                             
                             valid_tracks.append(track)
@@ -119,6 +119,7 @@ def main():
         channels=channels,
         channel_mapping=channel_mapping,
         capture_channels=capture_channels,
+        max_backlog=audio_cfg.get("max_backlog_blocks"),
     )
     stream.start()
 
@@ -186,6 +187,10 @@ def main():
     finally:
         stream.close()
         print("Audio stream closed.")
+        if stream.overruns:
+            print(f"Capture ring overruns (blocks dropped): {stream.overruns}")
+        if stream.dropped:
+            print(f"Backlog drops (oldest blocks skipped): {stream.dropped}")
 
 
 if __name__ == "__main__":
@@ -3,11 +3,15 @@
 Real-time multichannel audio capture for DOA.
 
 Production-ready version:
-- Zero-copy mailbox instead of unbounded queue
+- Preallocated single-producer/single-consumer ring buffer (lock-free)
 - Robust device matching
 - Validates channel count & samplerate
-- Low-jitter callback (no allocations inside)
-- Drop-oldest semantics (real-time safe)
+- Low-jitter callback (no allocations, no locks inside)
+- Raw PortAudio buffers viewed in place (RawInputStream, no ndarray wrapper)
+- Bounded memory: overruns are counted and dropped (real-time safe)
+- Optional bounded latency: consumer drops the oldest backlog beyond
+  `max_backlog` blocks
+- Ring pages pre-faulted and (on Linux) mlock'ed to avoid capture XRuns
 - Safe shutdown & restart
 
 Uses sounddevice for audio input.
@@ -19,7 +23,11 @@ For ReSpeaker Mic Array v3.0:
 
 from __future__ import annotations
 
-import threading
+import ctypes
+import ctypes.util
+import os
+import sys
+import time
 from typing import Optional, List, Tuple, Callable
 
 import numpy as np
@@ -85,6 +93,43 @@ def find_device(device: str | int | None, channels: int) -> int:
     return default_idx
 
 
+# =====================================================================
+# Memory locking
+# =====================================================================
+
+def _lock_pages(arr: np.ndarray) -> bool:
+    """
+    Best-effort mlock() of an array's pages (Linux only).
+
+    Keeps the capture ring resident so the audio callback never takes a
+    page fault. Fails harmlessly (returns False) when RLIMIT_MEMLOCK is
+    too small or the platform has no mlock.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        ret = libc.mlock(ctypes.c_void_p(arr.ctypes.data), ctypes.c_size_t(arr.nbytes))
+    except (OSError, AttributeError) as e:
+        logger.warning("mlock unavailable", extra={"error": str(e)})
+        return False
+    if ret != 0:
+        err = ctypes.get_errno()
+        logger.warning(
+            "mlock failed; capture ring not page-locked",
+            extra={"errno": err, "error": os.strerror(err), "bytes": arr.nbytes},
+        )
+        return False
+    return True
+
+
+# Capture sample formats -> scale to float32 (None = already float32)
+_CAPTURE_SCALE = {
+    "float32": None,
+    "int16": np.float32(1.0 / 32768.0),
+}
+
+
 # =====================================================================
 # AudioStream (Real-time, low-latency)
 # =====================================================================
@@ -96,15 +141,27 @@ class AudioStream:
     Pull model:
         stream.start()
         while True:
-            block = stream.get_latest_block()
+            block = stream.read_block()
             if block is not None:
                 process(block)
 
     Characteristics:
-        • Callback produces frames into a mailbox (no queue growth)
-        • Processing always receives the newest block
-        • No allocations in callback
+        • Callback writes into a preallocated ring of `ring_blocks` slots
+        • Consumers receive zero-copy views into the ring
+        • No allocations or locks in callback
         • Thread-safe shutdown
+
+    Ring protocol (single producer, single consumer):
+        • Only the callback advances `_write_idx`; only the consumer
+          advances `_read_idx`. Plain int rebinding is atomic under the GIL.
+        • A block returned by read_block()/get_latest_block() stays valid
+          until the next read call, which releases its slot.
+        • When the ring is full the incoming block is dropped and
+          `overruns` is incremented; unread slots are never overwritten.
+        • With `max_backlog` set, read_block() skips the oldest unread
+          blocks so at most `max_backlog` are pending, counting them in
+          `dropped`. This bounds capture→DOA latency when processing
+          falls behind. Only the consumer index moves, so SPSC holds.
     """
 
     def __init__(
@@ -115,6 +172,10 @@ class AudioStream:
         channels: int = 4,
         channel_mapping: Optional[List[int]] = None,
         capture_channels: Optional[int] = None,
+        ring_blocks: int = 16,
+        dtype: str = "float32",
+        lock_memory: bool = True,
+        max_backlog: Optional[int] = None,
     ):
         """
         Parameters
@@ -136,11 +197,35 @@ class AudioStream:
         capture_channels : int | None
             Number of channels to capture from device (only needed if channel_mapping is used).
             If None and channel_mapping is provided, will be inferred as max(channel_mapping) + 1.
+        ring_blocks : int
+            Number of block slots in the capture ring buffer.
+            Default: 16
+        dtype : str
+            Device sample format: "float32" or "int16". int16 samples are
+            scaled to float32 in [-1, 1) inside the callback, so consumers
+            always receive float32 blocks.
+            Default: "float32"
+        lock_memory : bool
+            If True, mlock() the capture ring (best effort, Linux only).
+            Default: True
+        max_backlog : int | None
+            Max unread blocks kept by read_block(); older ones are dropped
+            (drop-oldest). None processes every block in order.
+            Default: None
         """
         self.sample_rate = sample_rate
         self.block_size = block_size
         self.channels = channels
         self.channel_mapping = channel_mapping
+
+        if dtype not in _CAPTURE_SCALE:
+            raise ValueError(
+                f"Unsupported capture dtype {dtype!r}; "
+                f"expected one of {sorted(_CAPTURE_SCALE)}"
+            )
+        self.dtype = dtype
+        self._scale = _CAPTURE_SCALE[dtype]
+        self._sample_dtype = np.dtype(dtype)
         
         # Determine capture channel count
         if channel_mapping is not None:
@@ -162,6 +247,7 @@ class AudioStream:
             else:
                 # Infer: need at least max index + 1 channels
                 self.capture_channels = max(channel_mapping) + 1
+            self._mapping_idx = np.asarray(channel_mapping, dtype=np.intp)
         else:
             self.capture_channels = channels
             self.channel_mapping = None
@@ -182,37 +268,42 @@ class AudioStream:
             },
         )
 
-        # Thread-safe mailbox (holds most recent block)
-        self._mailbox = None
-        self._mailbox_lock = threading.Lock()
+        if ring_blocks < 2:
+            raise ValueError(f"ring_blocks must be >= 2, got {ring_blocks}")
 
-        # For performance: prealloc buffers
-        # Capture buffer: holds all captured channels
-        self._cb_buffer_capture = np.zeros((self.capture_channels, block_size), dtype=np.float32)
-        # Output buffer: holds mapped channels (or same as capture if no mapping)
-        if self.channel_mapping is not None:
-            self._cb_buffer = np.zeros((channels, block_size), dtype=np.float32)
-        else:
-            self._cb_buffer = self._cb_buffer_capture
+        # Preallocated SPSC ring: (ring_blocks, channels, block_size)
+        self.ring_blocks = int(ring_blocks)
+        self.ring = np.empty((self.ring_blocks, channels, block_size), dtype=np.float32)
+        self.ring.fill(0.0)  # first-touch every page now, not in the callback
+        self.memory_locked = _lock_pages(self.ring) if lock_memory else False
+        self._write_idx = 0  # advanced by callback only
+        self._read_idx = 0   # advanced by consumer only
+        self._holding = False  # consumer currently holds slot at _read_idx
+        self.overruns = 0
+
+        if max_backlog is not None and max_backlog < 1:
+            raise ValueError(f"max_backlog must be >= 1, got {max_backlog}")
+        self.max_backlog = max_backlog
+        self.dropped = 0  # blocks skipped by the drop-oldest policy
 
         # Timeout tracking
         self._timeouts = 0
         self.max_timeouts = 5
 
-        # sd.InputStream
-        self._stream: Optional[sd.InputStream] = None
+        # sd.RawInputStream
+        self._stream: Optional[sd.RawInputStream] = None
         self._init_stream()
 
     # ------------------------------------------------------------------
 
     def _init_stream(self) -> None:
-        """Construct InputStream."""
-        self._stream = sd.InputStream(
+        """Construct RawInputStream (callback sees the PortAudio buffer itself)."""
+        self._stream = sd.RawInputStream(
             device=self.device_index,
             channels=self.capture_channels,  # Capture all channels
             samplerate=self.sample_rate,
             blocksize=self.block_size,
-            dtype="float32",
+            dtype=self.dtype,
             callback=self._callback,
         )
 
@@ -224,21 +315,42 @@ class AudioStream:
         if status:
             logger.warning("Audio callback status", extra={"status": str(status)})
 
-        # No allocations:
-        # Copy & transpose directly into preallocated buffer
-        # indata: shape (frames, capture_channels)
-        # cb_buffer_capture: shape (capture_channels, frames)
-        self._cb_buffer_capture[:] = indata.T
-
-        # Apply channel mapping if needed
-        if self.channel_mapping is not None:
-            # Select mapped channels: cb_buffer[ch_idx] = cb_buffer_capture[channel_mapping[ch_idx]]
-            for out_idx, in_idx in enumerate(self.channel_mapping):
-                self._cb_buffer[out_idx] = self._cb_buffer_capture[in_idx]
+        w = self._write_idx
+        if w - self._read_idx >= self.ring_blocks:
+            # Ring full: drop incoming block rather than overwrite unread data
+            self.overruns += 1
+            return
+
+        # indata is the raw PortAudio buffer: view it in place, then copy &
+        # transpose straight into the ring slot
+        # data: shape (frames, capture_channels)
+        # slot: shape (channels, frames), always float32
+        data = np.frombuffer(indata, dtype=self._sample_dtype).reshape(
+            frames, self.capture_channels
+        )
+        slot = self.ring[w % self.ring_blocks]
+        if self._scale is None:
+            if self.channel_mapping is not None:
+                if frames == self.block_size:
+                    # Full slot is contiguous: gather all channels in one pass
+                    np.take(data.T, self._mapping_idx, axis=0, out=slot, mode="clip")
+                else:
+                    for out_idx, in_idx in enumerate(self.channel_mapping):
+                        slot[out_idx, :frames] = data[:, in_idx]
+            else:
+                slot[:, :frames] = data.T
+        else:
+            # Integer capture: convert to float32 once, at capture time
+            if self.channel_mapping is not None:
+                for out_idx, in_idx in enumerate(self.channel_mapping):
+                    np.multiply(data[:, in_idx], self._scale,
+                                out=slot[out_idx, :frames], casting="unsafe")
+            else:
+                np.multiply(data.T, self._scale,
+                            out=slot[:, :frames], casting="unsafe")
 
-        # Write newest data to mailbox
-        with self._mailbox_lock:
-            self._mailbox = self._cb_buffer.copy()
+        # Publish slot
+        self._write_idx = w + 1
 
     # ------------------------------------------------------------------
 
@@ -262,35 +374,70 @@ class AudioStream:
 
     # ------------------------------------------------------------------
 
+    def _release(self) -> None:
+        """Return the slot handed out by the previous read to the producer."""
+        if self._holding:
+            self._read_idx += 1
+            self._holding = False
+
+    def available(self) -> int:
+        """Number of captured blocks not yet read."""
+        self._release()
+        return self._write_idx - self._read_idx
+
     def get_latest_block(self) -> Optional[np.ndarray]:
         """
-        Pull latest audio block.
+        Pull the newest audio block, skipping any older unread blocks.
 
         Returns
         -------
         np.ndarray | None
-            Shape: (channels, samples)
+            Shape: (channels, samples). View into the ring buffer, valid
+            until the next read call.
         """
-        with self._mailbox_lock:
-            block = self._mailbox
-            self._mailbox = None  # drop after reading
-            return block
+        self._release()
+        w = self._write_idx
+        if w == self._read_idx:
+            return None
+        self._read_idx = w - 1
+        self._holding = True
+        return self.ring[self._read_idx % self.ring_blocks]
 
     def read_block(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """
-        Pull latest audio block (alias for get_latest_block for compatibility).
-        
-        The timeout parameter is accepted for API compatibility but not used,
-        as the mailbox pattern always returns immediately with the latest block.
+        Pull the next audio block in capture order.
+
+        If more than `max_backlog` blocks are pending, the oldest are
+        skipped first (counted in `dropped`).
 
         Parameters
         ----------
         timeout : float
-            Timeout in seconds (ignored, kept for API compatibility).
+            Maximum time in seconds to wait for a block. The ring is
+            polled, so the callback never has to signal the consumer.
 
         Returns
         -------
         np.ndarray | None
-            Shape: (channels, samples)
+            Shape: (channels, samples). View into the ring buffer, valid
+            until the next read call. None if no block arrived in time.
         """
-        return self.get_latest_block()
\ No newline at end of file
+        self._release()
+        if self._write_idx == self._read_idx and timeout > 0:
+            poll = 0.25 * self.block_size / self.sample_rate
+            deadline = time.perf_counter() + timeout
+            while self._write_idx == self._read_idx:
+                if time.perf_counter() >= deadline:
+                    return None
+                time.sleep(poll)
+        elif self._write_idx == self._read_idx:
+            return None
+
+        if self.max_backlog is not None:
+            skip = self._write_idx - self._read_idx - self.max_backlog
+            if skip > 0:
+                self._read_idx += skip
+                self.dropped += skip
+
+        self._holding = True
+        return self.ring[self._read_idx % self.ring_blocks]
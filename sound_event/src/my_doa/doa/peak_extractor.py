@@ -11,6 +11,7 @@ duplicate detections for the same physical source.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import List
 
 import numpy as np
@@ -20,6 +21,8 @@ from src.my_doa.utils.math_utils import wrap_angle_deg, wrap_angle_deg_0_360, ci
 
 logger = get_logger(__name__)
 
+_get_power = attrgetter("power")
+
 
 # --------------------------------------------------------------------------
 #  Dataclass for DOA candidates
@@ -147,7 +150,8 @@ class PeakExtractor:
             work = self._suppress_neighborhood(work, idx)
 
         # Ensure descending order (just for safety)
-        candidates.sort(key=lambda c: c.power, reverse=True)
+        if len(candidates) > 1:
+            candidates.sort(key=_get_power, reverse=True)
         return candidates
 
     # ------------------------------------------------------------------
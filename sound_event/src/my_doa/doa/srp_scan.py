@@ -6,17 +6,20 @@ SRP-PHAT azimuth scanning using precomputed TDOA lookup tables.
 Given GCC-PHAT correlation functions R_ij[tau] for each microphone pair,
 and a TDOALUT providing fractional delays (in samples) for each azimuth angle,
 this module computes the SRP-PHAT steered response power P(theta).
+
+The TDOA tables are flattened once into structure-of-arrays gather tables
+(n_pairs, n_angles) so that one frame's scan is a single gather over the
+stacked GCC maps followed by a pair-weight matrix-vector product.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
 from src.my_doa.geometry.tdoa_lut import TDOALUT
 from src.my_doa.utils.logger import get_logger
-from src.my_doa.utils.math_utils import linear_interp_1d
 
 logger = get_logger(__name__)
 
@@ -44,6 +47,23 @@ class SRPScanner:
         self.azimuth_grid_deg = tdoa_lut.azimuth_grid_deg
         self.mic_pairs = tdoa_lut.mic_pairs
 
+        # (n_pairs, n_angles) fractional delays, contiguous per pair
+        self.delays = np.ascontiguousarray(
+            np.stack([tdoa_lut.get_delays(i, j) for (i, j) in self.mic_pairs]),
+            dtype=np.float32,
+        )
+        if self.delays.shape[1] != len(self.azimuth_grid_deg):
+            raise ValueError(
+                f"TDOA array length mismatch: {self.delays.shape[1]} != "
+                f"{len(self.azimuth_grid_deg)}"
+            )
+
+        # Gather tables, built lazily once the GCC length is known
+        self._gather_n_delays = -1
+        self._gather = None
+        self._R_stack: Optional[np.ndarray] = None
+        self._unit_weights = np.ones(len(self.mic_pairs), dtype=np.float32)
+
         logger.info(
             "SRPScanner initialized",
             extra={
@@ -54,6 +74,38 @@ class SRPScanner:
 
     # ------------------------------------------------------------------
 
+    def _build_gather(self, n_delays: int) -> None:
+        """
+        Precompute flat interpolation indices and weights into the stacked
+        (n_pairs * n_delays) GCC buffer for every (pair, angle).
+        """
+        n_pairs = len(self.mic_pairs)
+        positions = n_delays // 2 + self.delays
+
+        if np.allclose(self.delays, np.round(self.delays), atol=1e-4):
+            # Integer delay system: plain lookup, no interpolation
+            i0 = np.clip(positions.astype(np.int32), 0, n_delays - 1)
+            i1 = i0
+            frac = np.zeros_like(positions)
+        else:
+            pos = np.clip(positions, 0.0, n_delays - 1)
+            i0 = np.floor(pos).astype(np.int32)
+            i1 = np.minimum(i0 + 1, n_delays - 1)
+            frac = pos - i0
+
+        # int32 flat indices: half the footprint of intp tables
+        offsets = (np.arange(n_pairs, dtype=np.int32) * n_delays)[:, None]
+        self._gather = (
+            np.ascontiguousarray(i0 + offsets, dtype=np.int32),
+            np.ascontiguousarray(i1 + offsets, dtype=np.int32),
+            (1.0 - frac).astype(np.float32),
+            frac.astype(np.float32),
+        )
+        self._R_stack = np.empty((n_pairs, n_delays), dtype=np.float32)
+        self._gather_n_delays = n_delays
+
+    # ------------------------------------------------------------------
+
     def compute_srp(
         self,
         gcc_maps: Dict[Tuple[int, int], np.ndarray],
@@ -67,6 +119,8 @@ class SRPScanner:
         gcc_maps : dict
             Mapping (i, j) -> 1D GCC-PHAT array R_ij[t].
             Zero delay MUST be at index len(R_ij)//2.
+        pair_weights : dict or None
+            Mapping (i, j) -> weight; missing pairs default to 1.0.
 
         Returns
         -------
@@ -78,65 +132,43 @@ class SRPScanner:
             if pair not in gcc_maps:
                 raise KeyError(f"Missing GCC map for mic pair {pair}.")
 
-        first_pair = self.mic_pairs[0]
-        R_first = np.asarray(gcc_maps[first_pair], dtype=np.float32)
-
+        R_first = np.asarray(gcc_maps[self.mic_pairs[0]])
         if R_first.ndim != 1:
             raise ValueError("Each GCC map must be a 1D array.")
 
         n_delays = R_first.shape[0]
-        center_idx = n_delays // 2
-
-        # Clean invalid values in GCC (rare but possible in silent/noisy frames)
-        if not np.isfinite(R_first).all():
-            logger.warning("Non-finite values detected in GCC; normalizing.")
-            for pair in self.mic_pairs:
-                gcc_maps[pair] = np.nan_to_num(
-                    gcc_maps[pair], nan=0.0, posinf=0.0, neginf=0.0
-                )
-
-        n_angles = len(self.azimuth_grid_deg)
-        P = np.zeros(n_angles, dtype=np.float32)
-
-        # Get pair weights (default to 1.0 if not provided)
-        if pair_weights is None:
-            pair_weights = {pair: 1.0 for pair in self.mic_pairs}
-
-        # ---- Main accumulation loop over microphone pairs ----
-        for (i, j) in self.mic_pairs:
-            R_ij = np.asarray(gcc_maps[(i, j)], dtype=np.float32)
+        if n_delays != self._gather_n_delays:
+            self._build_gather(n_delays)
 
+        # ---- Stack GCC maps (SoA: one row per pair) ----
+        R = self._R_stack
+        for p, pair in enumerate(self.mic_pairs):
+            R_ij = gcc_maps[pair]
             if R_ij.shape[0] != n_delays:
                 raise ValueError(
-                    f"GCC map for pair {(i, j)} has inconsistent length "
+                    f"GCC map for pair {pair} has inconsistent length "
                     f"{R_ij.shape[0]} != {n_delays}"
                 )
+            R[p] = R_ij
 
-            # Get pair weight (default to 1.0 if not in dict)
-            w_ij = pair_weights.get((i, j), 1.0)
-
-            # TDOAs for all angles (samples, float)
-            delays = self.tdoa_lut.get_delays(i, j).astype(np.float32)
-
-            if delays.shape[0] != n_angles:
-                raise ValueError(
-                    f"TDOA array length mismatch for pair {(i, j)}: "
-                    f"{delays.shape[0]} != {n_angles}"
-                )
-
-            # Compute GCC index positions
-            positions = center_idx + delays
-
-            # Optimized path if all delays ~ integer (integer delay system)
-            # (not always the case, but cheap to check)
-            if np.allclose(delays, np.round(delays), atol=1e-4):
-                idx = positions.astype(np.int32)
-                idx_clipped = np.clip(idx, 0, n_delays - 1)
-                P += w_ij * R_ij[idx_clipped]
-                continue
-
-            # Fractional interpolation otherwise
-            contrib = linear_interp_1d(R_ij, positions)
-            P += w_ij * contrib.astype(np.float32)
+        # Clean invalid values in GCC (rare but possible in silent/noisy frames)
+        if not np.isfinite(R).all():
+            logger.warning("Non-finite values detected in GCC; normalizing.")
+            np.nan_to_num(R, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
 
-        return P
+        if pair_weights is None:
+            w = self._unit_weights
+        else:
+            w = np.fromiter(
+                (pair_weights.get(pair, 1.0) for pair in self.mic_pairs),
+                dtype=np.float32,
+                count=len(self.mic_pairs),
+            )
+
+        # ---- Gather + interpolate all (pair, angle) cells, then weight ----
+        i0, i1, w0, w1 = self._gather
+        R_flat = R.reshape(-1)
+        contrib = R_flat[i0] * w0
+        contrib += R_flat[i1] * w1
+
+        return w @ contrib
@@ -7,20 +7,24 @@ This module provides:
 - design_highpass_sos()
 - design_bandpass_sos()
 - apply_filter()
-- apply_filter_zero_phase()
+- apply_filter_stateful()
+- make_block_filter()
 
 Notes
 -----
 For DOA estimation:
-    - Zero-phase filtering (filtfilt) is highly recommended.
+    - Zero-phase filtering (filtfilt) is recommended for whole recordings.
+    - Streaming (block-by-block) use should carry filter state across
+      blocks with apply_filter_stateful(); filtfilt on isolated blocks
+      doubles the work and leaves discontinuities at block boundaries.
     - SOS format ensures numerical stability on embedded hardware.
 """
 
 from __future__ import annotations
 
-from typing import Tuple, Literal
+from typing import Callable, Tuple, Literal
 import numpy as np
-from scipy.signal import butter, sosfilt, sosfiltfilt
+from scipy.signal import butter, sosfilt, sosfiltfilt, sosfilt_zi
 
 from src.my_doa.utils.logger import get_logger
 
@@ -116,6 +120,7 @@ def apply_filter(
     sos: np.ndarray,
     audio: np.ndarray,
     mode: Literal["causal", "zero_phase"] = "zero_phase",
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Apply an SOS filter to multichannel audio.
@@ -129,32 +134,138 @@ def apply_filter(
     mode : {"causal", "zero_phase"}
         - "zero_phase": uses filtfilt (recommended for DOA).
         - "causal": uses sosfilt for low-latency applications.
+    out : np.ndarray | None
+        Optional float32 buffer of the same shape as `audio` to write
+        into; reuse it across calls to avoid a per-block allocation.
 
     Returns
     -------
     filtered : np.ndarray
-        Same shape as `audio`.
+        Same shape as `audio` (`out` itself if given).
     """
     audio = np.asarray(audio, dtype=np.float32)
 
     if audio.ndim != 2:
         raise ValueError("audio must have shape (n_mics, n_samples).")
 
-    n_mics, n_samples = audio.shape
-
-    # Vectorized filtering
-    filtered = np.empty_like(audio)
-
+    # Vectorized filtering over all mics at once
     if mode == "zero_phase":
         # No phase distortion—best for DOA
-        for m in range(n_mics):
-            filtered[m] = sosfiltfilt(sos, audio[m])
+        filtered = sosfiltfilt(sos, audio, axis=-1)
     else:
         # Causal, low-latency option
-        for m in range(n_mics):
-            filtered[m] = sosfilt(sos, audio[m])
+        filtered = sosfilt(sos, audio, axis=-1)
+
+    return _to_out(filtered, out)
+
+
+def apply_filter_stateful(
+    sos: np.ndarray,
+    audio: np.ndarray,
+    zi: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Causal SOS filtering of one block, carrying state across calls.
 
-    return filtered
+    Parameters
+    ----------
+    sos : np.ndarray
+        SOS filter coefficients.
+    audio : np.ndarray
+        Audio block (n_mics, n_samples).
+    zi : np.ndarray | None
+        Filter state from the previous call, shape (n_sections, n_mics, 2).
+        If None, the state is initialised to the steady-state response
+        for the first sample of each channel.
+    out : np.ndarray | None
+        Optional float32 buffer of the same shape as `audio` to write
+        into; reuse it across calls to avoid a per-block allocation.
+
+    Returns
+    -------
+    filtered : np.ndarray
+        Same shape as `audio` (`out` itself if given).
+    zf : np.ndarray
+        Final filter state; pass as `zi` for the next block.
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+
+    if audio.ndim != 2:
+        raise ValueError("audio must have shape (n_mics, n_samples).")
+
+    if zi is None:
+        zi = sosfilt_zi(sos).astype(np.float32)[:, None, :] * audio[None, :, :1]
+
+    filtered, zf = sosfilt(sos, audio, axis=-1, zi=zi)
+    return _to_out(filtered, out), zf
+
+
+def _to_out(filtered: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+    """Cast filter output to float32, into `out` when provided."""
+    if out is None:
+        return filtered.astype(np.float32, copy=False)
+    if out.shape != filtered.shape:
+        raise ValueError(
+            f"out has shape {out.shape}, expected {filtered.shape}."
+        )
+    np.copyto(out, filtered, casting="same_kind")
+    return out
+
+
+def make_block_filter(
+    sos: np.ndarray | None,
+    n_channels: int,
+    block_size: int,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build a streaming causal filter specialised for one stream layout.
+
+    Equivalent to calling apply_filter_stateful() per block and carrying
+    `zi`, but validation, state handling and the output buffer are bound
+    once here so the per-block call is just sosfilt + copy.
+
+    Parameters
+    ----------
+    sos : np.ndarray | None
+        SOS filter coefficients. None returns a pass-through.
+    n_channels : int
+        Number of channels per block.
+    block_size : int
+        Nominal samples per block (size of the reused output buffer).
+
+    Returns
+    -------
+    filter_block : callable
+        filter_block(block) -> filtered float32 (n_channels, n_samples).
+        The result is a view into a reused buffer, valid until the next
+        call.
+    """
+    if sos is None:
+        return _passthrough
+
+    sos = np.ascontiguousarray(sos, dtype=np.float64)
+    zi_unit = sosfilt_zi(sos)[:, None, :]  # (n_sections, 1, 2)
+    out = np.empty((int(n_channels), int(block_size)), dtype=np.float32)
+    zi = None
+
+    def filter_block(block: np.ndarray) -> np.ndarray:
+        nonlocal zi
+        if zi is None:
+            zi = zi_unit * block[None, :, :1]
+        filtered, zi = sosfilt(sos, block, axis=-1, zi=zi)
+        n = filtered.shape[1]
+        if n > out.shape[1]:
+            return filtered.astype(np.float32)
+        dst = out[:, :n]
+        np.copyto(dst, filtered, casting="same_kind")
+        return dst
+
+    return filter_block
+
+
+def _passthrough(block: np.ndarray) -> np.ndarray:
+    return block
 
 
 # ============================================================
@@ -7,12 +7,16 @@ Given one STFT frame X[m, k] (m = mic index, k = frequency bin),
 this module computes PHAT-weighted GCC correlation sequences for each
 microphone pair (i, j). Output R_ij[t] is real-valued with zero-delay
 at index N//2 (fftshift format).
+
+compute_gcc_phat_all evaluates every pair in one batched cross-spectrum
+and a single irfft call rather than looping pair by pair.
 """
 
 from __future__ import annotations
 
 from typing import Dict, List, Optional, Tuple
 import numpy as np
+import scipy.fft as sp_fft
 
 from src.my_doa.utils.logger import get_logger
 
@@ -156,21 +160,48 @@ def compute_gcc_phat_all(
         raise ValueError("X must be shaped (n_mics, n_freq_bins).")
 
     n_mics, n_freq_bins = X.shape
-    out: Dict[Tuple[int, int], np.ndarray] = {}
-
     for (i, j) in mic_pairs:
         if not (0 <= i < n_mics and 0 <= j < n_mics):
             raise ValueError(
                 f"Invalid mic index in pair {(i, j)} for {n_mics} microphones."
             )
 
-        R_ij = compute_gcc_phat_for_pair(
-            X_i=X[i],
-            X_j=X[j],
-            band_bins=band_bins,
-            freq_weights=freq_weights,
-            eps=eps,
+    if band_bins is not None:
+        k_min, k_max = band_bins
+        if k_min < 0 or k_max > n_freq_bins or k_min >= k_max:
+            raise ValueError(
+                f"Invalid band_bins={band_bins} for n_freq_bins={n_freq_bins}"
+            )
+    if freq_weights is not None and freq_weights.shape[0] != n_freq_bins:
+        raise ValueError(
+            f"freq_weights length {freq_weights.shape[0]} != n_freq_bins {n_freq_bins}"
         )
-        out[(i, j)] = R_ij
 
-    return out
+    N_time = _infer_time_length(n_freq_bins)
+
+    # ------------------------------------------------------------------ #
+    # Batched cross power over all pairs: (n_pairs, n_freq_bins)
+    # Same math as compute_gcc_phat_for_pair, but one irfft for the sweep.
+    # ------------------------------------------------------------------ #
+    idx_i = np.fromiter((p[0] for p in mic_pairs), dtype=np.intp, count=len(mic_pairs))
+    idx_j = np.fromiter((p[1] for p in mic_pairs), dtype=np.intp, count=len(mic_pairs))
+    C = X[idx_i] * np.conj(X[idx_j])
+
+    if band_bins is not None:
+        C[:, :k_min] = 0.0
+        C[:, k_max:] = 0.0
+
+    C /= np.abs(C) + eps
+
+    if freq_weights is not None:
+        C *= freq_weights.astype(np.float32)
+
+    if not np.isfinite(C).all():
+        logger.warning("Non-finite values in GCC-PHAT; sanitizing.")
+        C = np.nan_to_num(C, nan=0.0, posinf=0.0, neginf=0.0)
+
+    # complex64 in → float32 out (numpy < 2 would upcast to float64)
+    r = sp_fft.irfft(C, n=N_time, axis=-1)
+    R = np.fft.fftshift(r, axes=-1).astype(np.float32, copy=False)
+
+    return {pair: R[p] for p, pair in enumerate(mic_pairs)}
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 import numpy as np
+import scipy.fft as sp_fft
 
 from src.my_doa.utils.logger import get_logger
 
@@ -139,7 +140,8 @@ class STFTProcessor:
         # Initialize buffer
         if self._buffer is None:
             self._num_mics = n_mics
-            self._buffer = block
+            # Own the data: callers may pass views into reusable buffers
+            self._buffer = block.copy()
         else:
             if n_mics != self._num_mics:
                 raise ValueError(
@@ -161,8 +163,8 @@ class STFTProcessor:
             # Apply analysis window
             windowed = frame * self.window[None, :]
 
-            # FFT along time axis
-            X = np.fft.rfft(windowed, n=self.fft_size, axis=1)
+            # FFT along time axis (scipy.fft stays in single precision)
+            X = sp_fft.rfft(windowed, n=self.fft_size, axis=1)
             X = X.astype(np.complex64, copy=False)
 
             frames.append(X)
@@ -205,5 +207,5 @@ def stft_frame(
     window = create_window(window_type, frame_size)
     windowed = frame * window[None, :]
 
-    X = np.fft.rfft(windowed, n=fft_size, axis=1)
+    X = sp_fft.rfft(windowed, n=fft_size, axis=1)
     return X.astype(np.complex64, copy=False)
@@ -21,6 +21,8 @@ Output per STFT frame:
     {
        "frame_index": int,
        "doa_candidates": [...],
+       "candidate_azimuths_deg": np.ndarray,   # SoA view of doa_candidates
+       "candidate_powers": np.ndarray,
        "tracks": [...],
        "P_theta": np.ndarray,
        "noise_spectrum": np.ndarray,
@@ -486,10 +488,21 @@ class DOAPipeline:
             frame_idx=self.frame_index,
         )
 
+        # SoA copies of the candidates for array consumers (argmax etc.)
+        n_cand = len(candidates)
+        cand_az = np.fromiter(
+            (c.azimuth_deg for c in candidates), dtype=np.float64, count=n_cand
+        )
+        cand_power = np.fromiter(
+            (c.power for c in candidates), dtype=np.float64, count=n_cand
+        )
+
         # Prepare result
         result: Dict[str, Any] = {
             "frame_index": self.frame_index,
             "doa_candidates": candidates,
+            "candidate_azimuths_deg": cand_az,
+            "candidate_powers": cand_power,
             "tracks": tracks,
             "P_theta": P_theta,
             "P_raw": P_raw,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import copy
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Tuple
@@ -22,14 +23,31 @@ logger = get_logger(__name__)
 # YAML LOADING HELPERS
 # -------------------------------------------------------------
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime) so edits invalidate."""
+    with open(path_str, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_yaml(path: str | Path) -> Dict[str, Any]:
+    """
+    Load a YAML config file.
+
+    Parsed results are cached in-process keyed by path and modification
+    time; each call returns a private deep copy that callers may mutate.
+    """
+    path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
-    with open(path, "r") as f:
-        data = yaml.safe_load(f)
+    data = _parse_yaml_cached(str(path), path.stat().st_mtime_ns)
     if data is None:
         raise RuntimeError(f"Config file {path} is empty or invalid YAML.")
-    return data
+    return copy.deepcopy(data)
 
 
 def _resolve_path(p: str | Path) -> Path:
@@ -126,7 +144,7 @@ def load_pipeline_config(
     """
 
     pipeline_path = _resolve_path(pipeline_yaml)
-    pipe_raw = _load_yaml(pipeline_path)
+    pipe_raw = load_yaml(pipeline_path)
 
     #
     # Resolve all sub-config paths
@@ -141,11 +159,11 @@ def load_pipeline_config(
     #
     # Load sub-configs
     #
-    audio_cfg = _load_yaml(audio_path)
-    stft_raw = _load_yaml(stft_path)
-    noise_raw = _load_yaml(noise_path)
-    ssl_raw = _load_yaml(ssl_path)
-    tracker_raw = _load_yaml(tracker_path)
+    audio_cfg = load_yaml(audio_path)
+    stft_raw = load_yaml(stft_path)
+    noise_raw = load_yaml(noise_path)
+    ssl_raw = load_yaml(ssl_path)
+    tracker_raw = load_yaml(tracker_path)
 
     # Required keys
     _validate_required_keys(audio_cfg, ["sample_rate"], "audio")
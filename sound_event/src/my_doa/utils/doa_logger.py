@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import math
+import queue
 import threading
 import uuid
 import socket
@@ -25,6 +27,8 @@ class DOALogger:
     Features:
     ---------
     • Thread-safe writes
+    • Non-blocking log_frame(): JSON encoding and disk I/O run on a
+      background writer thread fed by a bounded queue
     • Optional log rotation
     • Metadata header (session id, host, version, timestamp)
     • Automatic directory creation
@@ -45,12 +49,22 @@ class DOALogger:
         }
     """
 
+    # Max records formatted/written per writer wake-up
+    WRITE_BATCH = 64
+    # Max wait in close() for the writer to accept the stop sentinel and
+    # again for it to finish
+    CLOSE_TIMEOUT_SEC = 5.0
+
     def __init__(
         self,
         path: str | Path,
         rotate_bytes: int = 50_000_000,
         console: bool = False,
         metadata: Optional[dict] = None,
+        queue_size: int = 4096,
+        batch_frames: int = 1,
+        buffering: int = 1 << 20,
+        flush_interval_sec: float = 1.0,
     ):
         """
         Parameters
@@ -63,15 +77,40 @@ class DOALogger:
             Print logs to stdout instead of file.
         metadata : dict | None
             Additional metadata to write in header.
+        queue_size : int
+            Max frames pending for the writer thread. Frames are queued
+            in batches of `batch_frames`, so the queue holds
+            ceil(queue_size / batch_frames) batches. When full, new
+            frames are dropped and counted in `dropped` rather than
+            blocking the caller.
+        batch_frames : int
+            Frames staged on the caller side before being handed to the
+            writer as a single queue item (one put per batch). Call
+            flush() or close() to hand over a partial batch.
+        buffering : int
+            Log file buffer size in bytes.
+            Default: 1 MiB
+        flush_interval_sec : float
+            Minimum time between file flushes on the writer thread; the
+            file is always flushed on close(). 0 flushes every batch.
+            Default: 1.0
         """
         self.console = console
         self.rotate_bytes = int(rotate_bytes)
         self.metadata_extra = metadata or {}
 
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()  # rotation re-enters via metadata write
         self._session_id = str(uuid.uuid4())
         self._start_time = time.time()
         self._hostname = socket.gethostname()
+        self._bytes_written = 0
+        self.dropped = 0
+        self.batch_frames = max(1, int(batch_frames))
+        self._staged: list = []
+        self._stage_lock = threading.Lock()
+        self.buffering = int(buffering)
+        self.flush_interval_sec = float(flush_interval_sec)
+        self._next_flush = 0.0
 
         if not self.console:
             self.path = Path(path)
@@ -83,19 +122,31 @@ class DOALogger:
 
         self._write_metadata_record()
 
+        # Background writer
+        # Bounded in frames: each queue item is one batch of staged frames
+        self._q: queue.Queue = queue.Queue(
+            maxsize=max(1, math.ceil(int(queue_size) / self.batch_frames))
+        )
+        self._closed = False
+        self._th = threading.Thread(
+            target=self._drain, name="DOALoggerWriter", daemon=True
+        )
+        self._th.start()
+
     # ---------------------------------------------------------
     # File handling
     # ---------------------------------------------------------
     def _open_log_file(self):
-        self._f = self.path.open("w", encoding="utf-8")
+        self._f = self.path.open("w", encoding="utf-8", buffering=self.buffering)
+        self._bytes_written = 0
         logger.info("DOALogger opened", extra={"path": str(self.path)})
 
     def _rotate_if_needed(self):
         if self.console:
             return  # console mode ignores rotation
 
-        size = self.path.stat().st_size
-        if size < self.rotate_bytes:
+        # Character count tracked on write; avoids a stat() per record
+        if self._bytes_written < self.rotate_bytes:
             return
 
         # Rotate file
@@ -122,7 +173,7 @@ class DOALogger:
             "created_utc": datetime.utcnow().isoformat() + "Z",
             "metadata": self.metadata_extra,
         }
-        self._write_json_line(rec)
+        self._write_lines([json.dumps(rec, ensure_ascii=False)])
 
     # ---------------------------------------------------------
     # Public API: frame logging
@@ -133,32 +184,95 @@ class DOALogger:
         tracks: Iterable[TrackState],
         timestamp_sec: float | None = None,
     ) -> None:
+        """
+        Queue one frame for the writer thread.
+
+        Track state is snapshotted here (tracks are mutated by the
+        tracker afterwards); encoding and I/O happen off this thread.
+        """
         if timestamp_sec is None:
             timestamp_sec = time.time() - self._start_time
 
-        # Build frame dict
-        rec = {
-            "type": "frame",
-            "frame_index": int(frame_index),
-            "timestamp_sec": float(timestamp_sec),
-            "tracks": [self._validate_track_dict(t.as_dict()) for t in tracks],
-        }
+        item = (frame_index, timestamp_sec, [t.as_dict() for t in tracks])
+        with self._stage_lock:
+            self._staged.append(item)
+            if len(self._staged) < self.batch_frames:
+                return
+            batch, self._staged = self._staged, []
+        self._enqueue(batch)
+
+    def flush(self) -> None:
+        """Hand any partially staged batch to the writer thread."""
+        with self._stage_lock:
+            batch, self._staged = self._staged, []
+        if batch:
+            self._enqueue(batch)
+
+    def _enqueue(self, batch: list) -> None:
+        try:
+            self._q.put_nowait(batch)
+        except queue.Full:
+            self.dropped += len(batch)
+
+    # ---------------------------------------------------------
+    # Writer thread
+    # ---------------------------------------------------------
+    def _drain(self) -> None:
+        """Encode and write queued frames in batches until the stop sentinel."""
+        q = self._q
+        batch_max = self.WRITE_BATCH
+        running = True
 
-        self._write_json_line(rec)
+        while running:
+            # Each queue item is a list of staged frames
+            items = q.get()
+            if items is None:
+                break
+            while len(items) < batch_max:
+                try:
+                    more = q.get_nowait()
+                except queue.Empty:
+                    break
+                if more is None:
+                    running = False
+                    break
+                items.extend(more)
+
+            lines = []
+            for frame_index, timestamp_sec, track_dicts in items:
+                try:
+                    rec = {
+                        "type": "frame",
+                        "frame_index": int(frame_index),
+                        "timestamp_sec": float(timestamp_sec),
+                        "tracks": [self._validate_track_dict(d) for d in track_dicts],
+                    }
+                    lines.append(json.dumps(rec, ensure_ascii=False))
+                except Exception as e:
+                    # Never let one bad record kill the writer thread
+                    logger.error("Failed to encode DOA frame", extra={"error": str(e)})
+
+            if lines:
+                self._write_lines(lines)
 
     # ---------------------------------------------------------
     # JSON writing (thread-safe)
     # ---------------------------------------------------------
-    def _write_json_line(self, rec: dict) -> None:
-        line = json.dumps(rec, ensure_ascii=False)
+    def _write_lines(self, lines: list) -> None:
+        """Write pre-encoded JSON lines with one write per batch (time-gated flush)."""
+        chunk = "\n".join(lines) + "\n"
 
         with self._lock:
             if self.console:
-                print(line)
+                print(chunk, end="")
             else:
                 try:
-                    self._f.write(line + "\n")
-                    self._f.flush()
+                    self._f.write(chunk)
+                    self._bytes_written += len(chunk)
+                    now = time.monotonic()
+                    if now >= self._next_flush:
+                        self._f.flush()
+                        self._next_flush = now + self.flush_interval_sec
                 except Exception as e:
                     logger.error("Failed to write DOA log", extra={"error": str(e)})
 
@@ -179,9 +293,45 @@ class DOALogger:
     # Close
     # ---------------------------------------------------------
     def close(self) -> None:
-        with self._lock:
-            try:
-                if self._f:
-                    self._f.close()
-            except Exception:
-                pass
+        """
+        Flush pending frames, stop the writer thread and close the file.
+
+        Never blocks indefinitely: each wait on the writer thread is
+        bounded by CLOSE_TIMEOUT_SEC, and a writer that has died or not
+        drained by then is reported with a warning (a writer stuck
+        mid-write keeps the file). Frames dropped on a full queue are
+        reported as well.
+        """
+        if not self._closed:
+            self._closed = True
+            self.flush()
+            if self._th.is_alive():
+                try:
+                    self._q.put(None, timeout=self.CLOSE_TIMEOUT_SEC)
+                except queue.Full:
+                    pass
+                self._th.join(timeout=self.CLOSE_TIMEOUT_SEC)
+            if self._th.is_alive() or not self._q.empty():
+                # Writer stuck or dead: whatever is still queued is lost
+                logger.warning(
+                    f"DOA log writer did not finish; {self._q.qsize()} queued batch(es) not written",
+                    extra={"pending_items": self._q.qsize(), "path": str(self.path)},
+                )
+            if self.dropped:
+                logger.warning(
+                    f"DOA log incomplete: {self.dropped} frame(s) dropped on a full queue",
+                    extra={"dropped": self.dropped, "path": str(self.path)},
+                )
+
+        # A writer stuck mid-write holds the lock; leave the file to it
+        # rather than hang here
+        if not self._lock.acquire(timeout=self.CLOSE_TIMEOUT_SEC):
+            logger.warning("DOA log file left open: writer is stuck", extra={"path": str(self.path)})
+            return
+        try:
+            if self._f:
+                self._f.close()
+        except Exception:
+            pass
+        finally:
+            self._lock.release()
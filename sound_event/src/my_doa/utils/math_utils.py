@@ -54,6 +54,9 @@ def wrap_angle_deg(angle):
     """
     Wrap to [-180, 180). Works for scalar or array.
     """
+    if isinstance(angle, (float, int)):
+        # Scalar fast path: plain float math, no 0-d array round trip
+        return (angle + 180.0) % 360.0 - 180.0
     a = np.asarray(angle)
     return (a + 180.0) % 360.0 - 180.0
 
@@ -65,6 +68,8 @@ def wrap_angle_deg_0_360(angle):
     Useful for output display when mic positions are defined in 0-360 range
     (e.g., ReSpeaker mics at 45°, 135°, 225°, 315°).
     """
+    if isinstance(angle, (float, int)):
+        return angle % 360.0
     a = np.asarray(angle)
     return a % 360.0
 
@@ -28,15 +28,26 @@ class FpsMeter:
 
     Example:
         fps = fps_meter.tick()
+        fps = fps_meter.tick(count=len(frames))  # once per batch
+
+    With sample_every > 1 the clock is only read once every
+    `sample_every` frames and the estimate is updated from the frame
+    count over that interval; in between, tick() just adds to a counter.
     """
 
-    def __init__(self, smoothing: float = 0.9):
+    def __init__(self, smoothing: float = 0.9, sample_every: int = 1):
         self.smoothing = float(smoothing)
+        self.sample_every = max(1, int(sample_every))
         self.last_t = time.perf_counter()
         self.fps = 0.0
+        self._pending = 0
+
+    def tick(self, count: int = 1) -> float:
+        """Call once per processed frame (or once per batch of `count`)."""
+        self._pending += count
+        if self._pending < self.sample_every:
+            return self.fps
 
-    def tick(self) -> float:
-        """Call once per processed frame."""
         now = time.perf_counter()
         dt = now - self.last_t
         self.last_t = now
@@ -44,8 +55,14 @@ class FpsMeter:
         if dt <= 0:
             return self.fps
 
-        instant = 1.0 / dt
-        self.fps = self.smoothing * self.fps + (1 - self.smoothing) * instant
+        instant = self._pending / dt
+        self._pending = 0
+        if self.fps == 0.0:
+            # Seed with the first measurement; sparse samples would
+            # otherwise take many seconds to climb from 0
+            self.fps = instant
+        else:
+            self.fps = self.smoothing * self.fps + (1 - self.smoothing) * instant
         return self.fps
 
 
@@ -316,6 +316,69 @@ function App() {
                   console.error('  - Error decoding audio data:', error);
                   setAudioData(null);
                 }
+              } else if (message.added || message.updates || message.removed) {
+                // Delta against the last full 'points' message: new/changed points in
+                // 'added', moved points in 'updates' ({id, d, i, r}), dropped ids in 'removed'
+                const added = message.added || [];
+                const updates = message.updates || [];
+                const removedIds = new Set(message.removed || []);
+                const timestamp = message.timestamp || Date.now();
+
+                const newClassColors = {};
+                const addedPoints = added.map((point) => {
+                  const classLabel = point.class_label || 'unknown';
+                  const pointColor = point.color;
+                  newClassColors[classLabel] = pointColor;
+                  newClassColors[classLabel.toLowerCase()] = pointColor;
+                  const capitalized = classLabel.charAt(0).toUpperCase() + classLabel.slice(1).toLowerCase();
+                  newClassColors[capitalized] = pointColor;
+
+                  return {
+                    id: point.id,
+                    direction: point.direction || 0,
+                    distance: point.distance || 0.5,
+                    intensity: point.intensity || 0.5,
+                    timestamp: point.timestamp || timestamp,
+                    classLabel: classLabel,
+                    color: pointColor,
+                    spl_db: point.spl_db || 0,
+                  };
+                });
+                const addedById = new Map(addedPoints.map(p => [p.id, p]));
+                const updatesById = new Map(updates.map(u => [u.id, u]));
+
+                const applyDelta = (point) => {
+                  const update = updatesById.get(point.id);
+                  if (!update) return point;
+                  return {
+                    ...point,
+                    direction: update.d || 0,
+                    intensity: update.i || 0.5,
+                    distance: update.r || 0.5,
+                    timestamp: timestamp,
+                  };
+                };
+
+                if (Object.keys(newClassColors).length > 0) {
+                  setClassColors(prev => ({ ...prev, ...newClassColors }));
+                }
+
+                setPoints(prevPoints => [
+                  ...prevPoints
+                    .filter(p => !removedIds.has(p.id) && !addedById.has(p.id))
+                    .map(applyDelta),
+                  ...addedPoints,
+                ]);
+
+                // Removed points stay in history; added/updated ones refresh it
+                if (addedPoints.length > 0 || updates.length > 0) {
+                  setPointsHistory(prevHistory => {
+                    const existingIds = new Set(prevHistory.map(p => p.id));
+                    const newPoints = addedPoints.filter(p => !existingIds.has(p.id));
+                    const updatedHistory = prevHistory.map(histPoint => addedById.get(histPoint.id) || applyDelta(histPoint));
+                    return [...newPoints, ...updatedHistory].sort((a, b) => new Date(b.timestamp) - new Date(a.timestamp));
+                  });
+                }
               } else {
                 // Unknown message type or legacy format (no type field)
                 console.warn('  - Unknown message type or legacy format:', message);